@@ -57,6 +57,10 @@ except ImportError as e:
     BACKUP_AVAILABLE = False
     URL_TRACKER_AVAILABLE = False
 
+# Stdlib only, so always available
+from article_identity import ensure_article_id
+from atomic_io import atomic_write_json
+
 # Fallback: redefine print to handle Unicode errors
 original_print = print
 def print(*args, **kwargs):
@@ -350,8 +354,7 @@ class EnhancedAISummarizer:
                     'results': {}
                 }
                 
-                with open(live_file, 'w', encoding='utf-8') as f:
-                    json.dump(empty_data, f, indent=2, ensure_ascii=False)
+                atomic_write_json(live_file, empty_data, indent=2, ensure_ascii=False)
                 
                 safe_print(f"🧹 Live file cleared after AI processing")
         except Exception as e:
@@ -726,10 +729,14 @@ Content:
                 elif url:
                     safe_print(f"🔒 Removing duplicate summary for: {url}")
             
+            # 🆔 Stamp stable content-addressed IDs once at ingest (also backfills older records)
+            for summary in deduplicated_summaries:
+                ensure_article_id(summary)
+            
             safe_print(f"\n💾 Saving {len(deduplicated_summaries)} total summaries (added {len(new_summaries)} new, removed {len(all_summaries) - len(deduplicated_summaries)} duplicates)...")
             
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                json.dump(deduplicated_summaries, f, indent=2, ensure_ascii=False)
+            # Readers (API, alert watcher) only ever see the complete old or new file
+            atomic_write_json(self.output_file, deduplicated_summaries, indent=2, ensure_ascii=False)
             
             safe_print(f"✅ Output saved to {self.output_file}")
             safe_print(f"📈 Added {len(new_summaries)} new summaries.")
@@ -1,12 +1,15 @@
 from fastapi import FastAPI, HTTPException, Query, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Match
 from pydantic import BaseModel, HttpUrl, Field
 from typing import Optional, List, Dict, Any, Union
 import json
 import os
 import re
 import urllib.parse
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
 from datetime import datetime, timedelta
 import sys
 import logging
@@ -20,6 +23,7 @@ from urllib.parse import urlencode
 import asyncio
 import httpx
 import time
+import uuid
 import psutil
 from threading import Thread
 from watchdog.observers import Observer
@@ -27,49 +31,109 @@ from watchdog.events import FileSystemEventHandler
 import os
 
 # Redis support for distributed caching (optional)
+# Uses the asyncio client so Redis round-trips never block the event loop; the
+# connection is made lazily on first use (see get_redis) instead of at import time.
 REDIS_AVAILABLE = False
-redis_client = None
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 try:
-    import redis
-    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-    redis_client.ping()  # Test connection
+    import redis.asyncio as aioredis
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
     REDIS_AVAILABLE = True
-    print(f"✅ Redis connected: {REDIS_URL}")
-except Exception as e:
-    print(f"⚠️  Redis not available (using local cache): {e}")
-    REDIS_AVAILABLE = False
+except ImportError as e:
+    aioredis = None
+    print(f"⚠️  Redis client not installed (using local cache): {e}")
+
+# Per-command socket timeout, pool size and how long to stop trying after Redis is unreachable
+REDIS_TIMEOUT = float(os.getenv('REDIS_TIMEOUT', '0.25'))
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '50'))
+REDIS_RETRY_INTERVAL = 15
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.utils.article_identity import article_id as stable_article_id
+from src.utils.atomic_io import read_version, VERSION_SUFFIX
+from src.utils.news_snapshot import (
+    NewsSnapshot, decode_cursor, encode_snapshot, snapshot_revision,
+    encode_version_token, decode_version_token,
+    parse_fields, PROJECTABLE_FIELDS
+)
+from src.utils.shared_snapshot import SharedSnapshotStore
+from src.utils.search_index import FIELDS as SEARCH_FIELDS, SearchIndex, SegmentDocument, encode_segment, segment_version
+from src.utils.corpus_stats import CorpusStats, FileStats
+from src.utils.data_catalog import WatchedCache, scan_directory
+from src.utils.domain_trie import DomainTrie
+from src.utils.alert_store import AlertStore
+from src.utils.compressed_cache import CompressedResponseCache
+from src.utils.fast_json import dumps as fast_dumps, splice_array, JSON_MEDIA_TYPE
+from src.utils.single_flight import SingleFlight
+from src.utils.notification_bus import NotificationBus
+from src.utils.notification_log import NotificationLog, parse_entry_id
+from src.utils.request_metrics import RequestMetrics
+
 # Global cache for news data with file modification tracking
 news_data_cache = {
     "data": None,
     "last_modified": 0,
-    "file_path": None
+    "file_path": None,
+    "snapshot": None  # NewsSnapshot built from "data" (pre-sorted, pre-formatted)
 }
 
+# Encoded snapshots are published once per host to tmpfs and mapped read-only by every worker
+shared_snapshots = SharedSnapshotStore(os.getenv('SNAPSHOT_SHM_DIR') or None)
+SHARED_SNAPSHOT_WAIT_SECONDS = 5.0
+
 # Worker ID for distributed systems
 WORKER_ID = os.getenv('WORKER_ID', '1')
 
 class NewsFileWatcher(FileSystemEventHandler):
     """File watcher to detect changes in news data files"""
     
-    def __init__(self, cache_ref):
+    def __init__(self, cache_ref, on_change=None):
         self.cache_ref = cache_ref
+        self.on_change = on_change
         self.logger = logging.getLogger("news_file_watcher")
     
     def on_modified(self, event):
         if event.is_directory:
             return
+        
+        # Atomic writers publish by renaming a temp file (and then its version sidecar) into place
+        path = getattr(event, "dest_path", "") or event.src_path
+        if not path.endswith(('.json', '.json' + VERSION_SUFFIX)):
+            return
             
         # Check if the modified file is our summarized news file
-        if event.src_path.endswith('summarized_news_hf.json'):
-            self.logger.info(f"🔄 News file updated: {event.src_path}")
-            # Invalidate cache by setting last_modified to 0
+        if os.path.basename(path).startswith('summarized_news_hf.json'):
+            self.logger.info(f"🔄 News file updated: {path}")
+            # Invalidate the raw data cache; the current snapshot keeps serving until the refresher swaps it
             self.cache_ref["last_modified"] = 0
             self.cache_ref["data"] = None
-            self.logger.info("✅ Cache invalidated - fresh data will be loaded on next request")
+        
+        # Runs on the watchdog thread - the refresher does the actual work on the event loop
+        if self.on_change is not None:
+            self.on_change()
+    
+    on_created = on_modified
+    on_moved = on_modified
+
+class CatalogWatcher(FileSystemEventHandler):
+    """Invalidates a cached directory view when matching files are created, changed, moved or deleted"""
+    
+    CHANGE_EVENTS = {"created", "deleted", "modified", "moved"}
+    
+    def __init__(self, cache, suffixes, on_change=None):
+        self.cache = cache
+        self.suffixes = suffixes
+        self.on_change = on_change
+    
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in self.CHANGE_EVENTS:
+            return
+        paths = (event.src_path, getattr(event, "dest_path", "") or "")
+        if any(path.endswith(self.suffixes) for path in paths):
+            self.cache.invalidate()
+            if self.on_change is not None:
+                self.on_change()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -94,31 +158,54 @@ file_observer = None
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize file watcher for real-time data updates (optional)"""
+    """Start the background snapshot refresher and the file watcher for real-time data updates (optional)"""
     global file_observer
     
+    start_data_refresher()
+    await notification_bus.start()
+    
     try:
         # Try to set up file watcher for real-time updates
-        event_handler = NewsFileWatcher(news_data_cache)
+        event_handler = NewsFileWatcher(news_data_cache, on_change=request_data_refresh)
         file_observer = Observer()
         
         # Watch the data directory for changes to summarized_news_hf.json
         watch_directory = DATA_DIR
         file_observer.schedule(event_handler, watch_directory, recursive=False)
+        file_observer.schedule(CatalogWatcher(dynamic_api.data_files, ('.json', '.json' + VERSION_SUFFIX)), watch_directory, recursive=False)
         file_observer.start()
+        dynamic_api.data_files.set_watched(True)
         
         logger.info(f"🔍 File watcher started - monitoring {watch_directory} for news updates")
         logger.info("🚀 Real-time news data updates enabled!")
         
     except Exception as e:
         logger.warning(f"File watcher not available (using fallback mode): {e}")
-        logger.info("📊 Using file modification time checking for updates")
+        logger.info(f"📊 Using file modification time checking every {DATA_POLL_INTERVAL}s for updates")
+    
+    if file_observer is not None and file_observer.is_alive():
+        try:
+            # Source configuration: re-parsed only when url_fetch.txt changes; source ids are
+            # stamped into the snapshot and search segments, so the refresher rebuilds them
+            file_observer.schedule(CatalogWatcher(dynamic_api.url_sources, (os.path.basename(dynamic_api.url_config_file),), on_change=request_data_refresh), CONFIG_DIR, recursive=False)
+            dynamic_api.url_sources.set_watched(True)
+            logger.info(f"🔍 Config watcher started - monitoring {CONFIG_DIR} for source changes")
+        except Exception as e:
+            logger.warning(f"Config watcher not available (checking every {CATALOG_POLL_INTERVAL}s): {e}")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Cleanup file watcher on shutdown"""
+    """Cleanup refresher, file watcher and Redis pool on shutdown"""
     global file_observer
     
+    await stop_data_refresher()
+    await notification_bus.stop()
+    
+    try:
+        await close_redis()
+    except Exception as e:
+        logger.warning(f"Error closing Redis client: {e}")
+    
     if file_observer:
         try:
             file_observer.stop()
@@ -155,15 +242,36 @@ ALERTS_DIR = os.path.join(DATA_DIR, "alerts")
 # Ensure alerts directory exists
 os.makedirs(ALERTS_DIR, exist_ok=True)
 
-# In-memory notifications queue for frontend polling
-notifications_queue = []
+# Shared with the file watcher process; imports alerts_log.json on first use
+alert_store = AlertStore(os.path.join(ALERTS_DIR, "alerts.db"))
+
+# Shared notification log (Redis stream, local ring buffer fallback); clients poll with ?after=<id>
+notification_log = NotificationLog(
+    get_redis=lambda: get_redis(),
+    on_error=lambda error, operation: redis_error(error, operation),
+    maxlen=500
+)
+
+# Push channel: /api/notify publishes once, every SSE client on every worker receives it
+notification_bus = NotificationBus(
+    REDIS_URL if REDIS_AVAILABLE else None,
+    timeout=REDIS_TIMEOUT,
+    retry_interval=REDIS_RETRY_INTERVAL
+)
+SSE_KEEPALIVE_SECONDS = 15
+SSE_RETRY_MS = 5000
+
+# Long-lived or per-client endpoints the Redis response cache must never buffer or share
+NO_RESPONSE_CACHE_PREFIXES = ("/api/notifications",)
 
 # Metrics tracking
 start_time = time.time()
 request_count = 0
 error_count = 0
 request_duration_sum = 0.0
+# Keyed by "METHOD route-template", so the number of entries is bounded by the route table
 endpoint_stats = {}
+request_metrics = RequestMetrics()
 
 # 🚀 SPEED OPTIMIZATION: Response caching middleware
 @app.middleware("http")
@@ -171,11 +279,21 @@ async def response_cache_middleware(request: Request, call_next):
     """Cache complete responses for GET requests to achieve sub-100ms response times"""
     start_time = time.time()
     
+    # Notification polls and SSE streams are never cached - don't spend a Redis round-trip on them
+    if request.url.path.startswith(NO_RESPONSE_CACHE_PREFIXES):
+        return await call_next(request)
+    
+    # Key on the data version (set by conditional_get_middleware) so a stale body is never
+    # served under a fresh ETag after the underlying data file changes
+    data_version = getattr(request.state, "data_version", "")
+    cache_key = f"cyberx:response_cache:{data_version}:{request.url.path}:{request.url.query}"
+    
+    redis = await get_redis() if request.method == "GET" else None
+    
     # Check for cached response for GET requests
-    if request.method == "GET" and REDIS_AVAILABLE:
-        cache_key = f"cyberx:response_cache:{request.url.path}:{request.url.query}"
+    if redis is not None:
         try:
-            cached_response = redis_client.get(cache_key)
+            cached_response = await redis.get(cache_key)
             if cached_response:
                 response_data = json.loads(cached_response)
                 process_time = time.time() - start_time
@@ -190,15 +308,16 @@ async def response_cache_middleware(request: Request, call_next):
                 response.headers["X-Cache-Source"] = "response_middleware"
                 return response
         except Exception as e:
-            logger.debug(f"Response cache read error: {e}")
+            redis_error(e, "response cache read")
     
     # Process request normally
     response = await call_next(request)
     process_time = time.time() - start_time
     
-    # Cache successful GET responses for API endpoints
-    if (request.method == "GET" and response.status_code == 200 and 
-        REDIS_AVAILABLE and "/api/" in request.url.path):
+    # Cache successful GET responses for API endpoints (streamed exports are never buffered)
+    if (redis is not None and response.status_code == 200 and 
+        "/api/" in request.url.path and EXPORT_PARAM not in request.query_params and
+        await rendered_version_current(request)):
         try:
             # Read response body
             response_body = b""
@@ -213,8 +332,7 @@ async def response_cache_middleware(request: Request, call_next):
             }
             
             # Store in cache with 90-second TTL for ultra-fast responses
-            cache_key = f"cyberx:response_cache:{request.url.path}:{request.url.query}"
-            redis_client.setex(cache_key, 90, json.dumps(cache_data))
+            await redis.setex(cache_key, 90, json.dumps(cache_data))
             
             # Recreate response with cached body
             response = Response(
@@ -223,37 +341,384 @@ async def response_cache_middleware(request: Request, call_next):
                 headers=dict(response.headers)
             )
         except Exception as e:
-            logger.debug(f"Response cache write error: {e}")
+            redis_error(e, "response cache write")
     
     response.headers["X-Process-Time"] = str(process_time)
     response.headers["X-Cache-Hit"] = "false"
     
     return response
 
-# Middleware for metrics collection
+# 🚀 SPEED OPTIMIZATION: Precompressed bodies for hot endpoints, one set per data version
+PRECOMPRESSED_PATHS = {"/api/news", "/api/news/sources", "/api/stats"}
+precompressed_cache = CompressedResponseCache(max_entries=512)
+
+def precompressed_cache_key(path, query_items):
+    return f"{path}?{urlencode(sorted(query_items))}"
+
 @app.middleware("http")
-async def metrics_middleware(request: Request, call_next):
-    global request_count, error_count, request_duration_sum, endpoint_stats
+async def precompressed_cache_middleware(request: Request, call_next):
+    """Serve hot responses from gzip/br encodings built once per data version"""
+    data_version = getattr(request.state, "data_version", None)
+    if request.method != "GET" or data_version is None or request.url.path not in PRECOMPRESSED_PATHS:
+        return await call_next(request)
     
-    start_time_req = time.time()
-    request_count += 1
+    # Only the parameterless and warmed variants: cursor=/fields= pages would miss every time and evict them
+    cache_key = precompressed_cache_key(request.url.path, request.query_params.multi_items())
+    if request.query_params and cache_key not in WARM_CACHE_KEYS:
+        return await call_next(request)
+    entry = precompressed_cache.get(data_version, cache_key)
     
-    # Track endpoint usage
-    endpoint = f"{request.method} {request.url.path}"
-    if endpoint not in endpoint_stats:
-        endpoint_stats[endpoint] = {"count": 0, "errors": 0}
-    endpoint_stats[endpoint]["count"] += 1
+    if entry is None:
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        
+        body = b""
+        async for chunk in response.body_iterator:
+            body += chunk
+        if not await rendered_version_current(request):
+            # Rendered across a data swap - pass it through without caching it under either version
+            return Response(content=body, status_code=response.status_code, headers=dict(response.headers))
+        # gzip/br of a full listing takes milliseconds - keep it off the event loop
+        entry = await asyncio.to_thread(
+            precompressed_cache.put,
+            data_version, cache_key, body,
+            media_type=response.headers.get("content-type", "application/json"),
+            # Per-request diagnostics (X-Process-Time, X-Cache-Hit) must not be frozen into the cache
+            headers={k: v for k, v in response.headers.items() if not k.lower().startswith("x-")}
+        )
+        cache_status = "miss"
+    else:
+        cache_status = "hit"
+    
+    encoding, content = entry.negotiate(request.headers.get("accept-encoding"))
+    response = Response(content=content, media_type=entry.media_type, headers=entry.headers)
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding != "identity":
+        response.headers["Content-Encoding"] = encoding
+    response.headers["X-Precompressed-Cache"] = cache_status
+    return response
+
+# =====================================
+# ASYNC REDIS CLIENT
+# =====================================
+
+redis_state = {
+    "client": None,
+    "down_until": 0.0
+}
+
+# Concurrent first calls share one connection attempt instead of each creating a pool
+redis_connects = SingleFlight()
+
+async def get_redis():
+    """
+    Return the pooled asyncio Redis client, connecting on first use.
+    Returns None when Redis is not installed or was recently unreachable.
+    """
+    if not REDIS_AVAILABLE or time.time() < redis_state["down_until"]:
+        return None
+    
+    client = redis_state["client"]
+    if client is None:
+        client = await redis_connects.do("connect", _connect_redis)
+    return client
+
+async def _connect_redis():
+    pool = aioredis.ConnectionPool.from_url(
+        REDIS_URL,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT
+    )
+    client = aioredis.Redis(connection_pool=pool)
+    try:
+        await client.ping()
+    except Exception as e:
+        await pool.disconnect()
+        redis_error(e)
+        return None
+    redis_state["client"] = client
+    logger.info(f"✅ Redis connected: {REDIS_URL} (Worker {WORKER_ID})")
+    return client
+
+def redis_error(error, operation="operation"):
+    """Log a Redis failure; connection-level failures pause Redis use for a short interval"""
+    if REDIS_AVAILABLE and isinstance(error, (RedisConnectionError, RedisTimeoutError, OSError)):
+        redis_state["down_until"] = time.time() + REDIS_RETRY_INTERVAL
+        logger.warning(f"Redis unreachable during {operation}, using local cache for {REDIS_RETRY_INTERVAL}s: {error}")
+    else:
+        logger.warning(f"Redis {operation} error: {error}")
+
+async def close_redis():
+    client = redis_state["client"]
+    redis_state["client"] = None
+    if client is not None:
+        close = getattr(client, "aclose", None) or client.close
+        await close()
+
+# =====================================
+# CONDITIONAL GET (ETag / Last-Modified)
+# =====================================
+
+# Read endpoints whose body depends only on summarized_news_hf.json
+SNAPSHOT_VALIDATED_PATHS = {"/api/news", "/api/news/changes"}
+SNAPSHOT_VALIDATED_PREFIXES = ("/api/article/",)
+
+# Read endpoints derived from every data file plus the source configuration
+CORPUS_VALIDATED_PATHS = {"/", "/api/news/sources", "/api/stats", "/api/config"}
+
+# Answered from the installed search index segments
+SEARCH_VALIDATED_PATHS = {"/api/news/search"}
+SEARCH_VALIDATED_PREFIXES = ("/api/news/source/",)
+
+# Last computed validator per kind, keyed by the state it was derived from
+validator_memo = {}
+
+def _file_validator(file_path):
+    """(version token, mtime) for a single file, or None if it does not exist"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}", st.st_mtime
+
+def _state_validator(kind, state, last_modified):
+    """(digest of a corpus/search state, last-modified), recomputed only when the state changes"""
+    memo = validator_memo.get(kind)
+    if memo is not None and memo[0] == state:
+        return memo[1]
+    versions, config_mtime = state
+    parts = [f"{name}:{version!r}" for name, version in versions]
+    parts.append(f"url_fetch.txt:{config_mtime!r}")
+    validator = (f"{kind}-" + hashlib.blake2b("|".join(parts).encode(), digest_size=12).hexdigest(), last_modified())
+    validator_memo[kind] = (state, validator)
+    return validator
+
+def _installed_last_modified(kind):
+    if kind == "search":
+        return search_index.last_modified
+    last_modified = max((stats.modified.timestamp() for stats in corpus_stats.files.values()), default=0.0)
+    return max(last_modified, dynamic_api._last_config_check or 0.0)
+
+def _expected_state(kind):
+    """
+    (state, last-modified) the handler will install for a corpus/search response, from file
+    metadata only: the cached data-file listing and the version sidecars. Nothing is parsed.
+    """
+    sources_key = current_sources_key()
+    versions = {}
+    last_modified = dynamic_api._last_config_check or 0.0
+    for filename, info in dynamic_api.get_data_files().items():
+        if kind == "search" and info['type'] not in SEARCH_FILE_PRIORITY:
+            continue
+        version = data_file_version(info['path'])
+        if filename == "summarized_news_hf.json":
+            # Both views follow the snapshot's revision for this file
+            revision = (version, sources_key)
+            versions[filename] = revision if kind == "search" else ("snapshot", revision)
+        else:
+            versions[filename] = (version, info['size'], sources_key)
+        last_modified = max(last_modified, info['modified'].timestamp())
+    return (tuple(sorted(versions.items())), dynamic_api._last_config_check), last_modified
+
+def _validated_kind(path):
+    if path in SNAPSHOT_VALIDATED_PATHS or path.startswith(SNAPSHOT_VALIDATED_PREFIXES):
+        return "snapshot"
+    if path in CORPUS_VALIDATED_PATHS:
+        return "corpus"
+    if path in SEARCH_VALIDATED_PATHS or path.startswith(SEARCH_VALIDATED_PREFIXES):
+        return "search"
+    return None
+
+def _installed_state(kind):
+    """Identity of the in-memory state a response of `kind` is rendered from - no I/O"""
+    if kind == "snapshot":
+        snapshot = news_data_cache["snapshot"]
+        return snapshot.revision if snapshot is not None else None
+    if kind == "corpus":
+        versions = [(name, stats.version) for name, stats in corpus_stats.files.items()]
+        versions.extend((name, "error") for name in corpus_stats.errors)
+    else:
+        versions = search_index.versions().items()
+    return (tuple(sorted(versions)), dynamic_api._last_config_check)
+
+async def _compute_data_validator(kind):
+    """(validator, state it was derived from) for a validated kind"""
+    if kind == "snapshot":
+        # With the refresher running, responses come from the installed snapshot - validate against it, not the file.
+        # The version is opaque (a sidecar counter or an mtime), so Last-Modified uses the build time instead.
+        # Bodies embed source ids, so the source configuration is part of it
+        snapshot = news_data_cache["snapshot"]
+        if snapshot is not None and data_refresher_running():
+            return (f"snapshot-{snapshot.version!r}-{snapshot.sources_key}", snapshot.built_at), snapshot.revision
+        file_path = os.path.join(DATA_DIR, "summarized_news_hf.json")
+        file_validator = _file_validator(file_path)
+        if file_validator is None:
+            return None, None
+        # The handler builds the snapshot for this revision, so the token matches the refresher's
+        revision = (data_file_version(file_path), current_sources_key())
+        return (f"snapshot-{revision[0]!r}-{revision[1]}", file_validator[1]), revision
+    
+    # The refresher keeps corpus stats and search segments installed - validate against those
+    installed = corpus_stats.files if kind == "corpus" else search_index.segment_names()
+    if data_refresher_running() and installed:
+        dynamic_api.get_url_sources()
+        state = _installed_state(kind)
+        return _state_validator(kind, state, lambda: _installed_last_modified(kind)), state
+    
+    # Otherwise the handler syncs on a 200 only; a revalidation is answered from file metadata
+    state, last_modified = _expected_state(kind)
+    return _state_validator(kind, state, lambda: last_modified), state
+
+async def get_data_validator(request: Request):
+    """
+    Return (version token, last-modified timestamp) for the data behind a read endpoint,
+    or None if the endpoint is not validated. Never loads data on the request path while
+    the refresher runs; the token identifies the state the handler will render from.
+    Computed once per request - later middleware reuse request.state.validation.
+    """
+    validation = getattr(request.state, "validation", None)
+    if validation is None:
+        kind = _validated_kind(request.url.path)
+        validator, state = await _compute_data_validator(kind) if kind else (None, None)
+        validation = request.state.validation = (validator, kind, state)
+    return validation[0]
+
+async def rendered_version_current(request: Request):
+    """
+    True if the data a validated response was rendered from is still the version its ETag
+    was computed for. False means a swap happened mid-request, so the body must not be
+    cached or labelled with that ETag. Compares in-memory state only - no stat or sync.
+    """
+    validator, kind, state = getattr(request.state, "validation", (None, None, None))
+    if validator is None:
+        return True
+    return _installed_state(kind) == state
+
+def make_etag(data_version, request: Request):
+    """Strong ETag from the data version plus the path and (order-insensitive) query parameters"""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    digest = hashlib.blake2b(f"{data_version}|{request.url.path}|{query}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def encoded_etag(etag, encoding):
+    """Each content coding is its own representation, so gzip/br bodies get "<digest>-gzip" / "<digest>-br" """
+    if not encoding or encoding == "identity":
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def is_not_modified(request: Request, etag, last_modified):
+    """
+    Evaluate If-None-Match (preferred) or If-Modified-Since against the current validators.
+    Returns the ETag to send with the 304 (the representation the client holds), or None.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        if "*" in candidates:
+            return etag
+        representations = {etag} | {encoded_etag(etag, coding) for coding in ("gzip", "br")}
+        for tag in candidates:
+            # If-None-Match uses weak comparison, so W/"x" matches "x"
+            if tag.removeprefix("W/") in representations:
+                return tag.removeprefix("W/")
+        return None
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return None
+        # HTTP dates have one-second resolution
+        return etag if int(last_modified) <= since else None
+    
+    return None
+
+@app.middleware("http")
+async def conditional_get_middleware(request: Request, call_next):
+    """Answer If-None-Match / If-Modified-Since with 304 before any data is loaded"""
+    if request.method not in ("GET", "HEAD"):
+        return await call_next(request)
+    
+    validator = await get_data_validator(request)
+    if validator is None:
+        return await call_next(request)
+    
+    data_version, last_modified = validator
+    request.state.data_version = data_version
+    etag = make_etag(data_version, request)
+    validator_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": "no-cache"
+    }
+    
+    not_modified_etag = is_not_modified(request, etag, last_modified)
+    if not_modified_etag:
+        return Response(status_code=304, headers={**validator_headers, "ETag": not_modified_etag})
     
     response = await call_next(request)
+    if response.status_code == 200:
+        if await rendered_version_current(request):
+            response.headers.update(validator_headers)
+            response.headers["ETag"] = encoded_etag(etag, response.headers.get("content-encoding"))
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+    return response
+
+def route_template(scope):
+    """
+    Path template of the route that serves this request (e.g. /api/article/{encoded_url}).
+    Responses answered by a middleware before routing (304s, cache hits) never set
+    scope["route"], so the template is resolved against the router the same way routing would.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return getattr(route, "path", "unmatched")
+    partial = None
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+        if match == Match.PARTIAL and partial is None:
+            partial = route
+    return getattr(partial, "path", "unmatched")
+
+# Middleware for metrics collection
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    global request_count, error_count, request_duration_sum, endpoint_stats
     
-    # Track errors
-    if response.status_code >= 400:
-        error_count += 1
-        endpoint_stats[endpoint]["errors"] += 1
+    if getattr(request.state, "cache_warmup", False):
+        return await call_next(request)
     
-    # Track duration
-    duration = time.time() - start_time_req
-    request_duration_sum += duration
+    start_time_req = time.perf_counter()
+    request_count += 1
+    
+    request_metrics.started(request.method)
+    status_code, size = 500, None
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        content_length = response.headers.get("content-length")
+        size = int(content_length) if content_length else None
+    finally:
+        # Track endpoint usage, errors and duration (an exception counts as a 500).
+        # The router has recorded the matched route in the scope by now
+        duration = time.perf_counter() - start_time_req
+        request_duration_sum += duration
+        route = route_template(request.scope)
+        endpoint = f"{request.method} {route}"
+        if endpoint not in endpoint_stats:
+            endpoint_stats[endpoint] = {"count": 0, "errors": 0}
+        endpoint_stats[endpoint]["count"] += 1
+        if status_code >= 400:
+            error_count += 1
+            endpoint_stats[endpoint]["errors"] += 1
+        request_metrics.finished(request.method, route, status_code, duration, size)
     
     return response
 
@@ -291,12 +756,17 @@ class NewsResponse(BaseModel):
     articles: List[ArticleResponse]
     sources_available: int
     data_sources_used: Optional[List[str]] = None
+    next_cursor: Optional[str] = None
+    version: Optional[str] = None
 
 class SearchResponse(BaseModel):
     status: str
     query: str
     source_filter: Optional[str] = None
     totalResults: int
+    page: int = 1
+    limit: int
+    has_more: bool = False
     articles: List[ArticleResponse]
     sources_searched: int
 
@@ -320,20 +790,146 @@ class AlertMarkReadRequest(BaseModel):
 class ExtractionRequest(BaseModel):
     url: HttpUrl
 
+def fast_json_response(payload, articles=None, status_code=200):
+    """
+    Encode trusted, already-normalized data straight to JSON bytes, bypassing Pydantic.
+    `articles` may be a list of pre-encoded article fragments to splice in as payload["articles"].
+    """
+    if articles is not None:
+        content = splice_array(payload, "articles", articles)
+    else:
+        content = fast_dumps(payload)
+    return Response(content=content, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+FIELDS_QUERY_DESCRIPTION = f"Comma-separated fields to return (any of: {', '.join(PROJECTABLE_FIELDS)})"
+
+def parse_fields_param(fields):
+    """Validate a ?fields= sparse fieldset; None keeps each endpoint's default shape"""
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status": "error",
+                "message": "Invalid fields parameter",
+                "error": str(e),
+                "allowed_fields": list(PROJECTABLE_FIELDS)
+            }
+        )
+
+# Streamed exports: ?export=ndjson|json yields every result in batches instead of one page
+EXPORT_PARAM = "export"
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "json": JSON_MEDIA_TYPE}
+EXPORT_BATCH_SIZE = 200
+
+def export_response(export_format, items, encode_batch, filename):
+    """
+    Stream `items` as NDJSON or as one JSON array. Records are encoded one batch at a
+    time as the client reads, so peak memory per request is one batch, not the result set.
+    """
+    async def body():
+        if export_format == "json":
+            yield b"["
+        for start in range(0, len(items), EXPORT_BATCH_SIZE):
+            fragments = encode_batch(items[start:start + EXPORT_BATCH_SIZE])
+            if export_format == "ndjson":
+                yield b"\n".join(fragments) + b"\n"
+            else:
+                yield (b"," if start else b"") + b",".join(fragments)
+            # Let other requests run between batches of a large export
+            await asyncio.sleep(0)
+        if export_format == "json":
+            yield b"]"
+    
+    extension = "ndjson" if export_format == "ndjson" else "json"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'}
+    )
+
 # =====================================
 # REAL-TIME DATA CACHE MANAGEMENT
 # =====================================
 
-def get_fresh_news_data():
+NEWS_CACHE_KEY = "cyberx:news_data"
+NEWS_MTIME_KEY = "cyberx:news_mtime"
+
+# Cross-worker reload lease: one process rebuilds after a summarizer run, the rest wait or serve the old snapshot
+NEWS_RELOAD_LEASE_KEY = "cyberx:news_reload_lease"
+NEWS_RELOAD_LEASE_MS = 30000
+NEWS_RELOAD_WAIT_SECONDS = 5.0
+
+# Compare-and-delete so a worker never releases a lease that expired and was re-acquired by another
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Coalesces concurrent snapshot rebuilds inside this worker (keyed by file version)
+snapshot_reloads = SingleFlight()
+
+async def _read_redis_news_cache(redis, current_modified, summarized_file):
+    """Return news data from Redis if it is at least as new as the file, else None"""
+    async with redis.pipeline(transaction=False) as pipe:
+        cached_mtime, cached_data = await pipe.get(NEWS_MTIME_KEY).get(NEWS_CACHE_KEY).execute()
+    if not (cached_mtime and cached_data and float(cached_mtime) >= current_modified):
+        return None
+    
+    data = await asyncio.to_thread(json.loads, cached_data)
+    news_data_cache["data"] = data
+    news_data_cache["last_modified"] = float(cached_mtime)
+    news_data_cache["file_path"] = summarized_file
+    return data
+
+async def acquire_reload_lease(redis):
+    """Try to become the worker that reloads the news file; returns a lease token or None"""
+    token = f"{WORKER_ID}:{os.getpid()}:{uuid.uuid4().hex}"
+    acquired = await redis.set(NEWS_RELOAD_LEASE_KEY, token, nx=True, px=NEWS_RELOAD_LEASE_MS)
+    return token if acquired else None
+
+async def release_reload_lease(redis, token):
+    try:
+        await redis.eval(_RELEASE_LEASE_SCRIPT, 1, NEWS_RELOAD_LEASE_KEY, token)
+    except Exception as e:
+        redis_error(e, "lease release")
+
+def _read_json_file(file_path):
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def data_file_version(file_path):
+    """
+    Version of the last completed write of a data file: the atomic writer's version
+    sidecar, or the mtime for files still written in place. 0 if the file does not exist.
+    """
+    version = read_version(file_path)
+    if version is not None:
+        return version
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return 0
+
+def current_news_version():
+    return data_file_version(os.path.join(DATA_DIR, "summarized_news_hf.json"))
+
+async def get_fresh_news_data(wait_for_leader=True):
     """
     Get fresh news data with intelligent caching.
     Supports both local cache and distributed Redis cache for scalability.
+    
+    When another worker holds the reload lease, waits for it to publish to Redis
+    (or, with wait_for_leader=False, returns None so the caller keeps serving its
+    previous snapshot instead of joining the thundering herd). Also returns None when
+    the file is only partially written, so a torn read never replaces good data.
     """
     global news_data_cache
     
     summarized_file = os.path.join(DATA_DIR, "summarized_news_hf.json")
-    cache_key = "cyberx:news_data"
-    cache_mtime_key = "cyberx:news_mtime"
     
     try:
         if not os.path.exists(summarized_file):
@@ -342,71 +938,199 @@ def get_fresh_news_data():
             
         current_modified = os.path.getmtime(summarized_file)
         
-        # Check Redis cache first (if available)
-        if REDIS_AVAILABLE:
-            try:
-                cached_mtime = redis_client.get(cache_mtime_key)
-                if cached_mtime and float(cached_mtime) >= current_modified:
-                    cached_data = redis_client.get(cache_key)
-                    if cached_data:
-                        data = json.loads(cached_data)
-                        logger.info(f"🚀 Loaded {len(data)} articles from Redis cache (Worker {WORKER_ID})")
-                        return data
-            except Exception as e:
-                logger.warning(f"Redis cache read error: {e}")
-        
-        # Check local cache
+        # Check local cache first - it costs nothing
         if (news_data_cache["data"] is not None and 
             news_data_cache["last_modified"] >= current_modified):
             logger.info(f"📦 Loaded {len(news_data_cache['data'])} articles from local cache (Worker {WORKER_ID})")
             return news_data_cache["data"]
         
-        # Load fresh data from file
-        logger.info(f"🔄 Loading fresh news data from {summarized_file} (Worker {WORKER_ID})")
-        
-        with open(summarized_file, "r", encoding="utf-8") as f:
-            fresh_data = json.load(f)
-        
-        # Update local cache
-        news_data_cache["data"] = fresh_data
-        news_data_cache["last_modified"] = current_modified
-        news_data_cache["file_path"] = summarized_file
-        
-        # Update Redis cache (if available)
-        if REDIS_AVAILABLE and fresh_data:
+        # Then the shared Redis cache - mtime and data in a single round-trip
+        redis = await get_redis()
+        lease_token = None
+        if redis is not None:
             try:
-                redis_client.setex(cache_key, 3600, json.dumps(fresh_data))  # 1 hour TTL
-                redis_client.setex(cache_mtime_key, 3600, str(current_modified))
-                logger.info(f"💾 Updated Redis cache (Worker {WORKER_ID})")
+                data = await _read_redis_news_cache(redis, current_modified, summarized_file)
+                if data is not None:
+                    logger.info(f"🚀 Loaded {len(data)} articles from Redis cache (Worker {WORKER_ID})")
+                    return data
+                
+                lease_token = await acquire_reload_lease(redis)
+                if lease_token is None:
+                    if not wait_for_leader:
+                        logger.info(f"⏳ Another worker is reloading news data - serving previous snapshot (Worker {WORKER_ID})")
+                        return None
+                    
+                    # Cold worker with nothing to serve: wait briefly for the leader to publish
+                    deadline = time.monotonic() + NEWS_RELOAD_WAIT_SECONDS
+                    while time.monotonic() < deadline:
+                        await asyncio.sleep(0.1)
+                        data = await _read_redis_news_cache(redis, current_modified, summarized_file)
+                        if data is not None:
+                            logger.info(f"🚀 Loaded {len(data)} articles published by reload leader (Worker {WORKER_ID})")
+                            return data
+                    logger.warning(f"Reload leader did not publish in {NEWS_RELOAD_WAIT_SECONDS}s - loading locally (Worker {WORKER_ID})")
             except Exception as e:
-                logger.warning(f"Redis cache write error: {e}")
+                redis_error(e, "cache read")
+        
+        try:
+            # Load fresh data from file
+            logger.info(f"🔄 Loading fresh news data from {summarized_file} (Worker {WORKER_ID})")
+            
+            fresh_data = await asyncio.to_thread(_read_json_file, summarized_file)
+            
+            # Update local cache
+            news_data_cache["data"] = fresh_data
+            news_data_cache["last_modified"] = current_modified
+            news_data_cache["file_path"] = summarized_file
+            
+            # Update Redis cache (if available) - both keys in one atomic round-trip
+            if redis is not None and fresh_data:
+                try:
+                    serialized = await asyncio.to_thread(json.dumps, fresh_data)
+                    async with redis.pipeline(transaction=True) as pipe:
+                        pipe.setex(NEWS_CACHE_KEY, 3600, serialized)  # 1 hour TTL
+                        pipe.setex(NEWS_MTIME_KEY, 3600, str(current_modified))
+                        await pipe.execute()
+                    logger.info(f"💾 Updated Redis cache (Worker {WORKER_ID})")
+                except Exception as e:
+                    redis_error(e, "cache write")
+        finally:
+            if lease_token is not None:
+                await release_reload_lease(redis, lease_token)
         
         logger.info(f"✅ Loaded {len(fresh_data)} fresh articles (Worker {WORKER_ID})")
         return fresh_data
         
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error in summarized file: {e}")
-        return []
+        # Only possible with a writer that still rewrites the file in place - keep serving the previous snapshot
+        logger.error(f"JSON decode error in summarized file (partial write?): {e}")
+        return None
     except Exception as e:
         logger.error(f"Error reading summarized file: {e}")
         return []
 
-def invalidate_distributed_cache():
+async def get_news_snapshot():
+    """
+    Get the NewsSnapshot for the current version of summarized_news_hf.json.
+    While the background refresher runs this never touches the disk: the refresher swaps in
+    new snapshots as the file changes. Only a cold worker builds on the request path.
+    Concurrent requests share one rebuild; if another worker holds the reload lease the
+    previous snapshot keeps being served until the new data is published.
+    """
+    snapshot = news_data_cache["snapshot"]
+    if snapshot is not None and data_refresher_running():
+        return snapshot
+    
+    # Source ids are stamped at build time, so a source configuration change also rebuilds
+    revision = (current_news_version(), current_sources_key())
+    if snapshot is not None and snapshot.revision == revision:
+        return snapshot
+    
+    rebuilt = await snapshot_reloads.do(revision, lambda: _rebuild_news_snapshot(revision, have_previous=snapshot is not None))
+    if rebuilt is not None:
+        return rebuilt
+    return news_data_cache["snapshot"] or NewsSnapshot.build(
+        [], version=revision[0], id_func=generate_article_id, source_id_func=resolve_source_id, sources_key=revision[1]
+    )
+
+def _map_shared_snapshot(revision):
+    # Blocking (mmap + index decode) - called via asyncio.to_thread
+    """The host-wide snapshot for `revision` if another worker already published it"""
+    try:
+        buffer = shared_snapshots.map_current()
+        if buffer is not None and snapshot_revision(buffer) == revision:
+            return NewsSnapshot(buffer)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not map shared snapshot: {e}")
+    return None
+
+def _install_snapshot(snapshot, origin):
+    # Don't pin an empty snapshot - a failed/partial read should be retried on the next request
+    if snapshot.total:
+        news_data_cache["snapshot"] = snapshot
+        # The snapshot now holds this worker's only copy of the articles
+        news_data_cache["data"] = None
+        logger.info(f"📸 {origin} news snapshot with {snapshot.total} articles ({snapshot.nbytes // 1024} KB, Worker {WORKER_ID})")
+    return snapshot
+
+async def _rebuild_news_snapshot(revision, have_previous):
+    """Load and build the snapshot for (version, sources key); None means 'keep serving the previous one'"""
+    snapshot = await asyncio.to_thread(_map_shared_snapshot, revision)
+    if snapshot is not None:
+        return _install_snapshot(snapshot, "Mapped shared")
+    
+    with shared_snapshots.publisher_lock() as is_publisher:
+        if shared_snapshots.enabled and not is_publisher:
+            # Another worker on this host is publishing - keep serving, or wait briefly when cold
+            if have_previous:
+                return None
+            deadline = time.monotonic() + SHARED_SNAPSHOT_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                snapshot = await asyncio.to_thread(_map_shared_snapshot, revision)
+                if snapshot is not None:
+                    return _install_snapshot(snapshot, "Mapped shared")
+            logger.warning(f"Snapshot publisher did not finish in {SHARED_SNAPSHOT_WAIT_SECONDS}s - building locally (Worker {WORKER_ID})")
+        elif is_publisher:
+            # A publisher may have finished between the first check and taking the lock
+            snapshot = await asyncio.to_thread(_map_shared_snapshot, revision)
+            if snapshot is not None:
+                return _install_snapshot(snapshot, "Mapped shared")
+        
+        data = await get_fresh_news_data(wait_for_leader=not have_previous)
+        if data is None:
+            return None
+        
+        # Diffing against the snapshot being replaced extends the change log for /api/news/changes
+        encoded = await asyncio.to_thread(
+            encode_snapshot, data, version=revision[0],
+            id_func=generate_article_id, source_id_func=resolve_source_id,
+            previous=news_data_cache["snapshot"], sources_key=revision[1]
+        )
+        
+        if is_publisher and data:
+            try:
+                await asyncio.to_thread(shared_snapshots.publish, encoded)
+                snapshot = await asyncio.to_thread(_map_shared_snapshot, revision)
+                if snapshot is not None:
+                    return _install_snapshot(snapshot, "Published shared")
+            except OSError as e:
+                # e.g. /dev/shm full - fall back to a private copy
+                logger.warning(f"Could not publish shared snapshot: {e}")
+        
+        return _install_snapshot(await asyncio.to_thread(NewsSnapshot, encoded), "Built")
+
+async def invalidate_distributed_cache():
     """Invalidate cache across all instances"""
     global news_data_cache
     
     # Invalidate local cache
     news_data_cache["last_modified"] = 0
     news_data_cache["data"] = None
+    news_data_cache["snapshot"] = None
+    shared_snapshots.discard()
     
     # Invalidate Redis cache
-    if REDIS_AVAILABLE:
+    redis = await get_redis()
+    if redis is not None:
         try:
-            redis_client.delete("cyberx:news_data")
-            redis_client.delete("cyberx:news_mtime")
+            await redis.delete(NEWS_CACHE_KEY, NEWS_MTIME_KEY)
             logger.info(f"🗑️  Redis cache invalidated (Worker {WORKER_ID})")
         except Exception as e:
-            logger.warning(f"Redis cache invalidation error: {e}")
+            redis_error(e, "cache invalidation")
+
+# Without a file watcher, data listings and the source config are rechecked at most this often
+CATALOG_POLL_INTERVAL = float(os.getenv('CATALOG_POLL_INTERVAL', '5'))
+
+# Fields of a parsed source that come from url_fetch.txt (and so identify the configuration)
+SOURCE_CONFIG_FIELDS = ("id", "name", "url", "domain", "category", "description")
+
+def source_config_key(sources):
+    """Digest of the parsed source configuration - the same on every worker reading the same file"""
+    if not sources:
+        return ""
+    frozen = sorted(tuple(source.get(field) for field in SOURCE_CONFIG_FIELDS) for source in sources.values())
+    return hashlib.blake2b(json.dumps(frozen).encode(), digest_size=8).hexdigest()
 
 class DynamicNewsAPI:
     """Dynamic News API that adapts to URL configuration changes"""
@@ -416,26 +1140,33 @@ class DynamicNewsAPI:
         self.data_dir = DATA_DIR
         self.config_dir = CONFIG_DIR
         self.url_config_file = os.path.join(self.config_dir, "url_fetch.txt")
-        self._url_sources = None
         self._last_config_check = 0
+        # Key of the parsed configuration, computed as it is parsed (the parsed dicts are shared)
+        self.sources_key = ""
         
-    def get_url_sources(self):
-        """Dynamically parse URL configuration file to get all sources"""
-        config_mtime = os.path.getmtime(self.url_config_file) if os.path.exists(self.url_config_file) else 0
+        # Invalidated by watchdog events (see startup_event), polled otherwise
+        self.url_sources = WatchedCache(self._parse_url_config, signature=self._config_mtime, poll_interval=CATALOG_POLL_INTERVAL)
+        self.data_files = WatchedCache(self._scan_data_files, poll_interval=CATALOG_POLL_INTERVAL)
         
-        # Cache sources for 5 minutes or until config file changes
-        if (self._url_sources is None or 
-            config_mtime > self._last_config_check or 
-            (datetime.now().timestamp() - self._last_config_check) > 300):
-            
-            self._url_sources = self._parse_url_config()
-            self._last_config_check = config_mtime
-            
-        return self._url_sources
+    def get_url_sources(self):
+        """Sources parsed from the URL configuration file (re-parsed only when it changes)"""
+        return self.url_sources.get()
+    
+    def reload_sources(self):
+        """Force a re-parse of the URL configuration on next access"""
+        self.url_sources.invalidate()
+    
+    def _config_mtime(self):
+        try:
+            return os.path.getmtime(self.url_config_file)
+        except OSError:
+            return 0
     
     def _parse_url_config(self):
         """Parse the URL configuration file to extract source information"""
         sources = {}
+        self._last_config_check = self._config_mtime()
+        self.sources_key = ""
         
         if not os.path.exists(self.url_config_file):
             logger.warning(f"URL config file not found: {self.url_config_file}")
@@ -467,6 +1198,7 @@ class DynamicNewsAPI:
                         "description": f"Latest cybersecurity news from {source_name}"
                     }
                     
+            self.sources_key = source_config_key(sources)
             logger.info(f"Loaded {len(sources)} dynamic sources from configuration")
             return sources
             
@@ -514,34 +1246,11 @@ class DynamicNewsAPI:
         return name_mapping.get(name.lower(), name.replace('-', ' ').replace('_', ' ').title())
     
     def get_data_files(self):
-        """Get all available data files in the data directory"""
-        data_files = {}
-        
-        if not os.path.exists(self.data_dir):
-            return data_files
-            
-        # Primary data sources
-        primary_files = [
-            'summarized_news_hf.json',    # AI-processed summary file
-            'cybersecurity_news_live.json',  # Live monitoring file
-        ]
-        
-        # Daily archive files (News_today_YYYYMMDD.json pattern)
-        daily_pattern = re.compile(r'News_today_\d{8}\.json')
-        
-        for file in os.listdir(self.data_dir):
-            if file.endswith('.json'):
-                file_path = os.path.join(self.data_dir, file)
-                file_stat = os.stat(file_path)
-                
-                data_files[file] = {
-                    'path': file_path,
-                    'size': file_stat.st_size,
-                    'modified': datetime.fromtimestamp(file_stat.st_mtime),
-                    'type': self._classify_data_file(file)
-                }
-                
-        return data_files
+        """All data files in the data directory (cached listing - treat as read-only)"""
+        return self.data_files.get()
+    
+    def _scan_data_files(self):
+        return scan_directory(self.data_dir, '.json', self._classify_data_file)
     
     def _classify_data_file(self, filename):
         """Classify data file type"""
@@ -557,14 +1266,19 @@ class DynamicNewsAPI:
 # Initialize the dynamic API
 dynamic_api = DynamicNewsAPI()
 
-def load_articles_from_file(filename):
+async def load_articles_from_file(filename):
     """Load articles from JSON file with enhanced error handling and intelligent caching"""
     
-    # For summarized_news_hf.json, use the cached fresh data function
+    # For summarized_news_hf.json, decode records from the (shared) snapshot
     if filename == "summarized_news_hf.json":
-        return get_fresh_news_data()
+        snapshot = await get_news_snapshot()
+        return await asyncio.to_thread(lambda: list(snapshot.iter_details()))
     
-    # For other files, use regular loading
+    # Archive files can be large - read and parse them off the event loop
+    return await asyncio.to_thread(_read_articles_file, filename)
+
+def _read_articles_file(filename):
+    # Blocking (file read + JSON parse) - called via asyncio.to_thread
     try:
         filepath = os.path.join(DATA_DIR, filename)
         if not os.path.exists(filepath):
@@ -675,35 +1389,439 @@ def format_article_for_api(article, source_info=None):
     }
 
 def generate_article_id(article):
-    """Generate a unique article ID"""
-    url = article.get("url", "")
-    title = article.get("title", "")
-    
-    if url:
-        return f"article-{hash(url) % 1000000}"
-    elif title:
-        return f"article-{hash(title) % 1000000}"
-    else:
-        return f"article-{hash(str(article)) % 1000000}"
+    """Stable article ID - stored at ingest, else a BLAKE2b of the canonical URL (same on every worker)"""
+    return stable_article_id(article)
 
-def detect_source_from_url(url):
-    """Detect source information from article URL"""
+source_trie_state = {"generation": None, "trie": DomainTrie()}
+
+def get_source_trie():
+    """Domain trie over the configured sources, rebuilt whenever url_fetch.txt is re-parsed"""
     sources = dynamic_api.get_url_sources()
-    
+    generation = dynamic_api.url_sources.generation
+    if source_trie_state["generation"] != generation:
+        source_trie_state["trie"] = DomainTrie((info["domain"], info) for info in sources.values())
+        source_trie_state["generation"] = generation
+    return source_trie_state["trie"]
+
+def current_sources_key():
+    """Key of the source configuration that resolve_source_id currently stamps ids with"""
+    dynamic_api.get_url_sources()
+    return dynamic_api.sources_key
+
+def detect_source_from_url(url):
+    """Detect source information from article URL (longest matching configured domain)"""
     try:
-        parsed_url = urllib.parse.urlparse(url.lower())
-        domain = parsed_url.netloc.replace('www.', '')
-        
-        for source_id, source_info in sources.items():
-            source_domain = source_info["domain"]
-            if domain == source_domain or domain.endswith(f'.{source_domain}'):
-                return source_info
-                
+        return get_source_trie().lookup_url(url)
     except Exception as e:
         logger.error(f"Error detecting source from URL {url}: {e}")
     
     return None
 
+def resolve_source_id(article):
+    """Resolve a source id for an article (configured source, else derived from its domain)"""
+    source = article.get("source") if isinstance(article.get("source"), dict) else {}
+    source_url = source.get("url", "")
+    article_url = article.get("url", "")
+    
+    detected = detect_source_from_url(source_url or article_url)
+    if not detected and source_url and article_url:
+        detected = detect_source_from_url(article_url)
+    if detected:
+        return detected["id"]
+    
+    domain = dynamic_api._extract_domain(source_url or article_url) if (source_url or article_url) else ""
+    return dynamic_api._generate_source_id(domain) if domain else "unknown"
+
+# =====================================
+# FULL-TEXT SEARCH INDEX
+# =====================================
+
+search_index = SearchIndex()
+search_index_syncs = SingleFlight()
+
+# Lower value wins when the same URL appears in several files
+SEARCH_FILE_PRIORITY = {'summarized': 0, 'live': 1, 'daily_archive': 2}
+
+def _search_source_id(article, formatted_article):
+    """Resolve the source id used by the search ?source= filter"""
+    source_id = formatted_article.get("source", {}).get("id")
+    if source_id:
+        return source_id
+    detected = detect_source_from_url(article.get("url", "") or f"https://{article.get('domain', '')}")
+    return detected["id"] if detected else ""
+
+def _snapshot_search_documents(snapshot):
+    """Summarized articles are indexed by snapshot id - hits are materialized from the snapshot"""
+    for record in snapshot.iter_details():
+        yield SegmentDocument(
+            record["id"], record.get("url", ""), record.get("publishedAt", ""),
+            record["source"]["id"], tuple(record.get(field) for field in SEARCH_FIELDS)
+        )
+
+def _file_search_documents(articles):
+    """Live/archive articles are not in the snapshot, so their feed records are encoded into the segment"""
+    for article in articles:
+        if not isinstance(article, dict):
+            continue
+        record = format_article_for_api(article)
+        yield SegmentDocument(
+            record.get("id", ""), record.get("url", ""), record.get("publishedAt", ""),
+            _search_source_id(article, record), tuple(article.get(field) for field in SEARCH_FIELDS),
+            fast_dumps(record)
+        )
+
+# One host-wide segment file per indexed data file, published next to the shared snapshot
+search_segment_stores = {}
+
+def search_segment_store(filename):
+    if not shared_snapshots.enabled:
+        return None
+    store = search_segment_stores.get(filename)
+    if store is None:
+        store = search_segment_stores[filename] = SharedSnapshotStore(shared_snapshots.directory, name=f"search_{filename}.bin")
+    return store if store.enabled else None
+
+def _map_shared_segment(store, version):
+    # Blocking (mmap + index decode) - called via asyncio.to_thread
+    """The host-wide segment for `version` if another worker already published it"""
+    try:
+        buffer = store.map_current()
+        if buffer is not None and segment_version(buffer) == version:
+            return buffer
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not map shared search segment {store.path}: {e}")
+    return None
+
+async def _install_shared_segment(filename, version, store):
+    """Map the host-wide segment for `version` if it is already published; True if installed"""
+    shared = search_segment_store(filename)
+    buffer = shared and await asyncio.to_thread(_map_shared_segment, shared, version)
+    if buffer is None:
+        return False
+    count = search_index.install_segment(filename, buffer, store)
+    logger.info(f"🔎 Mapped shared search segment with {count} articles from {filename} (Worker {WORKER_ID})")
+    return True
+
+async def _search_segment_buffer(filename, version, encode, have_previous):
+    """
+    Encoded segment for `version` once it is not published yet: built here (and published)
+    if this worker wins the publisher lock, else the copy the publisher maps in meanwhile.
+    None means 'keep the previous segment' - the build failed or another worker is publishing.
+    """
+    shared = search_segment_store(filename)
+    if shared is None:
+        return await encode()
+    
+    with shared.publisher_lock() as is_publisher:
+        if not is_publisher:
+            if have_previous:
+                return None
+            deadline = time.monotonic() + SHARED_SNAPSHOT_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                buffer = await asyncio.to_thread(_map_shared_segment, shared, version)
+                if buffer is not None:
+                    return buffer
+            logger.warning(f"Search segment publisher did not finish in {SHARED_SNAPSHOT_WAIT_SECONDS}s - building locally (Worker {WORKER_ID})")
+            return await encode()
+        
+        # A publisher may have finished between the first check and taking the lock
+        buffer = await asyncio.to_thread(_map_shared_segment, shared, version)
+        if buffer is not None:
+            return buffer
+        
+        encoded = await encode()
+        if encoded is None:
+            return None
+        try:
+            await asyncio.to_thread(shared.publish, encoded)
+            buffer = await asyncio.to_thread(_map_shared_segment, shared, version)
+        except OSError as e:
+            # e.g. /dev/shm full - fall back to a private copy
+            logger.warning(f"Could not publish shared search segment: {e}")
+        return buffer if buffer is not None else encoded
+
+async def sync_search_index():
+    """
+    Re-index only the data files (or source configuration) that changed since the last sync.
+    Returns False if a changed file is still being indexed by another worker.
+    """
+    data_files = dynamic_api.get_data_files()
+    sources_key = current_sources_key()
+    complete = True
+    
+    for filename in search_index.segment_names():
+        if filename not in data_files:
+            search_index.remove_segment(filename)
+            logger.info(f"🗑️  Dropped search segment for removed file {filename}")
+    
+    for filename, info in data_files.items():
+        if info['type'] not in SEARCH_FILE_PRIORITY:
+            continue
+        priority = SEARCH_FILE_PRIORITY[info['type']]
+        modified = info['modified'].timestamp()
+        
+        if filename == "summarized_news_hf.json":
+            # Follows the snapshot it materializes hits from (which carries the source key)
+            store = await get_news_snapshot()
+            version = store.revision
+            if search_index.segment_version(filename) == version:
+                continue
+            if await _install_shared_segment(filename, version, store):
+                continue
+            if not store.total and info['size'] > 0:
+                continue
+            documents = lambda store=store: _snapshot_search_documents(store)
+        else:
+            # Segments store resolved source ids for ?source=, so they are keyed by the config too
+            store = None
+            version = (data_file_version(info['path']), info['size'], sources_key)
+            if search_index.segment_version(filename) == version:
+                continue
+            if await _install_shared_segment(filename, version, store):
+                continue
+            articles = await load_articles_from_file(filename)
+            if not articles and info['size'] > 0:
+                # Unreadable (e.g. mid-write) - keep the previous segment and retry next time
+                continue
+            documents = lambda articles=articles: _file_search_documents(articles)
+        
+        async def encode(version=version, documents=documents, priority=priority, modified=modified):
+            return await asyncio.to_thread(encode_segment, version, documents(), priority, modified)
+        
+        buffer = await _search_segment_buffer(
+            filename, version, encode, have_previous=search_index.segment_version(filename) is not None
+        )
+        if buffer is None:
+            complete = False
+            continue
+        count = search_index.install_segment(filename, buffer, store)
+        logger.info(f"🔎 Installed search segment with {count} articles from {filename} (Worker {WORKER_ID})")
+    
+    return complete
+
+# =====================================
+# CORPUS STATISTICS
+# =====================================
+
+corpus_stats = CorpusStats()
+corpus_stats_syncs = SingleFlight()
+
+# Articles kept per file for the /api/stats "recent_activity" section
+RECENT_ACTIVITY_COUNT = 5
+
+def _snapshot_source_id(article):
+    return article["source"]["id"]
+
+def _stats_source_id(article):
+    source = article.get("source")
+    if isinstance(source, dict) and source.get("id"):
+        return source["id"]
+    return resolve_source_id(article)
+
+async def sync_corpus_stats():
+    """Recount only the data files whose version (or the source configuration) changed since the last sync"""
+    data_files = dynamic_api.get_data_files()
+    sources_key = current_sources_key()
+    
+    for filename in corpus_stats.file_names():
+        if filename not in data_files:
+            corpus_stats.remove(filename)
+    
+    for filename, info in data_files.items():
+        if filename == "summarized_news_hf.json":
+            # Counted from the snapshot's light index - no record is decoded
+            snapshot = await get_news_snapshot()
+            version = ("snapshot", snapshot.revision)
+            if corpus_stats.file_version(filename) == version:
+                continue
+            articles, source_id_func = snapshot.articles, _snapshot_source_id
+        else:
+            version = (data_file_version(info['path']), info['size'], sources_key)
+            if corpus_stats.file_version(filename) == version:
+                continue
+            articles, source_id_func = await load_articles_from_file(filename), _stats_source_id
+            if not articles and info['size'] > 0:
+                # Unreadable (e.g. mid-write) - keep the previous counts and retry next time
+                corpus_stats.mark_error(filename, "File could not be parsed")
+                continue
+        
+        stats = await asyncio.to_thread(
+            FileStats, version, info['type'], info['size'], info['modified'], articles,
+            source_id_func=source_id_func,
+            recent_count=RECENT_ACTIVITY_COUNT if info['type'] == 'live' else 0
+        )
+        corpus_stats.install(filename, stats)
+
+async def get_corpus_stats():
+    """Current corpus statistics; kept up to date by the refresher, else synced on demand"""
+    if not data_refresher_running() or not corpus_stats.files:
+        await corpus_stats_syncs.do("stats", sync_corpus_stats)
+        update_corpus_metrics()
+    return corpus_stats
+
+# Article/source gauges for /metrics, set only when the corpus or source config changes
+corpus_metrics = {"generation": None, "sources_key": None, "articles": 0, "sources": 0}
+
+def update_corpus_metrics():
+    sources = dynamic_api.get_url_sources()
+    if corpus_metrics["generation"] == corpus_stats.generation and corpus_metrics["sources_key"] is sources:
+        return
+    corpus_metrics.update(
+        generation=corpus_stats.generation,
+        sources_key=sources,
+        articles=corpus_stats.total,
+        sources=len(sources)
+    )
+    request_metrics.set_corpus(corpus_metrics["articles"], corpus_metrics["sources"])
+
+def search_result_fragments(hits, fields):
+    """
+    Encode search hits. Summarized hits come from the snapshot their segment was built from
+    (so a sparse fieldset can select detail-only fields such as content); archive-only hits
+    from the record encoded into their segment.
+    """
+    fragments = (hit.fragment(fields) for hit in hits)
+    return [fragment for fragment in fragments if fragment is not None]
+
+# =====================================
+# BACKGROUND DATA REFRESHER
+# =====================================
+
+# mtime polling fallback when no watcher event arrives (e.g. watchdog unavailable or a network volume)
+DATA_POLL_INTERVAL = float(os.getenv('DATA_POLL_INTERVAL', '5'))
+# Retry sooner while another worker is still publishing a new version
+DATA_RETRY_INTERVAL = 0.5
+# Let a burst of watcher events (one writer, several modify events) settle into one refresh
+DATA_REFRESH_DEBOUNCE = 0.25
+
+# Hot responses rebuilt (and precompressed) after every snapshot swap, so clients never pay for the first miss
+WARM_PATHS = (
+    "/api/news",
+    "/api/news?limit=1",
+    "/api/news?page=1&limit=10",
+    "/api/news?page=1&limit=25",
+    "/api/news/sources",
+    "/api/stats",
+)
+# The only parameterized variants worth precompressing
+WARM_CACHE_KEYS = {
+    precompressed_cache_key(url.path, urllib.parse.parse_qsl(url.query))
+    for url in map(urllib.parse.urlsplit, WARM_PATHS)
+}
+
+refresher_state = {
+    "task": None,
+    "loop": None,
+    "event": None,
+    "warmed_version": None,
+    "last_refresh": None
+}
+
+def data_refresher_running():
+    task = refresher_state["task"]
+    return task is not None and not task.done()
+
+def request_data_refresh():
+    """Wake the refresher - safe to call from the watchdog thread"""
+    loop, event = refresher_state["loop"], refresher_state["event"]
+    if loop is not None and event is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(event.set)
+
+async def _warm_response(path):
+    """Run one GET through the full middleware stack in-process to populate the response caches"""
+    raw_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost"), (b"accept-encoding", b"br, gzip")],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+        # Internal warm-up traffic is excluded from request metrics
+        "state": {"cache_warmup": True},
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        pass
+    
+    await app(scope, receive, send)
+
+async def refresh_data_views():
+    """
+    Bring every derived view up to date: swap in a new snapshot if the summarized file
+    changed, re-index changed data files, then pre-build the hot responses.
+    Returns False if a newer version exists but could not be installed yet.
+    """
+    revision = (current_news_version(), current_sources_key())
+    snapshot = news_data_cache["snapshot"]
+    if snapshot is None or snapshot.revision != revision:
+        # Background work may wait for another worker's publication - no request is blocked on it
+        await snapshot_reloads.do(revision, lambda: _rebuild_news_snapshot(revision, have_previous=False))
+    
+    search_complete = await search_index_syncs.do("search", sync_search_index)
+    await corpus_stats_syncs.do("stats", sync_corpus_stats)
+    update_corpus_metrics()
+    
+    snapshot = news_data_cache["snapshot"]
+    if snapshot is None or snapshot.revision != revision or not search_complete:
+        return False
+    
+    if refresher_state["warmed_version"] != snapshot.revision:
+        for path in WARM_PATHS:
+            await _warm_response(path)
+        refresher_state["warmed_version"] = snapshot.revision
+        logger.info(f"🔥 Pre-built {len(WARM_PATHS)} hot responses for snapshot {snapshot.version} (Worker {WORKER_ID})")
+    
+    refresher_state["last_refresh"] = time.time()
+    return True
+
+async def data_refresher():
+    """Background task: refresh on watcher events, or every DATA_POLL_INTERVAL seconds"""
+    event = refresher_state["event"]
+    timeout = 0
+    while True:
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            await asyncio.sleep(DATA_REFRESH_DEBOUNCE)
+        except asyncio.TimeoutError:
+            pass
+        event.clear()
+        
+        try:
+            complete = await refresh_data_views()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Background data refresh failed (Worker {WORKER_ID}): {e}")
+            complete = False
+        timeout = DATA_POLL_INTERVAL if complete else DATA_RETRY_INTERVAL
+
+def start_data_refresher():
+    refresher_state["loop"] = asyncio.get_running_loop()
+    refresher_state["event"] = asyncio.Event()
+    refresher_state["task"] = asyncio.create_task(data_refresher())
+    logger.info(f"♻️  Background data refresher started (Worker {WORKER_ID})")
+
+async def stop_data_refresher():
+    task = refresher_state["task"]
+    refresher_state["task"] = None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
 # FastAPI Routes
 
 @app.get("/", response_model=Dict[str, Any])
@@ -711,16 +1829,7 @@ async def home():
     """Enhanced health check endpoint with dynamic source information"""
     try:
         sources = dynamic_api.get_url_sources()
-        data_files = dynamic_api.get_data_files()
-        
-        # Count total articles
-        total_articles = 0
-        for filename in data_files.keys():
-            try:
-                articles = load_articles_from_file(filename)
-                total_articles += len(articles)
-            except:
-                pass
+        stats = await get_corpus_stats()
         
         return {
             "message": "🛡️ Cybersecurity News API - FastAPI Edition",
@@ -729,8 +1838,8 @@ async def home():
             "timestamp": datetime.now().isoformat(),
             "configuration": {
                 "total_sources": len(sources),
-                "total_articles": total_articles,
-                "data_files": len(data_files)
+                "total_articles": stats.total,
+                "data_files": len(stats.files)
             },
             "endpoints": {
                 "news": {
@@ -745,7 +1854,8 @@ async def home():
                     "/api/config": "Get API configuration details",
                     "/api/config/reload": "Reload source configuration (POST)",
                     "/api/health": "Health check endpoint",
-                    "/api/notifications": "Frontend polling endpoint for notifications (GET)"
+                    "/api/notifications": "Frontend polling endpoint for notifications (GET)",
+                    "/api/notifications/stream": "Server-Sent Events push channel for notifications (GET)"
                 },
                 "real_time": {
                     "/api/notify": "Receive notifications from monitoring system (POST)"
@@ -781,94 +1891,144 @@ async def home():
 async def get_all_news(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Number of articles per page"),
-    source: Optional[str] = Query(None, description="Filter by source ID")
+    source: Optional[str] = Query(None, description="Filter by source ID"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor (overrides page)"),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION)
 ):
     """Get all cybersecurity news from summarized AI-processed data only - REAL-TIME UPDATES"""
     try:
-        # 🚀 SPEED OPTIMIZATION: Check Redis cache for paginated response first
-        cache_key = f"cyberx:paginated_news:{page}:{limit}:{source or 'all'}"
+        selected_fields = parse_fields_param(fields)
         
-        if REDIS_AVAILABLE:
+        # Validate the cursor up front so a bad token is a 400, not a 500
+        cursor_key = None
+        if cursor:
             try:
-                cached_response = redis_client.get(cache_key)
-                if cached_response:
-                    logger.info(f"🚀 Loaded paginated news from Redis cache (Worker {WORKER_ID})")
-                    return NewsResponse.parse_raw(cached_response)
-            except Exception as e:
-                logger.warning(f"Redis cache read error: {e}")
+                _, cursor_key = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "status": "error",
+                        "message": "Invalid cursor",
+                        "error": str(e)
+                    }
+                )
         
-        # 🚀 Load fresh data with automatic cache invalidation
-        all_articles = get_fresh_news_data()
+        # 🚀 Pre-sorted, pre-formatted snapshot - rebuilt only when the summarized file changes
+        snapshot = await get_news_snapshot()
         
         # If no data found, return empty response
-        if not all_articles:
+        if not snapshot.total:
             logger.warning("No articles found in summarized data file")
-            return NewsResponse(
-                status="success",
-                totalResults=0,
-                page=page,
-                limit=limit,
-                articles=[],
-                sources_available=0,
-                data_sources_used=["summarized"]
-            )
+            return fast_json_response({
+                "status": "success",
+                "totalResults": 0,
+                "page": page,
+                "limit": limit,
+                "articles": [],
+                "sources_available": 0,
+                "data_sources_used": ["summarized"],
+                "next_cursor": None,
+                "version": encode_version_token(*snapshot.revision)
+            })
         
-        # Apply source filtering if requested
+        articles = snapshot.feed
+        sources_available = snapshot.sources_available
+        
+        # Apply source filtering if requested (answered from the pre-sorted source partitions)
         if source:
-            all_articles = [
-                article for article in all_articles 
-                if article.get("source", {}).get("url", "").lower().find(source.lower()) != -1
-            ]
+            articles = snapshot.source_view(source)
+            sources_available = len(set(article["source"].get("url", "") for article in articles.articles))
         
-        # Sort by publishedAt (newest first)
-        all_articles.sort(key=lambda x: x.get("publishedAt", ""), reverse=True)
-        
-        # Apply pagination
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_articles = all_articles[start_idx:end_idx]
-        
-        # Format articles for consistent API response (optimized for speed - minimal fields only)
-        formatted_articles = []
-        for article in paginated_articles:
-            formatted_articles.append({
-                "id": generate_article_id(article),
-                "source": article.get("source", {}),
-                "title": article.get("title", ""),
-                "summary": article.get("summary", ""),
-                "url": article.get("url", ""),
-                "urlToImage": article.get("urlToImage", ""),
-                "publishedAt": article.get("publishedAt", ""),
-                "domain": article.get("source", {}).get("url", "").replace("https://", "").replace("http://", "").split("/")[0]
-            })
+        # Keyset mode seeks past the last (publishedAt, id) the client saw, so pages
+        # stay stable when new summaries are prepended - even across snapshot versions
+        if cursor_key is not None:
+            page_articles = articles.after(cursor_key, limit)
+        else:
+            page_articles = articles.page(page, limit)
         
-        response = NewsResponse(
-            status="success",
-            totalResults=len(all_articles),
-            page=page,
-            limit=limit,
-            articles=formatted_articles,
-            sources_available=len(set(article.get("source", {}).get("url", "") for article in all_articles)),
-            data_sources_used=["summarized"]
+        # Snapshot records are already in ArticleResponse shape and pre-encoded, so skip
+        # Pydantic re-validation and splice the cached JSON bytes (response_model still documents it)
+        return fast_json_response({
+            "status": "success",
+            "totalResults": len(articles),
+            "page": page,
+            "limit": limit,
+            "sources_available": sources_available,
+            "data_sources_used": ["summarized"],
+            "next_cursor": snapshot.next_cursor(articles, page_articles),
+            # Pass back as /api/news/changes?since= to fetch only what changed
+            "version": encode_version_token(*snapshot.revision)
+        }, articles=snapshot.fragments(page_articles, selected_fields))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting all news: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "status": "error",
+                "message": "Failed to fetch news",
+                "error": str(e)
+            }
         )
+
+@app.get("/api/news/changes", response_model=Dict[str, Any])
+async def get_news_changes(
+    since: str = Query(..., description="Version token from a previous /api/news or /api/news/changes response"),
+    limit: int = Query(200, ge=1, le=1000, description="Most added/updated articles to return before asking the client to reset"),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION)
+):
+    """
+    Articles added or updated, and ids removed, since the client's snapshot version.
+    Answered from the change log carried in the snapshot; `reset: true` means the log no
+    longer reaches back that far and the client should reload /api/news.
+    """
+    try:
+        selected_fields = parse_fields_param(fields)
+        try:
+            since_revision = decode_version_token(since)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "status": "error",
+                    "message": "Invalid since token",
+                    "error": str(e)
+                }
+            )
         
-        # 🚀 SPEED OPTIMIZATION: Cache the paginated response in Redis
-        if REDIS_AVAILABLE:
-            try:
-                redis_client.setex(cache_key, 300, response.json())  # Cache for 5 minutes
-                logger.info(f"💾 Cached paginated response in Redis (Worker {WORKER_ID})")
-            except Exception as e:
-                logger.warning(f"Redis response cache write error: {e}")
+        snapshot = await get_news_snapshot()
+        delta = snapshot.changes_since(*since_revision)
         
-        return response
+        if delta is None or len(delta[0]) > limit:
+            return fast_json_response({
+                "status": "success",
+                "version": encode_version_token(*snapshot.revision),
+                "reset": True,
+                "totalResults": 0,
+                "removed": []
+            }, articles=[])
+        
+        added, removed = delta
+        return fast_json_response({
+            "status": "success",
+            "version": encode_version_token(*snapshot.revision),
+            "reset": False,
+            "totalResults": len(added),
+            "removed": removed
+        }, articles=snapshot.fragments(added, selected_fields))
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error getting all news: {e}")
+        logger.error(f"Error getting news changes: {e}")
         raise HTTPException(
             status_code=500,
             detail={
                 "status": "error",
-                "message": "Failed to fetch news",
+                "message": "Failed to fetch news changes",
                 "error": str(e)
             }
         )
@@ -878,13 +2038,19 @@ async def get_sources():
     """Get all available news sources dynamically from configuration"""
     try:
         sources = dynamic_api.get_url_sources()
-        sources_list = list(sources.values())
         
-        # Add statistics about each source
-        data_files = dynamic_api.get_data_files()
-        for source in sources_list:
-            source["articles_count"] = 0  # This could be enhanced to count actual articles per source
-            source["last_updated"] = None
+        # Add statistics about each source (counted over the articles /api/news serves).
+        # The parsed config is shared and cached, so each response gets its own copies
+        stats = await get_corpus_stats()
+        served = stats.files.get("summarized_news_hf.json")
+        sources_list = [
+            {
+                **source,
+                "articles_count": served.by_source.get(source["id"], 0) if served else 0,
+                "last_updated": (served.source_latest.get(source["id"]) if served else None) or None
+            }
+            for source in sources.values()
+        ]
         
         return {
             "status": "success",
@@ -905,9 +2071,23 @@ async def get_sources():
         )
 
 @app.get("/api/news/source/{source_id}", response_model=Dict[str, Any])
-async def get_news_by_source(source_id: str):
-    """Get news from specific source with dynamic source detection"""
+async def get_news_by_source(
+    source_id: str,
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Number of articles per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor (overrides page)"),
+    export: Optional[str] = Query(None, pattern="^(ndjson|json)$", description="Stream every article for the source as NDJSON or a JSON array (ignores pagination)"),
+    archives: bool = Query(True, description="Include live and daily-archive articles that are not in the summarized feed"),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION)
+):
+    """
+    Get news from a specific source, newest first. Paginated from the snapshot's pre-sorted source
+    partition, merged with the live/daily-archive files' partitions from the search segments
+    unless archives=false (a URL present in several files is served from the summarized copy).
+    """
     try:
+        selected_fields = parse_fields_param(fields)
+        
         sources = dynamic_api.get_url_sources()
         
         if source_id not in sources:
@@ -920,43 +2100,47 @@ async def get_news_by_source(source_id: str):
                 }
             )
         
-        source_info = sources[source_id]
-        all_articles = []
+        cursor_key = None
+        if cursor:
+            try:
+                _, cursor_key = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "status": "error",
+                        "message": "Invalid cursor",
+                        "error": str(e)
+                    }
+                )
         
-        # Load articles from all available data files
-        data_files = dynamic_api.get_data_files()
+        snapshot = await get_news_snapshot()
+        if archives:
+            # Same condition as search_news: without the refresher the segments are synced on demand
+            if not data_refresher_running() or not search_index.segment_names():
+                await search_index_syncs.do("search", sync_search_index)
+            partition = search_index.source_view(source_id)
+            encode_batch = lambda batch: search_result_fragments([entry["hit"] for entry in batch], selected_fields)
+        else:
+            partition = snapshot.source_partition(source_id)
+            encode_batch = lambda batch: snapshot.fragments(batch, selected_fields)
         
-        for file_type in ['summarized', 'live', 'daily_archive']:
-            type_files = [f for f, info in data_files.items() if info['type'] == file_type]
-            
-            for filename in type_files:
-                articles = load_articles_from_file(filename)
-                for article in articles:
-                    formatted_article = format_article_for_api(article, source_info)
-                    # Filter by source
-                    if formatted_article.get("source", {}).get("id") == source_id:
-                        all_articles.append(formatted_article)
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            url = article.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
-            elif not url:  # Include articles without URLs
-                unique_articles.append(article)
-        
-        # Sort by scraped date (newest first)
-        unique_articles.sort(key=lambda x: x.get("scraped_at", ""), reverse=True)
+        if export:
+            return export_response(export, partition.articles, encode_batch, f"{source_id}-news")
         
-        return {
+        if cursor_key is not None:
+            page_articles = partition.after(cursor_key, limit)
+        else:
+            page_articles = partition.page(page, limit)
+        
+        return fast_json_response({
             "status": "success",
-            "source": source_info,
-            "totalResults": len(unique_articles),
-            "articles": unique_articles
-        }
+            "source": sources[source_id],
+            "totalResults": len(partition),
+            "page": page,
+            "limit": limit,
+            "next_cursor": snapshot.next_cursor(partition, page_articles)
+        }, articles=encode_batch(page_articles))
         
     except HTTPException:
         raise
@@ -972,35 +2156,24 @@ async def get_news_by_source(source_id: str):
         )
 
 @app.get("/api/article/{article_url:path}", response_model=Dict[str, Any])
-async def get_article_by_id(article_url: str):
-    """Get specific article by URL - FULL CONTENT for article detail view"""
+async def get_article_by_id(
+    article_url: str,
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION)
+):
+    """Get specific article by URL or article id - FULL CONTENT for article detail view"""
     try:
+        selected_fields = parse_fields_param(fields)
+        
         # Decode the URL
         decoded_url = urllib.parse.unquote(article_url)
         
-        # Load all articles from summarized_news_hf.json
-        articles = load_articles_from_file("summarized_news_hf.json")
-        
-        # Find the article by URL
-        for article in articles:
-            if article.get("url") == decoded_url:
-                # Return FULL article data for detail view (including content)
-                return {
-                    "status": "success",
-                    "article": {
-                        "id": generate_article_id(article),
-                        "source": article.get("source"),
-                        "title": article.get("title", ""),
-                        "summary": article.get("summary", ""),
-                        "content": article.get("content", ""),  # FULL content for detail view
-                        "url": article.get("url", ""),
-                        "urlToImage": article.get("urlToImage", "") or article.get("main_image", ""),
-                        "publishedAt": article.get("publishedAt", "") or article.get("scraped_at", ""),
-                        "author": article.get("author", ""),
-                        "word_count": article.get("word_count", 0),
-                        "domain": article.get("domain", "")
-                    }
-                }
+        # O(1) hash lookup by article id or normalized URL in the current snapshot
+        article = (await get_news_snapshot()).detail_fragment(decoded_url, selected_fields)
+        if article:
+            return Response(
+                content=b'{"status":"success","article":' + article + b'}',
+                media_type=JSON_MEDIA_TYPE
+            )
         
         # If not found, return error
         raise HTTPException(
@@ -1026,10 +2199,16 @@ async def get_article_by_id(article_url: str):
 @app.get("/api/news/search", response_model=SearchResponse)
 async def search_news(
     q: str = Query(..., description="Search query"),
-    source: Optional[str] = Query(None, description="Filter by source ID")
+    source: Optional[str] = Query(None, description="Filter by source ID"),
+    page: int = Query(1, ge=1, description="Page number of ranked results"),
+    limit: int = Query(50, ge=1, le=200, description="Number of ranked results per page"),
+    export: Optional[str] = Query(None, pattern="^(ndjson|json)$", description="Stream every match in rank order as NDJSON or a JSON array (ignores pagination)"),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION)
 ):
-    """Search news articles by title, content, or summary with dynamic source support"""
+    """Search news articles by title, summary, description or content using the BM25 inverted index"""
     try:
+        selected_fields = parse_fields_param(fields)
+        
         query = q.lower().strip()
         if not query:
             raise HTTPException(
@@ -1040,77 +2219,30 @@ async def search_news(
                 }
             )
         
-        all_articles = []
-        data_files = dynamic_api.get_data_files()
+        # Only files whose version changed since the last query are re-indexed
+        if not data_refresher_running() or not search_index.segment_names():
+            await search_index_syncs.do("search", sync_search_index)
         
-        # Search in all available data files
-        for file_type in ['summarized', 'live', 'daily_archive']:
-            type_files = [f for f, info in data_files.items() if info['type'] == file_type]
-            
-            for filename in type_files:
-                articles = load_articles_from_file(filename)
-                for article in articles:
-                    # Search in multiple fields
-                    title = article.get("title", "").lower()
-                    content = article.get("content", "").lower()
-                    description = article.get("description", "").lower()
-                    summary = article.get("summary", "").lower()
-                    
-                    # Check if query matches any field
-                    if (query in title or query in content or 
-                        query in description or query in summary):
-                        
-                        formatted_article = format_article_for_api(article)
-                        
-                        # Apply source filter if provided
-                        if source:
-                            article_source = formatted_article.get("source", {}).get("id", "")
-                            if article_source.lower() != source.lower():
-                                continue
-                        
-                        # Add relevance score for sorting
-                        relevance_score = 0
-                        if query in title:
-                            relevance_score += 3  # Title matches are most relevant
-                        if query in summary:
-                            relevance_score += 2  # Summary matches are very relevant
-                        if query in description:
-                            relevance_score += 1  # Description matches are relevant
-                        if query in content:
-                            relevance_score += 0.5  # Content matches are least relevant
-                        
-                        formatted_article["relevance_score"] = relevance_score
-                        all_articles.append(formatted_article)
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            url = article.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
-            elif not url:
-                unique_articles.append(article)
-        
-        # Sort by relevance score first, then by date
-        unique_articles.sort(key=lambda x: (
-            -x.get("relevance_score", 0),  # Higher relevance first (negative for descending)
-            x.get("scraped_at", "")        # Then by date descending
-        ), reverse=True)
-        
-        # Remove relevance score from response
-        for article in unique_articles:
-            article.pop("relevance_score", None)
-        
-        return SearchResponse(
-            status="success",
-            query=query,
-            source_filter=source,
-            totalResults=len(unique_articles),
-            articles=unique_articles,
-            sources_searched=len(dynamic_api.get_url_sources())
-        )
+        encode_batch = lambda batch: search_result_fragments(batch, selected_fields)
+        
+        if export:
+            # Ranked references into the index only - records are serialized as the stream is read
+            _, matches = search_index.search(query, limit=None, source=source)
+            return export_response(export, matches, encode_batch, "search-results")
+        
+        offset = (page - 1) * limit
+        total_results, articles = search_index.search(query, limit=limit, source=source, offset=offset)
+        
+        return fast_json_response({
+            "status": "success",
+            "query": query,
+            "source_filter": source,
+            "totalResults": total_results,
+            "page": page,
+            "limit": limit,
+            "has_more": offset + len(articles) < total_results,
+            "sources_searched": len(dynamic_api.get_url_sources())
+        }, articles=encode_batch(articles))
         
     except HTTPException:
         raise
@@ -1131,8 +2263,8 @@ async def notify_new_articles(notification: NotificationRequest):
     try:
         logger.info(f"📱 Real-time notification: {notification.type}, {notification.count} articles")
         
-        # Store a compact notification object for frontend polling
-        notifications_queue.insert(0, {
+        # Store a compact notification object for frontend polling and push it to connected clients
+        await publish_notification({
             "title": notification.title or ("Breaking News" if notification.count == 1 else f"{notification.count} New Articles"),
             "body": notification.message or notification.body or "New cybersecurity updates are available",
             "count": notification.count,
@@ -1141,9 +2273,6 @@ async def notify_new_articles(notification: NotificationRequest):
             "grouped": True
         })
         
-        # Keep queue bounded
-        del notifications_queue[50:]
-        
         return {
             "status": "success",
             "message": "Notification received",
@@ -1163,21 +2292,106 @@ async def notify_new_articles(notification: NotificationRequest):
             }
         )
 
+async def publish_notification(notification):
+    """Append a notification to the shared log, then broadcast it (with its id) to every push client"""
+    entry = await notification_log.append(notification)
+    await notification_bus.publish(entry)
+    return entry
+
+def sse_event(data, event="notification"):
+    event_id = f"id: {data['id']}\n" if data.get("id") else ""
+    return f"{event_id}event: {event}\ndata: {json.dumps(data, default=str)}\n\n".encode("utf-8")
+
+def parse_notification_cursor(cursor):
+    try:
+        return parse_entry_id(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "status": "error",
+                "message": "Invalid notification cursor",
+                "error": str(e)
+            }
+        )
+
+@app.get("/api/notifications/stream")
+async def stream_notifications(
+    request: Request,
+    after: Optional[str] = Query(None, description="Resume after this notification id (the Last-Event-ID header takes precedence)")
+):
+    """Server-Sent Events push channel - replaces polling /api/notifications"""
+    resume_from = request.headers.get("last-event-id") or after
+    last_sent = parse_notification_cursor(resume_from) if resume_from else None
+    
+    # Subscribe before replaying so nothing published during the replay is lost
+    queue = notification_bus.subscribe()
+    
+    async def events():
+        nonlocal last_sent
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n".encode("utf-8")
+            
+            # Replay what the client missed while disconnected
+            if last_sent is not None:
+                for entry in await notification_log.read_after(resume_from, notification_log.maxlen):
+                    last_sent = parse_entry_id(entry["id"])
+                    yield sse_event(entry)
+            
+            while True:
+                try:
+                    notification = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    # Comment line keeps proxies and load balancers from timing out the idle stream
+                    yield b": keepalive\n\n"
+                    continue
+                
+                if last_sent is not None and notification.get("id"):
+                    entry_id = parse_entry_id(notification["id"])
+                    if entry_id <= last_sent:
+                        continue  # already delivered by the replay
+                    last_sent = entry_id
+                yield sse_event(notification)
+        finally:
+            notification_bus.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/api/notifications", response_model=Dict[str, Any])
-async def poll_notifications(clear: bool = Query(False, description="Clear notifications after reading")):
-    """Lightweight polling endpoint the app can call periodically."""
+async def poll_notifications(
+    after: Optional[str] = Query(None, description="Cursor from a previous response - only newer notifications are returned"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum notifications per poll"),
+    clear: bool = Query(False, description="Deprecated no-op: the log is shared by all clients, so keep the returned cursor instead")
+):
+    """
+    Lightweight polling endpoint the app can call periodically.
+    Pass the returned `cursor` back as `after` to receive only notifications added since.
+    """
     try:
-        payload = {
+        if after:
+            parse_notification_cursor(after)
+            entries = await notification_log.read_after(after, limit)
+            cursor = entries[-1]["id"] if entries else after
+            notifications = entries[::-1]  # newest first, like the unfiltered view
+        else:
+            notifications = await notification_log.latest(5)  # return recent few
+            cursor = notifications[0]["id"] if notifications else "0-0"
+        
+        return {
             "status": "success",
-            "count": len(notifications_queue),
-            "notifications": notifications_queue[:5]  # return recent few
+            "count": len(notifications),
+            "notifications": notifications,
+            "cursor": cursor
         }
         
-        if clear:
-            notifications_queue.clear()
-            
-        return payload
-        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in poll_notifications: {e}")
         raise HTTPException(
@@ -1264,12 +2478,11 @@ async def refresh_news_cache():
     
     try:
         # Force cache invalidation across all instances
-        old_count = len(news_data_cache["data"]) if news_data_cache["data"] else 0
-        invalidate_distributed_cache()
+        old_count = news_data_cache["snapshot"].total if news_data_cache["snapshot"] else 0
+        await invalidate_distributed_cache()
         
-        # Load fresh data
-        fresh_data = get_fresh_news_data()
-        new_count = len(fresh_data) if fresh_data else 0
+        # Load fresh data and republish the shared snapshot
+        new_count = (await get_news_snapshot()).total
         
         return {
             "status": "success",
@@ -1305,20 +2518,27 @@ async def get_cache_info():
     cache_info = {
         "local_cache": {
             "worker_id": WORKER_ID,
-            "has_data": news_data_cache["data"] is not None,
-            "articles_count": len(news_data_cache["data"]) if news_data_cache["data"] else 0,
+            "has_data": news_data_cache["snapshot"] is not None,
+            "articles_count": news_data_cache["snapshot"].total if news_data_cache["snapshot"] else 0,
             "file_path": news_data_cache["file_path"],
             "last_modified": datetime.fromtimestamp(news_data_cache["last_modified"]).isoformat() if news_data_cache["last_modified"] else None
         },
+        "shared_snapshot": {
+            "enabled": shared_snapshots.enabled,
+            "path": shared_snapshots.path,
+            "size_bytes": news_data_cache["snapshot"].nbytes if news_data_cache["snapshot"] else 0
+        },
         "timestamp": datetime.now().isoformat()
     }
     
     # Add Redis cache info if available
-    if REDIS_AVAILABLE:
+    redis = await get_redis()
+    if redis is not None:
         try:
-            redis_mtime = redis_client.get("cyberx:news_mtime")
-            redis_data_exists = redis_client.exists("cyberx:news_data")
-            redis_ttl = redis_client.ttl("cyberx:news_data")
+            async with redis.pipeline(transaction=False) as pipe:
+                redis_mtime, redis_data_exists, redis_ttl = await (
+                    pipe.get(NEWS_MTIME_KEY).exists(NEWS_CACHE_KEY).ttl(NEWS_CACHE_KEY).execute()
+                )
             
             cache_info["redis_cache"] = {
                 "available": True,
@@ -1335,7 +2555,7 @@ async def get_cache_info():
     else:
         cache_info["redis_cache"] = {
             "available": False,
-            "reason": "Redis not configured"
+            "reason": "Redis not installed or currently unreachable"
         }
     
     return cache_info
@@ -1358,50 +2578,36 @@ async def get_stats():
             "last_config_update": datetime.fromtimestamp(dynamic_api._last_config_check).isoformat() if dynamic_api._last_config_check else None
         }
         
-        # Data files analysis
-        data_files = dynamic_api.get_data_files()
+        # Data files analysis (precomputed per file version)
+        corpus = await get_corpus_stats()
         stats["data_files"] = {}
         
-        total_articles = 0
-        for filename, info in data_files.items():
-            try:
-                articles = load_articles_from_file(filename)
-                article_count = len(articles)
-                total_articles += article_count
-                
-                stats["data_files"][filename] = {
-                    "type": info["type"],
-                    "count": article_count,
-                    "size_bytes": info["size"],
-                    "size_kb": round(info["size"] / 1024, 2),
-                    "last_modified": info["modified"].isoformat(),
-                    "status": "healthy" if article_count > 0 else "empty"
-                }
-            except Exception as e:
-                stats["data_files"][filename] = {
-                    "type": info["type"],
-                    "error": str(e),
-                    "size_bytes": info["size"],
-                    "last_modified": info["modified"].isoformat(),
-                    "status": "error"
-                }
+        for filename, info in corpus.files.items():
+            stats["data_files"][filename] = {
+                "type": info.file_type,
+                "count": info.count,
+                "size_bytes": info.size,
+                "size_kb": round(info.size / 1024, 2),
+                "last_modified": info.modified.isoformat(),
+                "status": info.status
+            }
+        for filename, error in corpus.errors.items():
+            if filename not in corpus.files:
+                stats["data_files"][filename] = {"error": error, "status": "error"}
         
         # Summary statistics
-        stats["summary"] = {
-            "total_articles_across_all_files": total_articles,
-            "total_data_files": len(data_files),
-            "healthy_files": len([f for f in stats["data_files"].values() if f.get("status") == "healthy"]),
-            "empty_files": len([f for f in stats["data_files"].values() if f.get("status") == "empty"]),
-            "error_files": len([f for f in stats["data_files"].values() if f.get("status") == "error"])
+        stats["summary"] = corpus.summary()
+        stats["distribution"] = {
+            "by_source": dict(corpus.by_source.most_common()),
+            "by_day": dict(sorted(corpus.by_day.items(), reverse=True))
         }
         
         # Recent activity (from live monitoring if available)
-        live_files = [f for f, info in data_files.items() if info['type'] == 'live']
+        live_files = [info for info in corpus.files.values() if info.file_type == 'live']
         if live_files:
             try:
-                live_data = load_articles_from_file(live_files[0])
-                if live_data:
-                    recent_articles = sorted(live_data, key=lambda x: x.get("scraped_at", ""), reverse=True)[:5]
+                recent_articles = live_files[0].recent
+                if recent_articles:
                     stats["recent_activity"] = [
                         {
                             "title": article.get("title", "")[:100] + ("..." if len(article.get("title", "")) > 100 else ""),
@@ -1431,7 +2637,7 @@ async def get_config():
     """Get current API configuration and source information"""
     try:
         sources = dynamic_api.get_url_sources()
-        data_files = dynamic_api.get_data_files()
+        corpus = await get_corpus_stats()
         
         config_info = {
             "api_version": "4.0-fastapi",
@@ -1442,11 +2648,12 @@ async def get_config():
             "data_directory": dynamic_api.data_dir,
             "available_data_files": {
                 filename: {
-                    "type": info["type"],
-                    "size_kb": round(info["size"] / 1024, 2),
-                    "modified": info["modified"].isoformat()
+                    "type": info.file_type,
+                    "articles": info.count,
+                    "size_kb": round(info.size / 1024, 2),
+                    "modified": info.modified.isoformat()
                 }
-                for filename, info in data_files.items()
+                for filename, info in corpus.files.items()
             },
             "features": [
                 "Dynamic source detection from URL config",
@@ -1477,12 +2684,15 @@ async def reload_config():
     """Manually reload the URL configuration"""
     try:
         # Force reload of URL sources
-        dynamic_api._url_sources = None
-        dynamic_api._last_config_check = 0
+        dynamic_api.reload_sources()
         
         # Get fresh sources
         sources = dynamic_api.get_url_sources()
         
+        # Source ids in the snapshot, search segments and per-source counts depend on the configured
+        # domains; their versions include the config key, so the refresher rebuilds them now
+        request_data_refresh()
+        
         return {
             "status": "success",
             "message": "Configuration reloaded successfully",
@@ -1513,9 +2723,9 @@ async def get_alerts(
 ):
     """Get recent alerts and notifications with pagination"""
     try:
-        alerts_file = os.path.join(ALERTS_DIR, "alerts_log.json")
+        counts = await asyncio.to_thread(alert_store.counts)
         
-        if not os.path.exists(alerts_file):
+        if counts["total"] == 0:
             return {
                 "status": "success",
                 "alerts": [],
@@ -1526,29 +2736,16 @@ async def get_alerts(
                 "message": "No alerts available yet"
             }
         
-        with open(alerts_file, 'r', encoding='utf-8') as f:
-            all_alerts = json.load(f)
-        
-        # Sort by timestamp (newest first)
-        all_alerts.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        # Filter unread if requested
-        if unread_only:
-            all_alerts = [alert for alert in all_alerts if not alert.get('read', False)]
-        
-        # Calculate unread count
-        unread_count = len([alert for alert in all_alerts if not alert.get('read', False)])
-        
-        # Apply pagination
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_alerts = all_alerts[start_idx:end_idx]
+        # Newest first, filtered and paginated by the store's indexes
+        paginated_alerts = await asyncio.to_thread(
+            alert_store.page, (page - 1) * limit, limit, unread_only=unread_only
+        )
         
         return {
             "status": "success",
             "alerts": paginated_alerts,
-            "totalResults": len(all_alerts),
-            "unreadCount": unread_count,
+            "totalResults": counts["unread"] if unread_only else counts["total"],
+            "unreadCount": counts["unread"],
             "page": page,
             "limit": limit,
             "timestamp": datetime.now().isoformat()
@@ -1569,41 +2766,10 @@ async def get_alerts(
 async def mark_alerts_read(request: AlertMarkReadRequest):
     """Mark specific alerts as read"""
     try:
-        alerts_file = os.path.join(ALERTS_DIR, "alerts_log.json")
-        
-        if not os.path.exists(alerts_file):
-            raise HTTPException(
-                status_code=404,
-                detail={
-                    "status": "error",
-                    "message": "No alerts file found"
-                }
-            )
-        
-        with open(alerts_file, 'r', encoding='utf-8') as f:
-            alerts = json.load(f)
-        
-        modified_count = 0
-        
-        if request.mark_all:
-            # Mark all alerts as read
-            for alert in alerts:
-                if not alert.get('read', False):
-                    alert['read'] = True
-                    alert['read_at'] = datetime.now().isoformat()
-                    modified_count += 1
-        else:
-            # Mark specific alerts as read
-            for alert in alerts:
-                alert_timestamp = alert.get('timestamp', '')
-                if alert_timestamp in request.alert_ids and not alert.get('read', False):
-                    alert['read'] = True
-                    alert['read_at'] = datetime.now().isoformat()
-                    modified_count += 1
-        
-        # Save updated alerts
-        with open(alerts_file, 'w', encoding='utf-8') as f:
-            json.dump(alerts, f, indent=2, default=str, ensure_ascii=False)
+        # Alerts are identified by their timestamp; mark_all updates every unread alert
+        modified_count = await asyncio.to_thread(
+            alert_store.mark_read, None if request.mark_all else request.alert_ids
+        )
         
         return {
             "status": "success",
@@ -1628,7 +2794,6 @@ async def mark_alerts_read(request: AlertMarkReadRequest):
 async def get_alert_stats():
     """Get alert statistics and metrics"""
     try:
-        alerts_file = os.path.join(ALERTS_DIR, "alerts_log.json")
         alert_state_file = os.path.join(ALERTS_DIR, "alert_state.json")
         
         stats = {
@@ -1641,43 +2806,21 @@ async def get_alert_stats():
             "file_watcher_stats": {}
         }
         
-        # Load alerts if available
-        if os.path.exists(alerts_file):
-            with open(alerts_file, 'r', encoding='utf-8') as f:
-                alerts = json.load(f)
-            
-            stats["total_alerts"] = len(alerts)
-            stats["unread_alerts"] = len([a for a in alerts if not a.get('read', False)])
+        # Counts come from indexed queries on the alert store
+        counts = await asyncio.to_thread(alert_store.counts)
+        if counts["total"]:
+            stats["total_alerts"] = counts["total"]
+            stats["unread_alerts"] = counts["unread"]
             
-            # Calculate date-based stats
+            # Calculate date-based stats (timestamps are ISO strings, so range scans compare lexically)
             now = datetime.now()
-            today = now.date()
             week_ago = now - timedelta(days=7)
+            trend_data = await asyncio.to_thread(alert_store.daily_counts, 7)
             
-            stats["today_alerts"] = len([
-                a for a in alerts 
-                if datetime.fromisoformat(a.get('timestamp', '2000-01-01')).date() == today
-            ])
-            
-            stats["this_week_alerts"] = len([
-                a for a in alerts 
-                if datetime.fromisoformat(a.get('timestamp', '2000-01-01')) >= week_ago
-            ])
-            
-            # Generate trend data (last 7 days)
-            trend_data = {}
-            for i in range(7):
-                date = (now - timedelta(days=i)).date()
-                trend_data[date.isoformat()] = 0
-            
-            for alert in alerts:
-                try:
-                    alert_date = datetime.fromisoformat(alert.get('timestamp', '')).date()
-                    if alert_date.isoformat() in trend_data:
-                        trend_data[alert_date.isoformat()] += 1
-                except:
-                    continue
+            stats["today_alerts"] = trend_data.get(now.date().isoformat(), 0)
+            stats["this_week_alerts"] = await asyncio.to_thread(alert_store.count_since, week_ago.isoformat())
             
+            # Trend data (last 7 days)
             stats["alert_trends"] = [
                 {"date": date, "count": count} 
                 for date, count in sorted(trend_data.items())
@@ -1726,25 +2869,11 @@ async def test_alert_system():
             "read": False
         }
         
-        # Save to alerts log
-        alerts_file = os.path.join(ALERTS_DIR, "alerts_log.json")
-        
-        alerts = []
-        if os.path.exists(alerts_file):
-            with open(alerts_file, 'r', encoding='utf-8') as f:
-                alerts = json.load(f)
+        # Save to the alert store (keeps the last 100 alerts)
+        await asyncio.to_thread(alert_store.add, test_alert)
         
-        alerts.append(test_alert)
-        
-        # Keep only last 100 alerts
-        if len(alerts) > 100:
-            alerts = alerts[-100:]
-        
-        with open(alerts_file, 'w', encoding='utf-8') as f:
-            json.dump(alerts, f, indent=2, default=str, ensure_ascii=False)
-        
-        # Also add to notifications queue for real-time polling
-        notifications_queue.insert(0, {
+        # Also publish for real-time polling and push
+        await publish_notification({
             "title": "Test Alert",
             "body": "System test alert generated successfully",
             "count": 1,
@@ -2033,34 +3162,6 @@ async def get_metrics():
         # Calculate average response time
         avg_response_time = request_duration_sum / max(request_count, 1)
         
-        # Count articles and sources
-        articles_count = 0
-        sources_count = 0
-        
-        # Check data files
-        data_files = [
-            "cybersecurity_news_live.json",
-            "News_today_*.json",
-            "summarized_news_hf.json"
-        ]
-        
-        for filename in os.listdir(DATA_DIR) if os.path.exists(DATA_DIR) else []:
-            if filename.endswith('.json') and any(pattern.replace('*', '') in filename for pattern in data_files):
-                try:
-                    with open(os.path.join(DATA_DIR, filename), 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if isinstance(data, dict) and 'articles' in data:
-                            articles_count += len(data['articles'])
-                        elif isinstance(data, list):
-                            articles_count += len(data)
-                except:
-                    continue
-        
-        # Count URL sources
-        api_instance = DynamicNewsAPI()
-        sources = api_instance.get_url_sources()
-        sources_count = len(sources)
-        
         # Generate Prometheus metrics format
         metrics = f"""# HELP fastapi_requests_total Total number of HTTP requests
 # TYPE fastapi_requests_total counter
@@ -2090,14 +3191,6 @@ system_memory_usage_percent {memory.percent}
 # TYPE system_disk_usage_percent gauge
 system_disk_usage_percent {disk.percent}
 
-# HELP cybersecurity_articles_total Total number of cybersecurity articles
-# TYPE cybersecurity_articles_total gauge
-cybersecurity_articles_total {articles_count}
-
-# HELP cybersecurity_sources_total Total number of configured sources
-# TYPE cybersecurity_sources_total gauge
-cybersecurity_sources_total {sources_count}
-
 # HELP api_endpoint_requests_total Requests per endpoint
 # TYPE api_endpoint_requests_total counter
 """
@@ -2107,6 +3200,21 @@ cybersecurity_sources_total {sources_count}
             safe_endpoint = endpoint.replace(' ', '_').replace('/', '_').replace('{', '').replace('}', '').replace(':', '')
             metrics += f'api_endpoint_requests_total{{endpoint="{safe_endpoint}"}} {stats["count"]}\n'
             metrics += f'api_endpoint_errors_total{{endpoint="{safe_endpoint}"}} {stats["errors"]}\n'
+        
+        # Latency histograms, in-flight gauges, response sizes and corpus gauges (all workers in multiprocess mode).
+        # The corpus gauges are set by the refresher - a scrape never syncs data
+        if request_metrics.enabled:
+            metrics += "\n" + request_metrics.render().decode("utf-8")
+        else:
+            metrics += f"""
+# HELP cybersecurity_articles_total Total number of cybersecurity articles
+# TYPE cybersecurity_articles_total gauge
+cybersecurity_articles_total {corpus_metrics["articles"]}
+
+# HELP cybersecurity_sources_total Total number of configured sources
+# TYPE cybersecurity_sources_total gauge
+cybersecurity_sources_total {corpus_metrics["sources"]}
+"""
 
         return metrics
         
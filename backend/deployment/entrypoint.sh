@@ -0,0 +1,12 @@
+#!/bin/sh
+# Production entrypoint: runs before gunicorn loads (and, with --preload, imports) the app.
+set -e
+
+# Prometheus multiprocess mode: prometheus_client reads this directory when the app is
+# imported, so metric files from a previous run must be gone before that happens
+PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/cyberx_prometheus}"
+export PROMETHEUS_MULTIPROC_DIR
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+exec "$@"
@@ -1,4 +1,5 @@
 # Gunicorn configuration for production
+import glob
 import multiprocessing
 import os
 
@@ -51,3 +52,30 @@ graceful_timeout = 30
 
 # Maximum time a worker can take to restart
 worker_timeout = 120
+
+# Shared article snapshot and search segments: one worker publishes them to tmpfs, every worker maps them read-only
+snapshot_shm_dir = os.getenv('SNAPSHOT_SHM_DIR') or '/dev/shm/cyberx'
+
+# Prometheus multiprocess mode: must be in the environment before the app imports prometheus_client.
+# Stale metric files are cleared by deployment/entrypoint.sh - on_starting runs after --preload has
+# already imported the app, so clearing the directory there would delete the master's live files
+prometheus_multiproc_dir = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/cyberx_prometheus')
+
+def on_starting(server):
+    """Drop snapshots and search segments published by a previous deployment so workers rebuild with the current code"""
+    published = [os.path.join(snapshot_shm_dir, 'news_snapshot.bin')]
+    published += glob.glob(os.path.join(snapshot_shm_dir, 'search_*.bin'))
+    for path in published:
+        if os.path.exists(path):
+            os.unlink(path)
+    
+    # Without the entrypoint (e.g. gunicorn started by hand) the directory may not exist yet
+    os.makedirs(prometheus_multiproc_dir, exist_ok=True)
+
+def child_exit(server, worker):
+    """Fold a dead worker's live gauges out of the aggregated metrics"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
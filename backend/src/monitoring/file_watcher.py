@@ -27,6 +27,9 @@ except ImportError:
     print("⚠️ Warning: Backup manager not available")
     BACKUP_AVAILABLE = False
 
+# Stdlib only, so always available
+from src.utils.alert_store import AlertStore
+
 
 class NewsFileWatcher(FileSystemEventHandler):
     def __init__(self, callback_function=None):
@@ -41,6 +44,9 @@ class NewsFileWatcher(FileSystemEventHandler):
         # Ensure alerts directory exists
         self.alerts_dir.mkdir(exist_ok=True)
         
+        # Shared with the API, which reads and marks alerts from the same database
+        self.alert_store = AlertStore(str(self.alerts_dir / "alerts.db"))
+        
         # Track file state
         self.last_known_articles: Set[str] = set()
         self.last_file_hash = ""
@@ -214,31 +220,13 @@ class NewsFileWatcher(FileSystemEventHandler):
                 print(f"⚠️ Error in callback function: {e}")
     
     def save_alert_to_log(self, alert_data: Dict):
-        """Save alert data to alerts log file"""
+        """Save alert data to the alert store"""
         try:
-            alerts_log_file = self.alerts_dir / "alerts_log.json"
-            
-            # Load existing alerts
-            alerts = []
-            if alerts_log_file.exists():
-                with open(alerts_log_file, 'r', encoding='utf-8') as f:
-                    alerts = json.load(f)
-            
-            # Add new alert
-            alerts.append(alert_data)
-            
-            # Keep only last 100 alerts
-            if len(alerts) > 100:
-                alerts = alerts[-100:]
-            
-            # Save back to file
-            with open(alerts_log_file, 'w', encoding='utf-8') as f:
-                json.dump(alerts, f, indent=2, default=str, ensure_ascii=False)
-                
-            print(f"💾 Alert saved to log file")
-            
+            # One indexed insert; the store keeps only the last 100 alerts
+            self.alert_store.add(alert_data)
+            print(f"💾 Alert saved to alert store")
         except Exception as e:
-            print(f"⚠️ Error saving alert to log: {e}")
+            print(f"⚠️ Error saving alert to store: {e}")
     
     def on_modified(self, event):
         """Handle file modification events"""
@@ -249,6 +237,15 @@ class NewsFileWatcher(FileSystemEventHandler):
             print(f"\n📄 File change detected: {event.src_path}")
             self.process_file_change()
     
+    def on_moved(self, event):
+        """Handle atomic publication (temp file renamed over the watched file)"""
+        if event.is_directory:
+            return
+        
+        if event.dest_path == str(self.summarized_file):
+            print(f"\n📄 File replaced: {event.dest_path}")
+            self.process_file_change()
+    
     def on_created(self, event):
         """Handle file creation events"""
         if event.is_directory:
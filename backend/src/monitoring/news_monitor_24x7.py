@@ -126,6 +126,9 @@ except ImportError as e:
     BACKUP_AVAILABLE = False
     URL_TRACKER_AVAILABLE = False
 
+# Stdlib only, so always available
+from atomic_io import atomic_write_json
+
 # Initialize colorama for Windows color support
 init(autoreset=True)
 
@@ -249,8 +252,7 @@ class NewsMonitor24x7:
                 'results': {}
             }
             
-            with open(self.daily_archive_file, 'w', encoding='utf-8') as f:
-                json.dump(initial_archive, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.daily_archive_file, initial_archive, indent=2, ensure_ascii=False)
             
             print(f"{Fore.GREEN}✅ Created daily archive with proper format: {self.daily_archive_file}")
         
@@ -331,8 +333,7 @@ class NewsMonitor24x7:
             'results': {}
         }
         
-        with open(self.live_output_file, 'w', encoding='utf-8') as f:
-            json.dump(initial_data, f, indent=2, ensure_ascii=False)
+        atomic_write_json(self.live_output_file, initial_data, indent=2, ensure_ascii=False)
         
         print(f"{Fore.GREEN}✅ Created initial live file: {self.live_output_file}")
     
@@ -506,8 +507,7 @@ class NewsMonitor24x7:
             live_data['monitoring_info']['total_articles'] = total_new_articles
             
             # 🚀 FLUSH: Completely replace live file content (no appending)
-            with open(self.live_output_file, 'w', encoding='utf-8') as f:
-                json.dump(live_data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.live_output_file, live_data, indent=2, ensure_ascii=False)
             
             print(f"{Fore.CYAN}🔄 Live file flushed! Now contains {total_new_articles} new articles only")
             print(f"{Fore.GREEN}📁 Previous articles archived in daily file, live file refreshed")
@@ -534,8 +534,7 @@ class NewsMonitor24x7:
                 'results': {}
             }
             
-            with open(self.live_output_file, 'w', encoding='utf-8') as f:
-                json.dump(empty_live_data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.live_output_file, empty_live_data, indent=2, ensure_ascii=False)
             
             print(f"{Fore.GREEN}🧹 Live file cleared after AI processing")
             
@@ -584,8 +583,7 @@ class NewsMonitor24x7:
             data['monitoring_info']['total_articles'] = total_articles
             
             # Save to live file
-            with open(self.live_output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.live_output_file, data, indent=2, ensure_ascii=False)
             
             print(f"{Fore.CYAN}💾 Saved to live file: {self.live_output_file}")
             
@@ -654,8 +652,7 @@ class NewsMonitor24x7:
                 archive_data['archive_info']['total_sites'] = successful_sites
             
             # Save to daily archive
-            with open(daily_archive, 'w', encoding='utf-8') as f:
-                json.dump(archive_data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(daily_archive, archive_data, indent=2, ensure_ascii=False)
             
             print(f"{Fore.GREEN}✅ Appended {sum(len(site['articles']) for site in new_articles.values())} new articles to daily archive: {daily_archive}")
             
@@ -678,8 +675,7 @@ class NewsMonitor24x7:
                 'results': {}
             }
             
-            with open(self.live_output_file, 'w', encoding='utf-8') as f:
-                json.dump(initial_data, f, indent=2, ensure_ascii=False)
+            atomic_write_json(self.live_output_file, initial_data, indent=2, ensure_ascii=False)
             
             print(f"{Fore.YELLOW}🧹 Cleared live file (ready for next articles)")
             
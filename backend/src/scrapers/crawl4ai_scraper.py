@@ -56,6 +56,9 @@ except ImportError:
     URL_TRACKER_AVAILABLE = False
     safe_print("⚠️ Warning: URL tracker not available in scraper")
 
+# Stdlib only, so always available
+from atomic_io import atomic_write_json
+
 class EnhancedCyberSecurityNewsScraper:
     def __init__(self):
         self.scraped_urls: Set[str] = set()
@@ -1339,8 +1342,7 @@ class EnhancedCyberSecurityNewsScraper:
                     live_data['last_updated'] = timestamp_str
                     
                     # Save updated data
-                    with open(live_file, 'w', encoding='utf-8') as f:
-                        json.dump(live_data, f, indent=2, ensure_ascii=False)
+                    atomic_write_json(live_file, live_data, indent=2, ensure_ascii=False)
                     
                     print(f"  💾 Article instantly saved to live feed: {article_data.get('title', '')[:50]}...")
                     return True
@@ -1452,8 +1454,7 @@ class EnhancedCyberSecurityNewsScraper:
                 "articles": []
             }
             
-            with open(live_file, 'w', encoding='utf-8') as f:
-                json.dump(empty_structure, f, indent=2, ensure_ascii=False)
+            atomic_write_json(live_file, empty_structure, indent=2, ensure_ascii=False)
             
             print(f"  🧹 Live feed cleared and reset for next scraping cycle")
             
@@ -1915,8 +1916,7 @@ class EnhancedCyberSecurityNewsScraper:
             os.makedirs(self.data_dir, exist_ok=True)
             
             try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(cleaned_results, f, indent=2, ensure_ascii=False)
+                atomic_write_json(output_file, cleaned_results, indent=2, ensure_ascii=False)
                 
                 print(f"💾 ✅ CRITICAL: Results saved to daily file: {output_file}")
                 safe_print(f"📊 Total articles in daily file: {cleaned_results['scraping_info']['total_articles']}")
@@ -0,0 +1,210 @@
+"""
+SQLite-backed alert store shared by the file watcher and the API.
+
+Replaces whole-file rewrites of alerts_log.json. Each alert is one row,
+indexed by timestamp and by read state, so listing a page, counting unread
+alerts and marking alerts read touch only the rows involved. WAL mode lets
+readers run while a writer appends. Writes use short IMMEDIATE transactions,
+so the watcher process and every API worker can write concurrently without
+losing updates. Stdlib only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+LEGACY_LOG_NAME = "alerts_log.json"
+
+# Same retention as the old JSON log
+DEFAULT_RETENTION = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0,
+    read_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_timestamp ON alerts (timestamp);
+CREATE INDEX IF NOT EXISTS idx_alerts_read_timestamp ON alerts (read, timestamp);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class AlertStore:
+    """Append-mostly alert log with an indexed read flag"""
+
+    def __init__(self, path: str, retention: int = DEFAULT_RETENTION, timeout: float = 5.0):
+        self.path = path
+        self.retention = retention
+        self.timeout = timeout
+        self._initialized = False
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = %d" % int(self.timeout * 1000))
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation: safe from any thread (API calls run in to_thread)
+        if not self._initialized:
+            self._initialize()
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._connection() as conn:
+            # Take the write lock up front so concurrent writers queue instead of failing mid-way
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _initialize(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._migrate_legacy_log(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        self._initialized = True
+
+    def _migrate_legacy_log(self, conn: sqlite3.Connection) -> None:
+        """
+        One-time import of alerts_log.json from the same directory (first process wins).
+        The JSON file is left in place; the meta flag alone keeps it from being imported twice.
+        """
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_migrated'").fetchone():
+            return
+        legacy_path = os.path.join(os.path.dirname(os.path.abspath(self.path)), LEGACY_LOG_NAME)
+        alerts: List[Dict[str, Any]] = []
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+                alerts = [alert for alert in loaded if isinstance(alert, dict)] if isinstance(loaded, list) else []
+            except (OSError, ValueError):
+                alerts = []
+        # Insert oldest first so retention keeps the newest alerts
+        alerts.sort(key=lambda alert: str(alert.get("timestamp") or ""))
+        self._insert(conn, alerts)
+        conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_migrated', ?)", (datetime.now().isoformat(),))
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _insert(self, conn: sqlite3.Connection, alerts: Iterable[Dict[str, Any]]) -> None:
+        rows = []
+        for alert in alerts:
+            data = {k: v for k, v in alert.items() if k not in ("read", "read_at")}
+            timestamp = str(alert.get("timestamp") or datetime.now().isoformat())
+            data["timestamp"] = timestamp
+            rows.append((timestamp, 1 if alert.get("read") else 0, alert.get("read_at"),
+                         json.dumps(data, default=str, ensure_ascii=False)))
+        if not rows:
+            return
+        conn.executemany("INSERT INTO alerts (timestamp, read, read_at, data) VALUES (?, ?, ?, ?)", rows)
+        # Retention: keep the newest `retention` alerts by insertion order
+        conn.execute(
+            "DELETE FROM alerts WHERE seq <= (SELECT MAX(seq) FROM alerts) - ?",
+            (self.retention,)
+        )
+
+    def add(self, alert: Dict[str, Any]) -> None:
+        with self._write() as conn:
+            self._insert(conn, [alert])
+
+    def mark_read(self, timestamps: Optional[Iterable[str]] = None) -> int:
+        """Mark the alerts with these timestamps (all unread alerts if None) as read; returns the count"""
+        read_at = datetime.now().isoformat()
+        with self._write() as conn:
+            if timestamps is None:
+                cursor = conn.execute("UPDATE alerts SET read = 1, read_at = ? WHERE read = 0", (read_at,))
+                return cursor.rowcount
+            modified = 0
+            for timestamp in set(timestamps):
+                cursor = conn.execute(
+                    "UPDATE alerts SET read = 1, read_at = ? WHERE timestamp = ? AND read = 0",
+                    (read_at, timestamp)
+                )
+                modified += cursor.rowcount
+            return modified
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _alert(row: sqlite3.Row) -> Dict[str, Any]:
+        alert = json.loads(row["data"])
+        alert["read"] = bool(row["read"])
+        if row["read_at"]:
+            alert["read_at"] = row["read_at"]
+        return alert
+
+    def page(self, offset: int, limit: int, unread_only: bool = False) -> List[Dict[str, Any]]:
+        """One page of alerts, newest first"""
+        where = "WHERE read = 0 " if unread_only else ""
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT data, read, read_at FROM alerts {where}ORDER BY timestamp DESC LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [self._alert(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        with self._connection() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+            unread = conn.execute("SELECT COUNT(*) FROM alerts WHERE read = 0").fetchone()[0]
+        return {"total": total, "unread": unread}
+
+    def daily_counts(self, days: int) -> Dict[str, int]:
+        """Alerts per day for the last `days` days (today included), oldest first"""
+        today = datetime.now().date()
+        first_day = today - timedelta(days=days - 1)
+        counts = {(first_day + timedelta(days=i)).isoformat(): 0 for i in range(days)}
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT substr(timestamp, 1, 10) AS day, COUNT(*) FROM alerts WHERE timestamp >= ? GROUP BY day",
+                (first_day.isoformat(),)
+            ).fetchall()
+        for day, count in rows:
+            if day in counts:
+                counts[day] = count
+        return counts
+
+    def count_since(self, timestamp: str) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM alerts WHERE timestamp >= ?", (timestamp,)).fetchone()[0]
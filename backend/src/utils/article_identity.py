@@ -0,0 +1,59 @@
+"""
+Deterministic article identity shared by the summarizer and the API.
+IDs are a truncated BLAKE2b of the canonical article URL, so every worker,
+restart and writer derives the same ID for the same article.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import urllib.parse
+from typing import Any, Dict
+
+ID_PREFIX = "article-"
+ID_DIGEST_BYTES = 8  # 64-bit ids: collisions stay negligible at archive scale
+
+
+def canonical_url(url: str) -> str:
+    """Canonical form of an article URL (case-folded scheme/host, no fragment or trailing slash)"""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    try:
+        parts = urllib.parse.urlsplit(url)
+    except ValueError:
+        return url
+    path = parts.path.rstrip("/") if parts.path not in ("", "/") else ""
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=ID_DIGEST_BYTES).hexdigest()
+
+
+def compute_article_id(article: Dict[str, Any]) -> str:
+    """Content-addressed ID from the canonical URL (falling back to the title, then the record)"""
+    url = canonical_url(article.get("url") or "")
+    if url:
+        return ID_PREFIX + _digest(url)
+
+    title = (article.get("title") or "").strip()
+    if title:
+        return ID_PREFIX + _digest("title:" + title)
+
+    return ID_PREFIX + _digest("record:" + json.dumps(article, sort_keys=True, default=str))
+
+
+def article_id(article: Dict[str, Any]) -> str:
+    """ID stored with the article at ingest, computed if the record predates stored IDs"""
+    stored = article.get("id")
+    if isinstance(stored, str) and stored.startswith(ID_PREFIX):
+        return stored
+    return compute_article_id(article)
+
+
+def ensure_article_id(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Stamp the deterministic ID onto an article record in place"""
+    article["id"] = article_id(article)
+    return article
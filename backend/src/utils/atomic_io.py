@@ -0,0 +1,119 @@
+"""
+Torn-write-safe publication of JSON data files.
+
+Writers serialize to a temp file in the same directory, fsync it and rename
+it over the target, so readers only ever see a complete old or new file.
+After each rename a monotonic version number is bumped in a `<file>.version`
+sidecar; readers key reloads on that number and therefore only react to
+completed writes. Stdlib only - shared by the scraper, monitor, summarizer
+and API.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: version bumps are not serialized across processes
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+VERSION_SUFFIX = ".version"
+TEMP_SUFFIX = ".tmp"
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def version_path(path: str) -> str:
+    return path + VERSION_SUFFIX
+
+
+def read_version(path: str) -> Optional[int]:
+    """Last completed version of a data file, or None if it has never been published atomically"""
+    try:
+        with open(version_path(path), "r", encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return None
+
+
+def _fsync_directory(directory: str) -> None:
+    # Makes the rename itself durable; not supported on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _target_mode(path: str) -> int:
+    """Mode for the published file: the existing file's, else what open() would create"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _replace(path: str, data: bytes) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Temp names end in .tmp so *.json watchers ignore the partial file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix="." + os.path.basename(path) + ".", suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; readers running as another uid need the usual permissions
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+@contextmanager
+def _version_lock(path: str) -> Iterator[None]:
+    if not FCNTL_AVAILABLE:
+        yield
+        return
+    fd = os.open(version_path(path) + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: str, data: bytes) -> int:
+    """Atomically replace `path` with `data`; returns the new version number"""
+    with _version_lock(path):
+        _replace(path, data)
+        # Clock-based but strictly increasing, so a lost or reset sidecar never reuses an old version
+        version = max((read_version(path) or 0) + 1, time.time_ns() // 1000)
+        _replace(version_path(path), str(version).encode("ascii"))
+    return version
+
+
+def atomic_write_json(path: str, obj: Any, **json_kwargs: Any) -> int:
+    """Serialize `obj` (json.dumps keyword arguments apply) and publish it atomically"""
+    return atomic_write_bytes(path, json.dumps(obj, **json_kwargs).encode("utf-8"))
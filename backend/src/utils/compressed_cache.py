@@ -0,0 +1,115 @@
+"""
+Precompressed response cache for hot read endpoints.
+Bodies are encoded once per data version (identity, gzip and, when the
+brotli module is installed, br) and served according to Accept-Encoding
+without any per-request compression.
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Server preference when the client accepts several encodings equally
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+# Headers that describe the encoded representation and must not be copied from the origin response
+_REPRESENTATION_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "vary"}
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Map of coding -> q-value from an Accept-Encoding header"""
+    accepted: Dict[str, float] = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class CompressedBody:
+    """One response body pre-encoded in every supported content coding"""
+
+    __slots__ = ("encodings", "media_type", "headers")
+
+    def __init__(self, body: bytes, media_type: str, headers: Dict[str, str], min_size: int):
+        self.media_type = media_type
+        self.headers = {k: v for k, v in headers.items() if k.lower() not in _REPRESENTATION_HEADERS}
+        self.encodings: Dict[str, bytes] = {"identity": body}
+        if len(body) >= min_size:
+            # mtime=0 keeps gzip output byte-identical across workers (stable for strong ETags)
+            self.encodings["gzip"] = gzip.compress(body, compresslevel=6, mtime=0)
+            if BROTLI_AVAILABLE:
+                self.encodings["br"] = brotli.compress(body, quality=5)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Tuple[str, bytes]:
+        """Pick the best available encoding the client accepts"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*")
+
+        best, best_q = "identity", -1.0
+        for coding in ENCODING_PREFERENCE:
+            if coding not in self.encodings:
+                continue
+            q = accepted.get(coding, wildcard if wildcard is not None else (1.0 if coding == "identity" else 0.0))
+            if q > best_q and q > 0:
+                best, best_q = coding, q
+        return best, self.encodings[best]
+
+
+class CompressedResponseCache:
+    """Bounded LRU of pre-encoded bodies keyed by (data version, request key)"""
+
+    def __init__(self, max_entries: int = 512, min_size: int = 512):
+        self.max_entries = max_entries
+        self.min_size = min_size
+        self._entries: "OrderedDict[Tuple[str, str], CompressedBody]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: str, key: str) -> Optional[CompressedBody]:
+        with self._lock:
+            entry = self._entries.get((version, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((version, key))
+            self.hits += 1
+            return entry
+
+    def put(self, version: str, key: str, body: bytes, media_type: str,
+            headers: Optional[Dict[str, str]] = None) -> CompressedBody:
+        # Compress outside the lock; only the dict update is serialized
+        entry = CompressedBody(body, media_type, headers or {}, self.min_size)
+        with self._lock:
+            self._entries[(version, key)] = entry
+            self._entries.move_to_end((version, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,148 @@
+"""
+Incrementally maintained corpus statistics for the status endpoints.
+
+Per-file article counts, per-source and per-day breakdowns are computed once
+per data file version and merged into running aggregates, so `/`,
+`/api/stats`, `/api/config` and `/api/news/sources` read precomputed numbers
+instead of parsing every archive on each request.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# Fields holding an article's timestamp, in order of preference
+DATE_FIELDS = ("publishedAt", "published_date", "scraped_at")
+
+
+def article_day(article: Dict[str, Any]) -> Optional[str]:
+    """'YYYY-MM-DD' of an article's first usable timestamp, or None if undated"""
+    for field in DATE_FIELDS:
+        value = article.get(field)
+        if isinstance(value, str) and DAY_RE.match(value):
+            return value[:10]
+    return None
+
+
+def _timestamp(article: Dict[str, Any]) -> str:
+    for field in DATE_FIELDS:
+        value = article.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return ""
+
+
+class FileStats:
+    """Counts for one version of one data file"""
+
+    __slots__ = ("version", "file_type", "size", "modified", "count",
+                 "by_source", "by_day", "source_latest", "recent")
+
+    def __init__(self, version: Any, file_type: str, size: int, modified: Any,
+                 articles: Iterable[Dict[str, Any]], source_id_func: Callable[[Dict[str, Any]], str],
+                 recent_count: int = 0):
+        self.version = version
+        self.file_type = file_type
+        self.size = size
+        self.modified = modified
+        self.count = 0
+        self.by_source: Counter = Counter()
+        self.by_day: Counter = Counter()
+        self.source_latest: Dict[str, str] = {}
+
+        dated = []
+        for article in articles:
+            if not isinstance(article, dict):
+                continue
+            self.count += 1
+            source_id = source_id_func(article) or "unknown"
+            self.by_source[source_id] += 1
+
+            day = article_day(article)
+            if day:
+                self.by_day[day] += 1
+
+            timestamp = _timestamp(article)
+            if timestamp > self.source_latest.get(source_id, ""):
+                self.source_latest[source_id] = timestamp
+            if recent_count:
+                dated.append((article.get("scraped_at") or "", article))
+
+        # Only the most recently scraped handful is kept, not the articles themselves
+        dated.sort(key=lambda item: item[0], reverse=True)
+        self.recent: List[Dict[str, Any]] = [article for _, article in dated[:recent_count]]
+
+    @property
+    def status(self) -> str:
+        return "healthy" if self.count > 0 else "empty"
+
+
+class CorpusStats:
+    """Running totals across data files, updated one file version at a time"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget everything, e.g. after the source configuration changed"""
+        self.files: Dict[str, FileStats] = {}
+        self.total = 0
+        self.by_source: Counter = Counter()
+        self.by_day: Counter = Counter()
+        self.errors: Dict[str, str] = {}
+        # Bumped on every change, so consumers can cache anything derived from the totals
+        self.generation = getattr(self, "generation", 0) + 1
+
+    def file_version(self, filename: str) -> Any:
+        stats = self.files.get(filename)
+        return stats.version if stats is not None else None
+
+    def file_names(self) -> List[str]:
+        return list(self.files)
+
+    def _subtract(self, stats: FileStats) -> None:
+        self.total -= stats.count
+        self.by_source.subtract(stats.by_source)
+        self.by_day.subtract(stats.by_day)
+        # Drop keys that fell to zero so the aggregates don't accumulate stale sources/days
+        self.by_source = +self.by_source
+        self.by_day = +self.by_day
+
+    def install(self, filename: str, stats: FileStats) -> None:
+        """Replace a file's contribution (cost is proportional to its sources and days, not articles)"""
+        previous = self.files.get(filename)
+        if previous is not None:
+            self._subtract(previous)
+        self.files[filename] = stats
+        self.total += stats.count
+        self.by_source.update(stats.by_source)
+        self.by_day.update(stats.by_day)
+        self.errors.pop(filename, None)
+        self.generation += 1
+
+    def remove(self, filename: str) -> None:
+        previous = self.files.pop(filename, None)
+        if previous is not None:
+            self._subtract(previous)
+        if previous is not None or self.errors.pop(filename, None) is not None:
+            self.generation += 1
+
+    def mark_error(self, filename: str, error: str) -> None:
+        """Record a file that could not be read; its last good counts (if any) are kept"""
+        if self.errors.get(filename) != error:
+            self.errors[filename] = error
+            self.generation += 1
+
+    def summary(self) -> Dict[str, int]:
+        statuses = Counter(stats.status for stats in self.files.values())
+        return {
+            "total_articles_across_all_files": self.total,
+            "total_data_files": len(self.files.keys() | self.errors.keys()),
+            "healthy_files": statuses["healthy"],
+            "empty_files": statuses["empty"],
+            "error_files": len(self.errors.keys() - self.files.keys())
+        }
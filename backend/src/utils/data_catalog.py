@@ -0,0 +1,94 @@
+"""
+In-memory catalog of file-system derived values (data file listings, parsed
+source configuration).
+
+A value is recomputed only after a change notification from a watcher
+(watchdog/inotify) or, when nothing is watching, at most once per poll
+interval. Between changes a read is a plain attribute access - no listdir,
+stat or parse per request.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class WatchedCache(Generic[T]):
+    """A computed value that is refreshed on invalidate() or, unwatched, by polling"""
+
+    def __init__(self, compute: Callable[[], T], signature: Optional[Callable[[], Any]] = None,
+                 poll_interval: float = 5.0):
+        self.compute = compute
+        # Cheap fingerprint (e.g. an mtime) checked when polling; without one, polling recomputes
+        self.signature = signature
+        self.poll_interval = poll_interval
+        self.watched = False
+        self.generation = 0
+
+        self._value: Optional[T] = None
+        self._signature: Any = None
+        self._dirty = True
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Mark the value stale - safe to call from a watcher thread"""
+        self._dirty = True
+
+    def set_watched(self, watched: bool) -> None:
+        """While a watcher delivers invalidate() calls, polling is switched off"""
+        self.watched = watched
+        self._dirty = True
+
+    def _due_for_poll(self) -> bool:
+        if self.watched:
+            return False
+        now = time.monotonic()
+        if now - self._checked < self.poll_interval:
+            return False
+        self._checked = now
+        if self.signature is None:
+            return True
+        return self.signature() != self._signature
+
+    def get(self) -> T:
+        if self._dirty or self._due_for_poll():
+            with self._lock:
+                # Cleared before computing, so an invalidation arriving meanwhile is not lost
+                self._dirty = False
+                if self.signature is not None:
+                    self._signature = self.signature()
+                self._value = self.compute()
+                self._checked = time.monotonic()
+                self.generation += 1
+        return self._value
+
+
+def scan_directory(directory: str, suffix: str, classify: Callable[[str], str]) -> Dict[str, Dict[str, Any]]:
+    """Metadata for every `suffix` file in `directory` (one listdir, one stat per file)"""
+    files: Dict[str, Dict[str, Any]] = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return files
+
+    for entry in entries:
+        if not entry.name.endswith(suffix) or not entry.is_file():
+            continue
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue  # removed between listing and stat
+        files[entry.name] = {
+            "path": entry.path,
+            "size": stat.st_size,
+            "modified": datetime.fromtimestamp(stat.st_mtime),
+            "type": classify(entry.name)
+        }
+    return files
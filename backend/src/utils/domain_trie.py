@@ -0,0 +1,68 @@
+"""
+Reversed-label domain trie for source attribution.
+
+Configured source domains are stored label by label from the TLD down
+(`com -> bleepingcomputer`), so resolving a host walks at most as many nodes
+as the host has labels and returns the longest configured suffix - e.g.
+`news.example.co.uk` resolves to `example.co.uk` before `co.uk`.
+"""
+
+from __future__ import annotations
+
+import urllib.parse
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_VALUE = object()  # key of the value slot inside a node dict; never clashes with a label
+
+
+def host_of(url: str) -> str:
+    """Lower-case host name of a URL (or of a bare domain), without a leading www."""
+    if "//" not in url:
+        url = "//" + url
+    try:
+        host = urllib.parse.urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+    host = host.rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+class DomainTrie(Generic[T]):
+    """Longest-suffix lookup from host name to the value of a configured domain"""
+
+    def __init__(self, items: Iterable[Tuple[str, T]] = ()):
+        self._root: Dict[Any, Any] = {}
+        self.size = 0
+        for domain, value in items:
+            self.insert(domain, value)
+
+    def insert(self, domain: str, value: T) -> None:
+        """Map `domain` (and all its subdomains) to `value`; the first insert of a domain wins"""
+        labels = host_of(domain).split(".")
+        if not labels or not labels[0]:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        if _VALUE not in node:
+            node[_VALUE] = value
+            self.size += 1
+
+    def lookup(self, host: str) -> Optional[T]:
+        """Value of the longest configured domain that equals `host` or is a parent of it"""
+        node = self._root
+        found = None
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(_VALUE, found)
+        return found
+
+    def lookup_url(self, url: str) -> Optional[T]:
+        return self.lookup(host_of(url)) if url else None
+
+    def __len__(self) -> int:
+        return self.size
@@ -0,0 +1,43 @@
+"""
+Fast JSON encoding for API responses built from trusted, pre-normalized data.
+Uses orjson when installed and falls back to the stdlib encoder.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def splice_array(envelope: Dict[str, Any], key: str, fragments: Iterable[bytes]) -> bytes:
+    """
+    Serialize `envelope` with `key` set to a JSON array of already-encoded
+    fragments, without decoding or re-encoding them.
+    """
+    head = dumps({**{k: v for k, v in envelope.items() if k != key}, key: None})
+    placeholder = b"null}"
+    if not head.endswith(placeholder):
+        raise ValueError("unexpected envelope encoding")
+    return head[:-len(placeholder)] + b"[" + b",".join(fragments) + b"]}"
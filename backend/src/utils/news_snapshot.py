@@ -0,0 +1,454 @@
+"""
+Snapshot of summarized_news_hf.json.
+Built once per file version: articles are normalized to the ArticleResponse
+shape, pre-sorted newest-first and encoded into one compact, immutable
+buffer, so feed requests only need to slice. The buffer can be published
+to a shared-memory file and mapped read-only by every worker.
+"""
+
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+import struct
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.article_identity import canonical_url
+from src.utils.fast_json import dumps, loads
+
+# Encoded layout: header (magic, version, index length, sources key) | JSON index | per-record blobs.
+# Each record blob is its feed JSON followed by a table of member lengths and one
+# pre-encoded `"field":value` member per PROJECTABLE_FIELDS entry.
+SNAPSHOT_MAGIC = b"CYXSNAP3"
+_HEADER = struct.Struct("<8sdQ16s")
+
+# Fields a client may select with ?fields= (feed fields first, then detail-only fields)
+FEED_FIELDS = ("id", "source", "title", "summary", "url", "urlToImage", "publishedAt", "domain")
+PROJECTABLE_FIELDS = FEED_FIELDS + ("content", "description", "author", "word_count", "scraped_at")
+DETAIL_FIELDS = ("id", "source", "title", "summary", "content", "url", "urlToImage",
+                 "publishedAt", "author", "word_count", "domain")
+
+# Change log carried from snapshot to snapshot for /api/news/changes: bounded by versions and ids
+MAX_CHANGE_LOG_ENTRIES = 100
+MAX_CHANGE_LOG_IDS = 20000
+
+_FIELD_POSITION = {field: i for i, field in enumerate(PROJECTABLE_FIELDS)}
+_MEMBER_TABLE = struct.Struct(f"<{len(PROJECTABLE_FIELDS)}I")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ?fields= value into a tuple of known fields (request order,
+    duplicates dropped). None means "default shape"; raises ValueError on unknown fields.
+    """
+    if fields is None or not fields.strip():
+        return None
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in _FIELD_POSITION]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return requested
+
+
+def project_record(record: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Sparse fieldset of an already-decoded record (fields it lacks are omitted)"""
+    return {field: record[field] for field in fields if field in record}
+
+
+def _text(value: Any) -> str:
+    """Coerce optional/None article fields to strings"""
+    return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+def _domain_from_url(url: str) -> str:
+    return url.replace("https://", "").replace("http://", "").split("/")[0]
+
+
+def field_values(article: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    """Every projectable field: the normalized feed record plus the detail-only fields"""
+    word_count = article.get("word_count", 0)
+    return {
+        **record,
+        "content": _text(article.get("content")),
+        "description": _text(article.get("description")),
+        "author": _text(article.get("author")),
+        "word_count": word_count if isinstance(word_count, int) else 0,
+        "scraped_at": _text(article.get("scraped_at")),
+    }
+
+
+def normalize_article(article: Dict[str, Any], id_func: Callable[[Dict[str, Any]], str],
+                      source_id_func: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+    """Normalize a summarized article to the ArticleResponse shape, stamping its source id"""
+    raw_source = article.get("source")
+    if isinstance(raw_source, dict):
+        source = dict(raw_source)
+    else:
+        source = {"name": _text(raw_source) or "Unknown", "url": ""}
+    source["id"] = source.get("id") or source_id_func(article) or "unknown"
+
+    return {
+        "id": id_func(article),
+        "source": source,
+        "title": _text(article.get("title")),
+        "summary": _text(article.get("summary") or article.get("description")),
+        "url": _text(article.get("url")),
+        "urlToImage": _text(article.get("urlToImage") or article.get("main_image")),
+        "publishedAt": _text(article.get("publishedAt") or article.get("scraped_at")),
+        "domain": _text(article.get("domain")) or _domain_from_url(_text(source.get("url"))),
+    }
+
+
+def sort_key(article: Dict[str, Any]) -> Tuple[str, str]:
+    """Feed ordering key - (publishedAt, id), compared descending"""
+    return (article["publishedAt"], article["id"])
+
+
+def encode_cursor(version: float, article: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just past `article` in feed order"""
+    payload = json.dumps([version, article["publishedAt"], article["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def encode_version_token(version: float, sources_key: str = "") -> str:
+    """Opaque token naming a snapshot revision, for /api/news/changes?since="""
+    payload = json.dumps([version, sources_key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_version_token(token: str) -> Tuple[float, str]:
+    """Decode a version token into (version, sources key); raises ValueError if malformed"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        version, *sources_key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        # Tokens issued before the source configuration was part of the revision carry no key
+        sources_key = sources_key[0] if sources_key else ""
+        if not isinstance(sources_key, str):
+            raise TypeError("sources key must be a string")
+        return float(version), sources_key
+    except Exception as e:
+        raise ValueError(f"Invalid version token: {e}") from None
+
+
+def decode_cursor(cursor: str) -> Tuple[float, Tuple[str, str]]:
+    """Decode a cursor into (snapshot version, sort key); raises ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        version, published_at, article_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(published_at, str) or not isinstance(article_id, str):
+            raise TypeError("cursor key must be strings")
+        return float(version), (published_at, article_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from None
+
+
+def encode_snapshot(raw_articles: List[Dict[str, Any]], version: float,
+                    id_func: Callable[[Dict[str, Any]], str],
+                    source_id_func: Callable[[Dict[str, Any]], str],
+                    previous: Optional["NewsSnapshot"] = None, sources_key: str = "") -> bytes:
+    """
+    Normalize, sort and encode raw articles into the immutable snapshot format.
+    `sources_key` identifies the source configuration the source ids were resolved
+    with; a snapshot is rebuilt when either the file version or that key changes.
+    With `previous`, the diff against it is appended to the carried-over change log.
+    """
+    records = []
+    for article in raw_articles:
+        if not isinstance(article, dict):
+            continue
+        record = normalize_article(article, id_func, source_id_func)
+        records.append((record, article))
+
+    # Newest first; id breaks ties so the order is total and stable across builds
+    records.sort(key=lambda pair: sort_key(pair[0]), reverse=True)
+    
+    # Ids are derived from the canonical URL, so a re-summarized article can appear twice.
+    # Keep only its newest copy (the sort is stable: on equal dates, the first in the file)
+    seen_ids = set()
+    unique_records = []
+    for record, article in records:
+        if record["id"] not in seen_ids:
+            seen_ids.add(record["id"])
+            unique_records.append((record, article))
+    records = unique_records
+
+    # Each record is encoded to JSON once here; responses splice these bytes directly
+    blobs = bytearray()
+    entries = []
+    upserted: List[str] = []
+    for record, article in records:
+        feed = dumps(record)
+        if previous is not None and previous.feed_fragment(record["id"]) != feed:
+            upserted.append(record["id"])
+        values = field_values(article, record)
+        members = [dumps(field) + b":" + dumps(values[field]) for field in PROJECTABLE_FIELDS]
+        entries.append([
+            record["id"], record["publishedAt"], record["source"]["id"],
+            _text(record["source"].get("url")), canonical_url(record["url"]),
+            len(blobs), len(feed), len(blobs) + len(feed),
+        ])
+        blobs += feed
+        blobs += _MEMBER_TABLE.pack(*(len(member) for member in members))
+        for member in members:
+            blobs += member
+
+    changes: List[Dict[str, Any]] = []
+    revision = [float(version), sources_key]
+    if previous is not None and list(previous.revision) != revision:
+        current_ids = {entry[0] for entry in entries}
+        removed = [article_id for article_id in previous.article_ids() if article_id not in current_ids]
+        changes = previous.changes + [{
+            "from": list(previous.revision), "to": revision,
+            "added": list(dict.fromkeys(upserted)), "removed": removed,
+        }]
+        changes = changes[-MAX_CHANGE_LOG_ENTRIES:]
+        # Drop the oldest history first when the log grows too large; clients behind it get a reset
+        while changes and sum(len(c["added"]) + len(c["removed"]) for c in changes) > MAX_CHANGE_LOG_IDS:
+            changes.pop(0)
+
+    index = dumps({"built_at": time.time(), "entries": entries, "changes": changes})
+    header = _HEADER.pack(SNAPSHOT_MAGIC, float(version), len(index), sources_key.encode("ascii"))
+    return header + index + bytes(blobs)
+
+
+def snapshot_revision(buffer: Any) -> Optional[Tuple[float, str]]:
+    """(version, sources key) stamped in an encoded snapshot header, or None if it isn't one"""
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, version, _, sources_key = _HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        return None
+    return version, sources_key.rstrip(b"\0").decode("ascii")
+
+
+class SortedArticleList:
+    """Articles in feed order (newest first) with offset and keyset access"""
+
+    def __init__(self, articles: List[Dict[str, Any]]):
+        self.articles = articles
+        # Ascending copy of the sort keys for bisect (the feed itself is descending)
+        self._asc_keys = [sort_key(a) for a in reversed(articles)]
+
+    def page(self, page: int, limit: int) -> List[Dict[str, Any]]:
+        """Return one page (1-based) of articles"""
+        start_idx = (page - 1) * limit
+        return self.articles[start_idx:start_idx + limit]
+
+    def after(self, key: Tuple[str, str], limit: int) -> List[Dict[str, Any]]:
+        """Return up to `limit` articles strictly older than `key` - O(log n) seek"""
+        # Items with a smaller key sit at the tail of the descending feed
+        older = bisect_left(self._asc_keys, key)
+        start_idx = len(self.articles) - older
+        return self.articles[start_idx:start_idx + limit]
+
+    def has_more_after(self, article: Dict[str, Any]) -> bool:
+        return bisect_left(self._asc_keys, sort_key(article)) > 0
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+
+class NewsSnapshot:
+    """
+    Immutable, pre-sorted view of the summarized articles for one file version
+    and source configuration (its revision).
+
+    Backed by one encoded buffer (see encode_snapshot): a small index of
+    (id, publishedAt, source, offsets) kept in-process, plus the JSON
+    fragments for the feed and detail views. The buffer may be a bytes
+    object or a read-only mmap shared by every worker on the host.
+    """
+
+    # Bound on memoized ?source= substring views per snapshot
+    MAX_SOURCE_VIEWS = 64
+
+    def __init__(self, buffer: Any):
+        magic, version, index_len, sources_key = _HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("not an encoded news snapshot")
+        index = loads(bytes(buffer[_HEADER.size:_HEADER.size + index_len]))
+
+        self._buffer = buffer
+        self._blob_start = _HEADER.size + index_len
+        self.version = version
+        self.sources_key = sources_key.rstrip(b"\0").decode("ascii")
+        self.built_at = index["built_at"]
+        # Append-only history of (from version -> to version, added/updated ids, removed ids)
+        self.changes: List[Dict[str, Any]] = index.get("changes", [])
+
+        # Index entries: just what ordering, partitioning and lookups need, newest first
+        articles: List[Dict[str, Any]] = []
+        self._locations: Dict[str, Tuple[int, int, int]] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_url: Dict[str, str] = {}
+        for article_id, published_at, source_id, source_url, url_key, *location in index["entries"]:
+            articles.append({
+                "id": article_id,
+                "publishedAt": published_at,
+                "source": {"id": source_id, "url": source_url},
+            })
+            # encode_snapshot writes each id once
+            self._locations[article_id] = tuple(location)
+            self._by_id[article_id] = articles[-1]
+            if url_key:
+                self.by_url.setdefault(url_key, article_id)
+
+        self.feed = SortedArticleList(articles)
+        self.articles = articles
+        self.total = len(articles)
+        self.sources_available = len({a["source"]["url"] for a in articles})
+
+        # Per-source partitions; filled in feed order so each one is already sorted
+        partitions: Dict[str, List[Dict[str, Any]]] = {}
+        self.source_urls: Dict[str, str] = {}
+        for article in articles:
+            source_id = article["source"]["id"]
+            partitions.setdefault(source_id, []).append(article)
+            self.source_urls.setdefault(source_id, article["source"]["url"].lower())
+        self.by_source: Dict[str, SortedArticleList] = {
+            source_id: SortedArticleList(items) for source_id, items in partitions.items()
+        }
+        self._source_views: Dict[str, SortedArticleList] = {}
+
+    @classmethod
+    def build(cls, raw_articles: List[Dict[str, Any]], version: float,
+              id_func: Callable[[Dict[str, Any]], str],
+              source_id_func: Callable[[Dict[str, Any]], str], sources_key: str = "") -> "NewsSnapshot":
+        """Normalize, sort and encode raw articles into a new in-process snapshot"""
+        return cls(encode_snapshot(raw_articles, version, id_func, source_id_func, sources_key=sources_key))
+
+    @property
+    def revision(self) -> Tuple[float, str]:
+        """(file version, source configuration key) - what the snapshot was built from"""
+        return self.version, self.sources_key
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+    def _blob(self, offset: int, length: int) -> bytes:
+        start = self._blob_start + offset
+        return bytes(self._buffer[start:start + length])
+
+    def _members(self, members_offset: int, fields: Tuple[str, ...]) -> bytes:
+        """Assemble a JSON object from the pre-encoded members of the requested fields"""
+        start = self._blob_start + members_offset
+        lengths = _MEMBER_TABLE.unpack_from(self._buffer, start)
+        starts = []
+        position = start + _MEMBER_TABLE.size
+        for length in lengths:
+            starts.append(position)
+            position += length
+        buffer = self._buffer
+        return b"{" + b",".join(
+            buffer[starts[i]:starts[i] + lengths[i]] for i in (_FIELD_POSITION[f] for f in fields)
+        ) + b"}"
+
+    def _resolve(self, key: str) -> Optional[Tuple[int, int, int]]:
+        location = self._locations.get(key)
+        if location is None:
+            article_id = self.by_url.get(canonical_url(key))
+            location = self._locations.get(article_id) if article_id else None
+        return location
+
+    def fragments(self, articles: List[Dict[str, Any]],
+                  fields: Optional[Tuple[str, ...]] = None) -> List[bytes]:
+        """Pre-encoded JSON for a page of snapshot records, optionally projected to `fields`"""
+        if fields is None:
+            return [self._blob(*self._locations[article["id"]][:2]) for article in articles]
+        return [self._members(self._locations[article["id"]][2], fields) for article in articles]
+
+    def detail_fragment(self, key: str, fields: Optional[Tuple[str, ...]] = None) -> Optional[bytes]:
+        """Pre-encoded full article (including content) by id or URL - O(1)"""
+        location = self._resolve(key)
+        return self._members(location[2], fields or DETAIL_FIELDS) if location else None
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Find an article by id or URL - O(1)"""
+        fragment = self.detail_fragment(key)
+        return loads(fragment) if fragment else None
+
+    def get_by_id(self, article_id: str) -> Optional[Dict[str, Any]]:
+        location = self._locations.get(article_id)
+        return loads(self._members(location[2], DETAIL_FIELDS)) if location else None
+
+    def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
+        article_id = self.by_url.get(canonical_url(url))
+        return self.get_by_id(article_id) if article_id else None
+
+    def iter_details(self) -> Iterator[Dict[str, Any]]:
+        """Decode full articles (every projectable field) one at a time, in feed order"""
+        for location in self._locations.values():
+            yield loads(self._members(location[2], PROJECTABLE_FIELDS))
+
+    def source_partition(self, source_id: str) -> SortedArticleList:
+        """Pre-sorted articles for one source id (empty if the source has none)"""
+        return self.by_source.get(source_id.lower()) or SortedArticleList([])
+
+    def source_view(self, source: str) -> SortedArticleList:
+        """
+        Articles for a ?source= filter: an exact source id, or otherwise every
+        partition whose source URL contains the filter (legacy behaviour).
+        """
+        source = source.lower()
+        if source in self.by_source:
+            return self.by_source[source]
+
+        view = self._source_views.get(source)
+        if view is None:
+            matching = [
+                self.by_source[source_id].articles
+                for source_id, url in self.source_urls.items()
+                if source in url
+            ]
+            # Partitions are individually sorted, so a k-way merge keeps feed order
+            view = SortedArticleList(list(heapq.merge(*matching, key=sort_key, reverse=True)))
+            if len(self._source_views) < self.MAX_SOURCE_VIEWS:
+                self._source_views[source] = view
+        return view
+
+    def feed_fragment(self, article_id: str) -> Optional[bytes]:
+        location = self._locations.get(article_id)
+        return self._blob(*location[:2]) if location else None
+
+    def article_ids(self) -> Iterator[str]:
+        return iter(self._locations)
+
+    def changes_since(self, version: float, sources_key: str = "") -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        Net (added or updated articles in feed order, removed ids) between the revision
+        (`version`, `sources_key`) and this snapshot, or None when the change log does
+        not reach back that far.
+        """
+        revision = [version, sources_key]
+        if revision == list(self.revision):
+            return [], []
+        start = next((i for i, change in enumerate(self.changes) if change["from"] == revision), None)
+        if start is None:
+            return None
+
+        added: Dict[str, None] = {}
+        removed: Dict[str, None] = {}
+        for change in self.changes[start:]:
+            for article_id in change["added"]:
+                added[article_id] = None
+                removed.pop(article_id, None)
+            for article_id in change["removed"]:
+                removed[article_id] = None
+                added.pop(article_id, None)
+
+        added_articles = [self._by_id[article_id] for article_id in added if article_id in self._by_id]
+        added_articles.sort(key=sort_key, reverse=True)
+        return added_articles, list(removed)
+
+    def next_cursor(self, articles: SortedArticleList, page: List[Dict[str, Any]]) -> Optional[str]:
+        """Cursor for the page following `page`, or None when the feed is exhausted"""
+        if not page or not articles.has_more_after(page[-1]):
+            return None
+        return encode_cursor(self.version, page[-1])
+
+    def __len__(self) -> int:
+        return self.total
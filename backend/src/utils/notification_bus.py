@@ -0,0 +1,153 @@
+"""
+Cross-worker broadcast bus for push notifications.
+A message published by any worker reaches the subscribers of every worker
+through Redis pub/sub. Without Redis (not installed or unreachable) delivery
+falls back to the subscribers of the publishing process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger("notification_bus")
+
+
+async def _close_client(client: Any) -> None:
+    close = getattr(client, "aclose", None) or client.close
+    try:
+        await close()
+    except Exception:
+        pass
+
+
+class NotificationBus:
+    """Fan-out of notification messages to per-connection queues on every worker"""
+
+    def __init__(self, redis_url: Optional[str] = None, channel: str = "cyberx:notifications",
+                 queue_size: int = 100, timeout: float = 0.25, retry_interval: float = 15.0):
+        self.redis_url = redis_url
+        self.channel = channel
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self.connected = False  # this worker's listener is attached to the Redis channel
+
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._publisher = None
+        self._down_until = 0.0
+
+    # ------------------------------------------------------------------
+    # Subscribers (one queue per connected client)
+    # ------------------------------------------------------------------
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _deliver(self, message: Dict[str, Any]) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Slow consumer: drop its oldest message rather than block the bus
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def _redis_usable(self) -> bool:
+        return REDIS_AVAILABLE and bool(self.redis_url) and time.time() >= self._down_until
+
+    def _mark_down(self, error: Exception) -> None:
+        self._down_until = time.time() + self.retry_interval
+        logger.warning(f"Notification bus Redis unavailable, delivering locally for {self.retry_interval}s: {error}")
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        """Publish once; every connected client on every worker receives it"""
+        published = False
+        if self._redis_usable():
+            try:
+                if self._publisher is None:
+                    self._publisher = aioredis.from_url(
+                        self.redis_url, decode_responses=True,
+                        socket_timeout=self.timeout, socket_connect_timeout=self.timeout
+                    )
+                await self._publisher.publish(self.channel, json.dumps(message, default=str))
+                published = True
+            except Exception as e:
+                self._mark_down(e)
+
+        # Our own listener delivers Redis messages; deliver directly if it can't
+        if not (published and self.connected):
+            self._deliver(message)
+
+    # ------------------------------------------------------------------
+    # Redis listener
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._listener is None and REDIS_AVAILABLE and self.redis_url:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        publisher, self._publisher = self._publisher, None
+        if publisher is not None:
+            await _close_client(publisher)
+
+    async def _listen(self) -> None:
+        while True:
+            client = None
+            try:
+                # Dedicated connection without a read timeout - it blocks waiting for messages
+                client = aioredis.from_url(self.redis_url, decode_responses=True,
+                                           socket_connect_timeout=self.timeout)
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self.channel)
+                self.connected = True
+                logger.info(f"Notification bus subscribed to {self.channel}")
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        self._deliver(json.loads(message["data"]))
+                    except (TypeError, ValueError):
+                        continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._mark_down(e)
+            finally:
+                self.connected = False
+                if client is not None:
+                    await _close_client(client)
+            await asyncio.sleep(self.retry_interval)
@@ -0,0 +1,113 @@
+"""
+Bounded, cross-worker notification log with monotonically increasing IDs.
+Backed by a Redis stream (XADD MAXLEN) when Redis is reachable, otherwise by
+an in-process ring buffer using the same `<ms>-<seq>` ID format. Clients keep
+their own cursor and ask only for entries after it, so reads are O(new) and
+reading never removes anything for other clients.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+EntryId = Tuple[int, int]
+
+
+def parse_entry_id(entry_id: str) -> EntryId:
+    """'<ms>-<seq>' (or a bare '<ms>') -> comparable tuple; raises ValueError if malformed"""
+    ms, _, seq = str(entry_id).partition("-")
+    try:
+        parsed = (int(ms), int(seq or 0))
+    except ValueError:
+        raise ValueError(f"Invalid notification id: {entry_id!r}") from None
+    if parsed[0] < 0 or parsed[1] < 0:
+        raise ValueError(f"Invalid notification id: {entry_id!r}")
+    return parsed
+
+
+class NotificationLog:
+    """Ring buffer of notifications shared by every worker (Redis stream or local fallback)"""
+
+    def __init__(self, get_redis: Optional[Callable[[], Awaitable[Any]]] = None,
+                 on_error: Optional[Callable[[Exception, str], None]] = None,
+                 key: str = "cyberx:notifications:log", maxlen: int = 500):
+        self.get_redis = get_redis
+        self.on_error = on_error
+        self.key = key
+        self.maxlen = maxlen
+        self._local: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+        self._last_local: EntryId = (0, 0)
+
+    async def _redis(self) -> Any:
+        return await self.get_redis() if self.get_redis is not None else None
+
+    def _error(self, error: Exception, operation: str) -> None:
+        if self.on_error is not None:
+            self.on_error(error, operation)
+
+    def _next_local_id(self) -> str:
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = self._last_local
+        self._last_local = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+        return f"{self._last_local[0]}-{self._last_local[1]}"
+
+    @staticmethod
+    def _from_stream(entries: List[Tuple[str, Dict[str, str]]]) -> List[Dict[str, Any]]:
+        notifications = []
+        for entry_id, fields in entries:
+            try:
+                notification = json.loads(fields.get("data", "{}"))
+            except ValueError:
+                continue
+            notification["id"] = entry_id
+            notifications.append(notification)
+        return notifications
+
+    async def append(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a notification; returns it with its assigned id"""
+        payload = json.dumps(notification, default=str)
+        redis = await self._redis()
+        if redis is not None:
+            try:
+                entry_id = await redis.xadd(self.key, {"data": payload}, maxlen=self.maxlen, approximate=True)
+                return {**notification, "id": entry_id}
+            except Exception as e:
+                self._error(e, "notification log append")
+
+        entry = {**notification, "id": self._next_local_id()}
+        self._local.append(entry)
+        return entry
+
+    async def read_after(self, after: str, count: int) -> List[Dict[str, Any]]:
+        """Up to `count` entries newer than `after`, oldest first"""
+        cursor = parse_entry_id(after)
+        redis = await self._redis()
+        if redis is not None:
+            try:
+                # XREAD returns entries strictly greater than the given id
+                result = await redis.xread({self.key: f"{cursor[0]}-{cursor[1]}"}, count=count)
+                return self._from_stream(result[0][1]) if result else []
+            except Exception as e:
+                self._error(e, "notification log read")
+
+        newer = []
+        for entry in reversed(self._local):
+            if parse_entry_id(entry["id"]) <= cursor:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer[:count]
+
+    async def latest(self, count: int) -> List[Dict[str, Any]]:
+        """The newest `count` entries, newest first"""
+        redis = await self._redis()
+        if redis is not None:
+            try:
+                return self._from_stream(await redis.xrevrange(self.key, count=count))
+            except Exception as e:
+                self._error(e, "notification log read")
+        return list(islice(reversed(self._local), count))
@@ -0,0 +1,100 @@
+"""
+Prometheus request metrics for the API.
+
+Latency histograms and response-size summaries labelled by route template
+(not raw path, so /api/article/{encoded_url} is one series) and status
+class, an in-flight gauge per method, and corpus size gauges set when the
+data changes. When PROMETHEUS_MULTIPROC_DIR is set (gunicorn) every worker
+writes to its own mmap'd files there and a scrape of any worker aggregates
+all of them. Without prometheus_client the collector is a no-op.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+try:
+    from prometheus_client import REGISTRY, CollectorRegistry, Gauge, Histogram, Summary, generate_latest
+    from prometheus_client import multiprocess
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    REGISTRY = CollectorRegistry = Gauge = Histogram = Summary = generate_latest = multiprocess = None
+    PROMETHEUS_AVAILABLE = False
+
+# Read by prometheus_client when it is imported, so it must be set before the app loads
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or os.environ.get("prometheus_multiproc_dir")
+
+# Cache hits land in the first buckets, full rebuilds and exports in the last ones
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LABELS = ("method", "route", "status_class")
+
+
+def status_class(status_code: int) -> str:
+    return f"{status_code // 100}xx"
+
+
+class RequestMetrics:
+    """Per-route request instrumentation shared by all workers"""
+
+    def __init__(self):
+        self.enabled = PROMETHEUS_AVAILABLE
+        self.multiprocess = bool(self.enabled and MULTIPROC_DIR)
+        if not self.enabled:
+            return
+
+        if self.multiprocess:
+            os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+        self.duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency by route template",
+            LABELS, buckets=LATENCY_BUCKETS
+        )
+        # Labelled by method only: the route is not known until the request has been routed
+        self.in_progress = Gauge(
+            "http_requests_in_progress", "HTTP requests currently being served",
+            ("method",), multiprocess_mode="livesum"
+        )
+        self.response_size = Summary(
+            "http_response_size_bytes", "HTTP response body size by route template", LABELS
+        )
+        # Every worker derives the same numbers; report the latest value from a live one
+        self.articles = Gauge(
+            "cybersecurity_articles_total", "Total number of cybersecurity articles",
+            multiprocess_mode="livemostrecent"
+        )
+        self.sources = Gauge(
+            "cybersecurity_sources_total", "Total number of configured sources",
+            multiprocess_mode="livemostrecent"
+        )
+
+    def started(self, method: str) -> None:
+        if self.enabled:
+            self.in_progress.labels(method).inc()
+
+    def finished(self, method: str, route: str, status_code: int, duration: float,
+                 size: Optional[int] = None) -> None:
+        if not self.enabled:
+            return
+        self.in_progress.labels(method).dec()
+        labels = (method, route, status_class(status_code))
+        self.duration.labels(*labels).observe(duration)
+        if size is not None:
+            # Streamed responses have no Content-Length and are not sized
+            self.response_size.labels(*labels).observe(size)
+
+    def set_corpus(self, articles: int, sources: int) -> None:
+        if self.enabled:
+            self.articles.set(articles)
+            self.sources.set(sources)
+
+    def render(self) -> bytes:
+        """Prometheus text exposition - aggregated over every worker in multiprocess mode"""
+        if not self.enabled:
+            return b""
+        if self.multiprocess:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry)
+        return generate_latest(REGISTRY)
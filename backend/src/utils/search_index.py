@@ -0,0 +1,489 @@
+"""
+Inverted index for /api/news/search, plus the per-source article lists that
+/api/news/source/{source_id} merges across data files.
+
+Each data file is indexed as its own segment, so when a file changes only
+that segment is rebuilt. Queries are scored with field-weighted BM25
+(BM25F) using corpus statistics summed across segments, and only the
+top-k hits are materialized.
+
+A segment is one immutable buffer (see encode_segment): term dictionary,
+postings, field lengths and per-document references. Like the article
+snapshot, it is built once per host and published to tmpfs, and every
+worker maps it read-only, so N workers hold one copy of the postings.
+Segments of summarized_news_hf.json hold no records at all - documents are
+snapshot article ids, and hits are materialized from the mapped
+NewsSnapshot they were built from. Segments of the live/archive files,
+which are not part of the snapshot, carry their feed records pre-encoded.
+
+Building streams one document at a time (only postings are accumulated),
+and takes about 3 s of CPU per 1,000 long articles, so it runs in a thread
+from the background refresher on the publishing worker only.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import struct
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.utils.fast_json import dumps, loads
+from src.utils.news_snapshot import SortedArticleList, project_record
+
+# Field weights follow the old substring relevance scoring: title > summary > description > content
+FIELDS = ("title", "summary", "description", "content")
+FIELD_WEIGHTS = (3.0, 2.0, 1.0, 0.5)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Upper bound on vocabulary terms a trailing prefix ("ransom" -> "ransomware", ...) may expand to
+MAX_PREFIX_EXPANSIONS = 64
+
+# Encoded layout: header (magic, index length) | JSON index | 8-byte aligned sections.
+# Arrays use native byte order - segment files never leave the host that built them.
+SEGMENT_MAGIC = b"CYXSEG01"
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 8
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lower-case alphanumeric tokens"""
+    if not text or not isinstance(text, str):
+        return []
+    return TOKEN_RE.findall(text.lower())
+
+
+class SegmentDocument(NamedTuple):
+    """One document to index: its identity, ranking/filter keys and searchable text"""
+    article_id: str
+    url: str
+    published_at: str
+    source_id: str
+    texts: Tuple[Any, ...]  # one value per FIELDS entry
+    record: Optional[bytes] = None  # pre-encoded feed record; None when a store materializes it
+
+
+def encode_segment(version: Any, documents: Iterable[SegmentDocument],
+                   priority: int = 0, modified: float = 0.0) -> bytes:
+    """Index documents into the immutable segment format, one document at a time"""
+    n_fields = len(FIELDS)
+    building: Dict[str, Tuple[array, array]] = {}
+    field_lengths = array("I")
+    field_length_sums = [0] * n_fields
+    sources: Dict[str, int] = {}
+    doc_sources = array("I")
+    source_keys: List[Tuple[str, str, int]] = []
+    doc_offsets, doc_blob = array("I", [0]), bytearray()
+    record_offsets, record_blob = array("I", [0]), bytearray()
+
+    doc = 0
+    for document in documents:
+        counts: Dict[str, List[int]] = {}
+        for field_idx in range(n_fields):
+            tokens = tokenize(document.texts[field_idx])
+            field_lengths.append(len(tokens))
+            field_length_sums[field_idx] += len(tokens)
+            for token in tokens:
+                tf = counts.get(token)
+                if tf is None:
+                    tf = counts[token] = [0] * n_fields
+                tf[field_idx] += 1
+        for token, tf in counts.items():
+            entry = building.get(token)
+            if entry is None:
+                entry = building[token] = (array("I"), array("H"))
+            entry[0].append(doc)
+            entry[1].extend(min(count, 0xFFFF) for count in tf)
+
+        source_id = (document.source_id or "").lower()
+        doc_sources.append(sources.setdefault(source_id, len(sources)))
+        source_keys.append((document.published_at or "", document.article_id or "", doc))
+        doc_blob += dumps([document.article_id or "", document.url or "", document.published_at or ""])
+        doc_offsets.append(len(doc_blob))
+        if document.record is not None:
+            record_blob += document.record
+        record_offsets.append(len(record_blob))
+        doc += 1
+
+    vocabulary = sorted(building)
+    term_offsets, term_blob = array("I", [0]), bytearray()
+    posting_starts = array("I", [0])
+    posting_docs, posting_tfs = array("I"), array("H")
+    for term in vocabulary:
+        term_blob += term.encode("ascii")
+        term_offsets.append(len(term_blob))
+        docs, tfs = building.pop(term)
+        posting_docs.extend(docs)
+        posting_tfs.extend(tfs)
+        posting_starts.append(len(posting_docs))
+
+    # Per-source document lists in feed order (newest first), for source_view
+    source_starts, source_docs = array("I", [0]), array("I")
+    by_source: List[List[Tuple[str, str, int]]] = [[] for _ in sources]
+    for key in source_keys:
+        by_source[doc_sources[key[2]]].append(key)
+    for keys in by_source:
+        keys.sort(reverse=True)
+        source_docs.extend(key[2] for key in keys)
+        source_starts.append(len(source_docs))
+    del source_keys, by_source
+
+    sections = [
+        ("term_offsets", term_offsets), ("terms", term_blob),
+        ("posting_starts", posting_starts), ("posting_docs", posting_docs), ("posting_tfs", posting_tfs),
+        ("field_lengths", field_lengths), ("doc_sources", doc_sources),
+        ("source_starts", source_starts), ("source_docs", source_docs),
+        ("doc_offsets", doc_offsets), ("docs", doc_blob),
+        ("record_offsets", record_offsets), ("records", record_blob),
+    ]
+    layout, body = {}, bytearray()
+    for name, data in sections:
+        raw = data.tobytes() if isinstance(data, array) else bytes(data)
+        layout[name] = [len(body), len(raw)]
+        body += raw
+        body += b"\0" * (-len(body) % _ALIGN)
+
+    index = dumps({
+        "version": version, "priority": priority, "modified": modified,
+        "doc_count": doc, "field_length_sums": field_length_sums,
+        "sources": list(sources), "sections": layout,
+    })
+    head = _HEADER.pack(SEGMENT_MAGIC, len(index)) + index
+    return head + b"\0" * (-len(head) % _ALIGN) + bytes(body)
+
+
+def _read_index(buffer: Any) -> Optional[Tuple[Dict[str, Any], int]]:
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, index_len = _HEADER.unpack_from(buffer, 0)
+    if magic != SEGMENT_MAGIC:
+        return None
+    end = _HEADER.size + index_len
+    return loads(bytes(buffer[_HEADER.size:end])), end + (-end % _ALIGN)
+
+
+def _as_version(value: Any) -> Any:
+    """Versions round-trip through JSON: lists come back as the tuples they were built from"""
+    return tuple(_as_version(v) for v in value) if isinstance(value, list) else value
+
+
+def segment_version(buffer: Any) -> Any:
+    """Version stamped in an encoded segment, or None if it isn't one"""
+    parsed = _read_index(buffer)
+    return _as_version(parsed[0]["version"]) if parsed else None
+
+
+class _Segment:
+    """Read-only view of one encoded segment (bytes or a shared mmap)"""
+
+    def __init__(self, buffer: Any, store: Any = None):
+        parsed = _read_index(buffer)
+        if parsed is None:
+            raise ValueError("not an encoded search segment")
+        index, body_start = parsed
+
+        self.version = _as_version(index["version"])
+        self.priority = index["priority"]
+        self.modified = index["modified"]
+        self.doc_count = index["doc_count"]
+        self.field_length_sums = index["field_length_sums"]
+        self.source_numbers = {source_id: i for i, source_id in enumerate(index["sources"])}
+        # Object with feed_fragment(id) / detail_fragment(id, fields) for record-less documents
+        self.store = store
+
+        view = memoryview(buffer)
+        sections = {}
+        for name, (offset, length) in index["sections"].items():
+            sections[name] = view[body_start + offset:body_start + offset + length]
+        self._term_offsets = sections["term_offsets"].cast("I")
+        self._terms = sections["terms"]
+        self._posting_starts = sections["posting_starts"].cast("I")
+        self._posting_docs = sections["posting_docs"].cast("I")
+        self._posting_tfs = sections["posting_tfs"].cast("H")
+        self.field_lengths = sections["field_lengths"].cast("I")
+        self.doc_sources = sections["doc_sources"].cast("I")
+        self._source_starts = sections["source_starts"].cast("I")
+        self._source_docs = sections["source_docs"].cast("I")
+        self._doc_offsets = sections["doc_offsets"].cast("I")
+        self._docs = sections["docs"]
+        self._record_offsets = sections["record_offsets"].cast("I")
+        self._records = sections["records"]
+        self.term_count = len(self._term_offsets) - 1
+
+    def _term(self, i: int) -> bytes:
+        return self._terms[self._term_offsets[i]:self._term_offsets[i + 1]].tobytes()
+
+    def _bisect(self, term: bytes) -> int:
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < term:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _term_number(self, term: str) -> int:
+        encoded = term.encode("ascii", "ignore")
+        i = self._bisect(encoded)
+        return i if i < self.term_count and self._term(i) == encoded else -1
+
+    def expand_prefix(self, prefix: str) -> List[str]:
+        encoded = prefix.encode("ascii", "ignore")
+        start = self._bisect(encoded)
+        terms = []
+        for i in range(start, min(self.term_count, start + MAX_PREFIX_EXPANSIONS)):
+            term = self._term(i)
+            if not term.startswith(encoded):
+                break
+            terms.append(term.decode("ascii"))
+        return terms
+
+    def postings(self, term: str) -> Optional[Tuple[memoryview, memoryview]]:
+        """(doc numbers, flattened per-field term frequencies) for a term"""
+        i = self._term_number(term)
+        if i < 0:
+            return None
+        start, end = self._posting_starts[i], self._posting_starts[i + 1]
+        n_fields = len(FIELDS)
+        return self._posting_docs[start:end], self._posting_tfs[start * n_fields:end * n_fields]
+
+    def doc_frequency(self, term: str) -> int:
+        i = self._term_number(term)
+        return self._posting_starts[i + 1] - self._posting_starts[i] if i >= 0 else 0
+
+    def source_docs(self, source_id: str) -> memoryview:
+        """Documents of one source, newest first"""
+        number = self.source_numbers.get(source_id)
+        if number is None:
+            return self._source_docs[0:0]
+        return self._source_docs[self._source_starts[number]:self._source_starts[number + 1]]
+
+    def document(self, doc: int) -> Tuple[str, str, str]:
+        """(article id, url, publishedAt) of a document"""
+        return tuple(loads(self._docs[self._doc_offsets[doc]:self._doc_offsets[doc + 1]].tobytes()))
+
+    def record(self, doc: int) -> Optional[bytes]:
+        start, end = self._record_offsets[doc], self._record_offsets[doc + 1]
+        return self._records[start:end].tobytes() if end > start else None
+
+
+class SearchHit:
+    """A ranked reference into a segment; the record is only encoded when the hit is served"""
+
+    __slots__ = ("score", "segment", "doc", "article_id", "url", "published_at")
+
+    def __init__(self, score: float, segment: _Segment, doc: int):
+        self.score = score
+        self.segment = segment
+        self.doc = doc
+        self.article_id, self.url, self.published_at = segment.document(doc)
+
+    def fragment(self, fields: Optional[Tuple[str, ...]] = None) -> Optional[bytes]:
+        """
+        Feed JSON for the hit (or a sparse fieldset of it). Snapshot-backed documents come
+        from the snapshot the segment was built from, so detail-only fields are available.
+        """
+        store = self.segment.store
+        if store is not None:
+            if fields is None:
+                return store.feed_fragment(self.article_id)
+            return store.detail_fragment(self.article_id, fields)
+        record = self.segment.record(self.doc)
+        if record is None or fields is None:
+            return record
+        return dumps(project_record(loads(record), fields))
+
+
+class SearchIndex:
+    """Segment-per-file BM25F index with incremental segment replacement"""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._segments: Dict[str, _Segment] = {}
+        # Bumped whenever a segment is swapped in or dropped
+        self.generation = 0
+        # Merged per-source views, dropped whenever a segment changes
+        self._source_views: Dict[str, SortedArticleList] = {}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def segment_version(self, name: str) -> Any:
+        segment = self._segments.get(name)
+        return segment.version if segment else None
+
+    def segment_names(self) -> List[str]:
+        return list(self._segments)
+
+    def versions(self) -> Dict[str, Any]:
+        """Version of every installed segment - identifies exactly what queries are answered from"""
+        return {name: segment.version for name, segment in self._segments.items()}
+
+    @property
+    def last_modified(self) -> float:
+        """Newest modification time of the files behind the installed segments"""
+        return max((segment.modified for segment in self._segments.values()), default=0.0)
+
+    def install_segment(self, name: str, buffer: Any, store: Any = None) -> int:
+        """
+        Swap in an encoded segment (bytes or a shared mapping); returns its document count.
+        `store` materializes documents that were indexed without a record.
+        """
+        segment = _Segment(buffer, store)
+        self._segments[name] = segment
+        self.generation += 1
+        self._source_views.clear()
+        return segment.doc_count
+
+    def update_segment(self, name: str, version: Any, documents: Iterable[SegmentDocument],
+                       priority: int = 0, modified: float = 0.0, store: Any = None) -> int:
+        """Encode and install one file's documents in-process; returns the number indexed"""
+        # Built fully before swapping so concurrent queries never see a half-built segment
+        return self.install_segment(name, encode_segment(version, documents, priority, modified), store)
+
+    def remove_segment(self, name: str) -> None:
+        if self._segments.pop(name, None) is not None:
+            self.generation += 1
+            self._source_views.clear()
+
+    @property
+    def doc_count(self) -> int:
+        return sum(segment.doc_count for segment in self._segments.values())
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: Optional[int], source: Optional[str] = None,
+               offset: int = 0) -> Tuple[int, List[SearchHit]]:
+        """
+        Return (total matches, ranked hits `offset`..`offset + limit`) for a query;
+        limit=None returns every match in rank order.
+        Every query term must match; the last term also matches as a prefix.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        segments = sorted(self._segments.values(), key=lambda s: s.priority)
+        if not terms or not segments:
+            return 0, []
+
+        # Corpus-wide statistics summed over segments
+        total_docs = sum(s.doc_count for s in segments) or 1
+        avg_lengths = [
+            (sum(s.field_length_sums[i] for s in segments) / total_docs) or 1.0
+            for i in range(len(FIELDS))
+        ]
+
+        # Each query term becomes a group of index terms (the trailing prefix may expand)
+        groups: List[List[str]] = [[term] for term in terms[:-1]]
+        last_group = {terms[-1]}
+        for segment in segments:
+            last_group.update(segment.expand_prefix(terms[-1]))
+        groups.append(sorted(last_group))
+
+        idf: Dict[str, float] = {}
+        for group in groups:
+            for term in group:
+                df = sum(s.doc_frequency(term) for s in segments)
+                idf[term] = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+
+        source_filter = source.lower() if source else None
+        best: Dict[str, SearchHit] = {}
+        unkeyed: List[SearchHit] = []
+
+        for segment in segments:
+            source_number = segment.source_numbers.get(source_filter) if source_filter else None
+            if source_filter and source_number is None:
+                continue
+            for doc, score in self._score_segment(segment, groups, idf, avg_lengths).items():
+                if source_filter and segment.doc_sources[doc] != source_number:
+                    continue
+                hit = SearchHit(score, segment, doc)
+                if not hit.url:
+                    unkeyed.append(hit)
+                    continue
+                # Keep the highest-priority file's copy of a duplicated URL, with its best score
+                previous = best.get(hit.url)
+                if previous is None:
+                    best[hit.url] = hit
+                elif score > previous.score:
+                    previous.score = score
+
+        hits = list(best.values()) + unkeyed
+        rank_key = lambda hit: (hit.score, hit.published_at)
+        if limit is None:
+            top = sorted(hits, key=rank_key, reverse=True)
+        else:
+            # Only the requested window is ever fully ordered
+            top = heapq.nlargest(offset + limit, hits, key=rank_key)
+        return len(hits), top[offset:]
+
+    def source_view(self, source: str) -> SortedArticleList:
+        """
+        Every document of a source across segments in feed order, as {"id", "publishedAt", "hit"}
+        entries; a URL present in several files is kept from the highest-priority one.
+        """
+        source = source.lower()
+        view = self._source_views.get(source)
+        if view is not None:
+            return view
+
+        seen_urls = set()
+        entries = []
+        for segment in sorted(self._segments.values(), key=lambda s: s.priority):
+            for doc in segment.source_docs(source):
+                hit = SearchHit(0.0, segment, doc)
+                if hit.url:
+                    if hit.url in seen_urls:
+                        continue
+                    seen_urls.add(hit.url)
+                entries.append({"id": hit.article_id, "publishedAt": hit.published_at, "hit": hit})
+
+        # Each segment's list is already sorted, so this only merges the runs
+        entries.sort(key=lambda e: (e["publishedAt"], e["id"]), reverse=True)
+        view = self._source_views[source] = SortedArticleList(entries)
+        return view
+
+    def _score_segment(self, segment: _Segment, groups: List[List[str]], idf: Dict[str, float],
+                       avg_lengths: List[float]) -> Dict[int, float]:
+        n_fields = len(FIELDS)
+        k1, b = self.k1, self.b
+        field_lengths = segment.field_lengths
+        scores: Optional[Dict[int, float]] = None
+
+        # Rarest group first keeps the running intersection small
+        ordered = sorted(groups, key=lambda g: sum(segment.doc_frequency(t) for t in g))
+        for group in ordered:
+            group_scores: Dict[int, float] = {}
+            for term in group:
+                posting = segment.postings(term)
+                if not posting:
+                    continue
+                docs, tfs = posting
+                term_idf = idf[term]
+                for i, doc in enumerate(docs):
+                    if scores is not None and doc not in scores:
+                        continue
+                    base = doc * n_fields
+                    weighted_tf = 0.0
+                    for f in range(n_fields):
+                        tf = tfs[i * n_fields + f]
+                        if tf:
+                            norm = 1 - b + b * field_lengths[base + f] / avg_lengths[f]
+                            weighted_tf += FIELD_WEIGHTS[f] * tf / norm
+                    group_scores[doc] = group_scores.get(doc, 0.0) + term_idf * weighted_tf / (k1 + weighted_tf)
+
+            if scores is None:
+                scores = group_scores
+            else:
+                # A document must match every group: drop those missing from this one
+                scores = {doc: scores[doc] + s for doc, s in group_scores.items()}
+            if not scores:
+                return {}
+
+        return scores or {}
@@ -0,0 +1,112 @@
+"""
+Host-wide sharing of encoded news snapshots (and search segments) between gunicorn workers.
+
+One worker (elected with a non-blocking flock) publishes the encoded
+snapshot to a file on tmpfs; every worker maps that file read-only, so N
+workers cost roughly one copy of the article data. Publication is an
+atomic rename: a worker still holding the old mapping keeps reading the
+old, unlinked inode until it swaps to the new version.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: no flock, every worker keeps its own copy
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+
+def default_shared_dir() -> str:
+    """Prefer /dev/shm (RAM-backed) and fall back to the temp directory"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "cyberx")
+
+
+class SharedSnapshotStore:
+    """Publishes encoded snapshots to one file and maps the current one read-only"""
+
+    def __init__(self, directory: Optional[str] = None, name: str = "news_snapshot.bin"):
+        self.directory = directory or default_shared_dir()
+        self.name = name
+        self.path = os.path.join(self.directory, name)
+        self.lock_path = self.path + ".lock"
+        self.enabled = FCNTL_AVAILABLE
+        self._mapped: Optional[Tuple[Tuple[int, int, int], mmap.mmap]] = None
+
+        if self.enabled:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+            except OSError:
+                self.enabled = False
+
+    @contextmanager
+    def publisher_lock(self) -> Iterator[bool]:
+        """Try to become this host's publisher; yields False if another process is publishing"""
+        if not self.enabled:
+            yield False
+            return
+
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def publish(self, data: bytes) -> None:
+        """Atomically replace the shared snapshot file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{self.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def map_current(self) -> Optional[mmap.mmap]:
+        """Read-only mapping of the published snapshot (reused until the file is replaced)"""
+        if not self.enabled:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        if stat.st_size == 0:
+            return None
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._mapped is not None and self._mapped[0] == key:
+            return self._mapped[1]
+
+        with open(self.path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # The previous mapping is released once no snapshot references it
+        self._mapped = (key, mapping)
+        return mapping
+
+    def discard(self) -> None:
+        """Remove the published file so the next rebuild reloads from the source data"""
+        self._mapped = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for tests that drive the FastAPI app against a temporary data directory.
+"""
+
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the API at an empty data directory, with no Redis, no shared snapshot and cold caches"""
+    pytest.importorskip("fastapi")
+    from api import cybersecurity_fastapi as api
+
+    monkeypatch.setattr(api, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(api.dynamic_api, "data_dir", str(tmp_path))
+    monkeypatch.setattr(api.shared_snapshots, "enabled", False)
+    monkeypatch.setattr(api, "REDIS_AVAILABLE", False)
+    for key, value in (("data", None), ("last_modified", 0), ("snapshot", None)):
+        monkeypatch.setitem(api.news_data_cache, key, value)
+    api.dynamic_api.data_files.invalidate()
+    api.precompressed_cache.clear()
+    return tmp_path
+
+
+@pytest.fixture
+def client(data_dir):
+    """TestClient without the lifespan: no refresher, so each request sees the files' current versions"""
+    from fastapi.testclient import TestClient
+    from api import cybersecurity_fastapi as api
+
+    return TestClient(api.app)
@@ -0,0 +1,30 @@
+"""
+Alert store migration from the legacy alerts_log.json.
+"""
+
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from src.utils.alert_store import LEGACY_LOG_NAME, AlertStore  # noqa: E402
+
+
+def test_legacy_log_is_imported_once_and_left_in_place(tmp_path):
+    legacy_path = tmp_path / LEGACY_LOG_NAME
+    legacy = [
+        {"timestamp": "2026-10-01T08:00:00", "title": "older", "read": True},
+        {"timestamp": "2026-10-02T08:00:00", "title": "newer"},
+    ]
+    legacy_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = AlertStore(str(tmp_path / "alerts.db"))
+    assert store.counts() == {"total": 2, "unread": 1}
+    assert [alert["title"] for alert in store.page(0, 10)] == ["newer", "older"]
+    # The tracked JSON file is not renamed or rewritten
+    assert json.loads(legacy_path.read_text(encoding="utf-8")) == legacy
+
+    # Another process opening the same database does not import it again
+    assert AlertStore(str(tmp_path / "alerts.db")).counts()["total"] == 2
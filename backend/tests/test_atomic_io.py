@@ -0,0 +1,37 @@
+"""Atomic publication of data files keeps their permissions readable by other processes."""
+
+import os
+import stat
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from src.utils.atomic_io import atomic_write_json, read_version  # noqa: E402
+
+
+def mode_of(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_file_gets_umask_default_mode(tmp_path):
+    path = str(tmp_path / "news.json")
+    umask = os.umask(0)
+    os.umask(umask)
+
+    atomic_write_json(path, [])
+
+    assert mode_of(path) == 0o666 & ~umask
+
+
+def test_existing_file_mode_is_preserved(tmp_path):
+    path = str(tmp_path / "news.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[]")
+    os.chmod(path, 0o644)
+
+    first = atomic_write_json(path, [{"title": "a"}])
+    second = atomic_write_json(path, [{"title": "b"}])
+
+    assert mode_of(path) == 0o644
+    assert read_version(path) == second > first
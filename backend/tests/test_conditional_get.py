@@ -0,0 +1,187 @@
+"""
+Conditional GET against snapshots installed by the background refresher.
+
+Data files published through atomic_io carry an opaque `.version` sidecar;
+the ETag is derived from it, Last-Modified must still be a real HTTP date.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from email.utils import parsedate_to_datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from api import cybersecurity_fastapi as api  # noqa: E402
+from src.utils.atomic_io import atomic_write_json, read_version  # noqa: E402
+
+ARTICLES = [
+    {
+        "title": f"Ransomware advisory {i}",
+        "summary": "Patch now.",
+        "url": f"https://www.bleepingcomputer.com/news/security/advisory-{i}/",
+        "publishedAt": f"2026-10-{10 + i:02d}T08:00:00Z",
+        "source": {"name": "BleepingComputer", "url": "https://www.bleepingcomputer.com"},
+    }
+    for i in range(3)
+]
+
+
+def wait_for_snapshot(version, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snapshot = api.news_data_cache["snapshot"]
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        time.sleep(0.05)
+    pytest.fail(f"refresher did not install snapshot {version}")
+
+
+def test_sidecar_versioned_snapshot_serves_200_and_304(data_dir):
+    path = os.path.join(str(data_dir), "summarized_news_hf.json")
+    atomic_write_json(path, ARTICLES)
+    version = read_version(path)
+
+    with TestClient(api.app) as client:
+        wait_for_snapshot(version)
+
+        response = client.get("/api/news")
+        assert response.status_code == 200
+        assert response.json()["totalResults"] == len(ARTICLES)
+
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        # A real date close to now, not the microsecond version read as seconds
+        assert abs(parsedate_to_datetime(last_modified).timestamp() - time.time()) < 3600
+
+        assert client.get("/api/news", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/api/news", headers={"If-Modified-Since": last_modified}).status_code == 304
+
+        # A new publication changes the ETag, so the old one no longer validates
+        atomic_write_json(path, ARTICLES[:2])
+        wait_for_snapshot(read_version(path))
+        response = client.get("/api/news", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["totalResults"] == 2
+
+
+def test_search_etag_follows_installed_index(data_dir):
+    path = os.path.join(str(data_dir), "summarized_news_hf.json")
+    atomic_write_json(path, ARTICLES)
+
+    with TestClient(api.app) as client:
+        wait_for_snapshot(read_version(path))
+
+        response = client.get("/api/news/search", params={"q": "ransomware"})
+        assert response.status_code == 200
+        assert len(response.json()["articles"]) == len(ARTICLES)
+        etag = response.headers["etag"]
+        assert client.get("/api/news/search", params={"q": "ransomware"},
+                          headers={"If-None-Match": etag}).status_code == 304
+
+        # Once the refresher installs the new file into the index, the old ETag stops validating
+        atomic_write_json(path, ARTICLES[:1])
+        wait_for_snapshot(read_version(path))
+        deadline = time.monotonic() + 10
+        while api.search_index.versions().get("summarized_news_hf.json", (None,))[0] != read_version(path):
+            assert time.monotonic() < deadline, "refresher did not sync the search index"
+            time.sleep(0.05)
+        response = client.get("/api/news/search", params={"q": "ransomware"}, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["articles"]) == 1
+        assert response.headers["etag"] != etag
+
+
+
+def test_corpus_validator_follows_installed_stats(data_dir, monkeypatch):
+    from starlette.requests import Request
+
+    def validator():
+        request = Request({"type": "http", "method": "GET", "path": "/api/stats", "query_string": b"", "headers": []})
+        return asyncio.run(api.get_data_validator(request))
+
+    monkeypatch.setattr(api, "corpus_stats", api.CorpusStats())
+    monkeypatch.setitem(api.validator_memo, "corpus", None)
+    atomic_write_json(os.path.join(str(data_dir), "summarized_news_hf.json"), ARTICLES)
+    asyncio.run(api.sync_corpus_stats())
+    monkeypatch.setattr(api, "data_refresher_running", lambda: True)
+    first = validator()
+
+    # With the refresher running, a file it has not counted yet must not change the validator
+    atomic_write_json(os.path.join(str(data_dir), "news_archive_2026.json"), ARTICLES[:1])
+    api.dynamic_api.data_files.invalidate()
+    assert validator() == first
+
+    # Once the stats are synced, it does
+    asyncio.run(api.sync_corpus_stats())
+    assert validator()[0] != first[0]
+
+
+def test_revalidation_without_refresher_does_not_sync(data_dir, monkeypatch):
+    atomic_write_json(os.path.join(str(data_dir), "summarized_news_hf.json"), ARTICLES)
+    atomic_write_json(os.path.join(str(data_dir), "cybersecurity_news_live.json"), ARTICLES[:1])
+    client = TestClient(api.app)
+    fresh = {path: client.get(path) for path in ("/api/stats", "/api/news/search?q=ransomware")}
+
+    async def no_sync():
+        raise AssertionError("a revalidation must not sync")
+    monkeypatch.setattr(api, "sync_corpus_stats", no_sync)
+    monkeypatch.setattr(api, "sync_search_index", no_sync)
+
+    # The validator built from file metadata matches the one the synced response was labelled with
+    for path, response in fresh.items():
+        assert response.status_code == 200
+        revalidated = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == 304, path
+
+
+def test_precompressed_representations_have_their_own_etag(data_dir):
+    path = os.path.join(str(data_dir), "summarized_news_hf.json")
+    atomic_write_json(path, ARTICLES * 10)
+
+    with TestClient(api.app) as client:
+        wait_for_snapshot(read_version(path))
+
+        plain = client.get("/api/news", headers={"Accept-Encoding": "identity"})
+        gzipped = client.get("/api/news", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+
+        response = client.get("/api/news", headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]})
+        assert response.status_code == 304
+        assert response.headers["etag"] == gzipped.headers["etag"]
+
+        # Arbitrary pages are served directly instead of churning the precompressed cache
+        entries = len(api.precompressed_cache)
+        response = client.get("/api/news", params={"limit": 7}, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "x-precompressed-cache" not in response.headers
+        assert len(api.precompressed_cache) == entries
+
+
+def test_validator_is_computed_once_per_request(data_dir, monkeypatch):
+    atomic_write_json(os.path.join(str(data_dir), "summarized_news_hf.json"), ARTICLES * 10)
+    monkeypatch.setitem(api.validator_memo, "corpus", None)
+    calls = []
+    compute = api._compute_data_validator
+
+    async def counting(kind):
+        calls.append(kind)
+        return await compute(kind)
+    monkeypatch.setattr(api, "_compute_data_validator", counting)
+
+    # No refresher: conditional GET, the precompressed cache and the response cache all need it
+    client = TestClient(api.app)
+    for path in ("/api/stats", "/api/news", "/api/news/search?q=ransomware"):
+        calls.clear()
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "etag" in response.headers
+        assert len(calls) == 1, path
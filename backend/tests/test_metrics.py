@@ -0,0 +1,67 @@
+"""
+/metrics renders the corpus gauges the refresher maintains; a scrape never syncs data.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("prometheus_client")
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from api import cybersecurity_fastapi as api  # noqa: E402
+from src.utils.atomic_io import atomic_write_json  # noqa: E402
+
+
+def test_scrape_renders_gauges_without_syncing(data_dir, monkeypatch):
+    articles = [{"title": f"Advisory {i}", "url": f"https://example.com/{i}"} for i in range(4)]
+    atomic_write_json(os.path.join(str(data_dir), "summarized_news_hf.json"), articles)
+
+    with TestClient(api.app) as client:
+        deadline = time.monotonic() + 10
+        while api.corpus_metrics["articles"] != len(articles):
+            assert time.monotonic() < deadline, "refresher did not update the corpus gauges"
+            time.sleep(0.05)
+
+        async def no_sync():
+            raise AssertionError("/metrics must not sync corpus stats")
+        monkeypatch.setattr(api, "sync_corpus_stats", no_sync)
+
+        body = client.get("/metrics").text
+        assert f"cybersecurity_articles_total {float(len(articles))}" in body
+        assert body.count("# TYPE cybersecurity_articles_total gauge") == 1
+
+
+def test_requests_are_labelled_by_matched_route(data_dir):
+    with TestClient(api.app) as client:
+        client.get("/api/article/not-a-real-article")
+        client.get("/no/such/path")
+
+    assert "GET /api/article/{article_url:path}" in api.endpoint_stats
+    assert "GET unmatched" in api.endpoint_stats
+    assert not any("not-a-real-article" in endpoint for endpoint in api.endpoint_stats)
+
+
+def test_conditional_get_304_keeps_the_route_label(data_dir):
+    article = {"title": "Advisory", "url": "https://example.com/advisory", "publishedAt": "2026-10-01T08:00:00Z"}
+    atomic_write_json(os.path.join(str(data_dir), "summarized_news_hf.json"), [article])
+    client = TestClient(api.app)
+    article_id = client.get("/api/news").json()["articles"][0]["id"]
+
+    label = "GET /api/article/{article_url:path}"
+    before = dict(api.endpoint_stats.get(label, {"count": 0}))
+    unmatched = api.endpoint_stats.get("GET unmatched", {"count": 0})["count"]
+
+    first = client.get(f"/api/article/{article_id}")
+    assert first.status_code == 200
+    # Answered by the conditional-GET middleware before routing
+    assert client.get(f"/api/article/{article_id}", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    assert api.endpoint_stats[label]["count"] == before["count"] + 2
+    assert api.endpoint_stats.get("GET unmatched", {"count": 0})["count"] == unmatched
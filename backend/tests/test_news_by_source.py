@@ -0,0 +1,93 @@
+"""
+/api/news/source/{source_id}: the snapshot's source partition merged with the live and
+daily-archive files, or the summarized feed alone with archives=false.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from api import cybersecurity_fastapi as api  # noqa: E402
+from src.utils.atomic_io import atomic_write_json  # noqa: E402
+
+SOURCE = "bleepingcomputercom"
+
+
+def article(day, title=None, host="www.bleepingcomputer.com"):
+    return {
+        "title": title or f"Advisory {day}",
+        "summary": "Patch now.",
+        "url": f"https://{host}/news/security/advisory-{day}/",
+        "publishedAt": f"2026-10-{day:02d}T08:00:00Z",
+        "source": {"name": "BleepingComputer", "url": f"https://{host}"},
+    }
+
+
+def write(filename, articles):
+    atomic_write_json(os.path.join(api.DATA_DIR, filename), articles)
+    api.dynamic_api.data_files.invalidate()
+
+
+def titles(response):
+    return [a["title"] for a in response.json()["articles"]]
+
+
+def test_source_feed_merges_live_and_archive_files(client):
+    write("summarized_news_hf.json", [article(5, "Advisory 5 (summarized)"), article(2)])
+    # Not summarized yet, a copy of a summarized article, and another source's article
+    write("cybersecurity_news_live.json", [article(6), article(5, "Advisory 5 (raw)"), article(7, host="example.org")])
+    write("News_today_20261001.json", [article(1), article(6, "Advisory 6 (archived)")])
+
+    response = client.get(f"/api/news/source/{SOURCE}")
+    assert response.status_code == 200
+    # Newest first across files; a duplicated URL is served from the highest-priority file
+    assert titles(response) == ["Advisory 6", "Advisory 5 (summarized)", "Advisory 2", "Advisory 1"]
+    assert response.json()["totalResults"] == 4
+    # Summarized articles keep their snapshot ids
+    snapshot_ids = {a["id"] for a in client.get("/api/news").json()["articles"]}
+    assert response.json()["articles"][1]["id"] in snapshot_ids
+
+    # The summarized feed alone, as before the merge
+    summarized = client.get(f"/api/news/source/{SOURCE}", params={"archives": "false"})
+    assert titles(summarized) == ["Advisory 5 (summarized)", "Advisory 2"]
+
+    # Sparse fieldsets and exports cover archive-only articles too
+    sparse = client.get(f"/api/news/source/{SOURCE}", params={"fields": "title"}).json()["articles"]
+    assert sparse[0] == {"title": "Advisory 6"}
+    exported = client.get(f"/api/news/source/{SOURCE}", params={"export": "ndjson"}).text.splitlines()
+    assert [json.loads(line)["title"] for line in exported] == titles(response)
+
+
+def test_merged_source_feed_pages_by_cursor(client):
+    write("summarized_news_hf.json", [article(day) for day in (9, 7, 5, 3)])
+    write("cybersecurity_news_live.json", [article(day) for day in (8, 6, 4)])
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = client.get(f"/api/news/source/{SOURCE}", params=params).json()
+        seen.extend(a["title"] for a in body["articles"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"Advisory {day}" for day in range(9, 2, -1)]
+
+
+def test_source_etag_follows_archive_files(client):
+    write("summarized_news_hf.json", [article(2)])
+    write("cybersecurity_news_live.json", [article(3)])
+    first = client.get(f"/api/news/source/{SOURCE}")
+
+    write("cybersecurity_news_live.json", [article(4), article(3)])
+    second = client.get(f"/api/news/source/{SOURCE}")
+
+    assert titles(second) == ["Advisory 4", "Advisory 3", "Advisory 2"]
+    assert second.headers["etag"] != first.headers["etag"]
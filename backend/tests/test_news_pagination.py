@@ -0,0 +1,107 @@
+"""
+Keyset cursor pagination of /api/news: opaque cursors, stable pages across a data rewrite,
+and 400s for cursors that were not issued by the API.
+"""
+
+import base64
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from api import cybersecurity_fastapi as api  # noqa: E402
+from src.utils.atomic_io import atomic_write_json  # noqa: E402
+from src.utils.news_snapshot import decode_cursor, encode_cursor  # noqa: E402
+
+
+def article(day, n=0):
+    return {
+        "title": f"Advisory {day}.{n}",
+        "summary": "Patch now.",
+        "url": f"https://www.bleepingcomputer.com/news/security/advisory-{day}-{n}/",
+        "publishedAt": f"2026-10-{day:02d}T08:00:00Z",
+        "source": {"name": "BleepingComputer", "url": "https://www.bleepingcomputer.com"},
+    }
+
+
+def publish(articles):
+    atomic_write_json(os.path.join(api.DATA_DIR, "summarized_news_hf.json"), articles)
+
+
+def titles(response):
+    return [a["title"] for a in response.json()["articles"]]
+
+
+def test_cursor_round_trips_version_and_sort_key():
+    cursor = encode_cursor(1234.5, {"publishedAt": "2026-10-01T08:00:00Z", "id": "article-00ff"})
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (1234.5, ("2026-10-01T08:00:00Z", "article-00ff"))
+
+
+def test_cursor_pages_stay_stable_across_a_rewrite(client):
+    publish([article(day) for day in range(1, 8)])
+
+    first = client.get("/api/news", params={"limit": 3})
+    assert first.status_code == 200
+    assert titles(first) == ["Advisory 7.0", "Advisory 6.0", "Advisory 5.0"]
+    cursor = first.json()["next_cursor"]
+
+    # New summaries are prepended and an unseen one is dropped before the client asks for page 2
+    publish([article(9), article(8)] + [article(day) for day in range(1, 8) if day != 3])
+
+    second = client.get("/api/news", params={"limit": 3, "cursor": cursor})
+    assert second.status_code == 200
+    # Continues after the last article seen: nothing repeated, nothing skipped
+    assert titles(second) == ["Advisory 4.0", "Advisory 2.0", "Advisory 1.0"]
+    assert second.json()["next_cursor"] is None
+
+    # Offset paging over the same rewrite would have repeated page 1's tail
+    assert titles(client.get("/api/news", params={"limit": 3, "page": 2})) == ["Advisory 6.0", "Advisory 5.0", "Advisory 4.0"]
+
+
+def test_cursor_orders_same_timestamp_articles_by_id(client):
+    publish([article(1, n) for n in range(5)])
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        body = client.get("/api/news", params=params).json()
+        seen.extend(a["id"] for a in body["articles"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b'[1.0, "2026-10-01"]').decode(),          # missing the id
+    base64.urlsafe_b64encode(b'[1.0, 20261001, "article-00ff"]').decode(),  # tampered key type
+    "W10",                                                                 # base64 of []
+])
+def test_malformed_or_tampered_cursor_is_a_400(client, cursor):
+    publish([article(1)])
+
+    response = client.get("/api/news", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"]["message"] == "Invalid cursor"
+
+    # The per-source feed validates its cursor the same way
+    response = client.get("/api/news/source/bleepingcomputercom", params={"cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_truncated_cursor_is_a_400(client):
+    publish([article(day) for day in range(1, 4)])
+    cursor = client.get("/api/news", params={"limit": 1}).json()["next_cursor"]
+
+    response = client.get("/api/news", params={"cursor": cursor[:-4]})
+    assert response.status_code == 400
+    assert response.json()["detail"]["message"] == "Invalid cursor"
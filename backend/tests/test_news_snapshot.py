@@ -0,0 +1,78 @@
+"""
+Snapshot change log behind /api/news/changes, and one record per article id.
+"""
+
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from src.utils.article_identity import article_id  # noqa: E402
+from src.utils.news_snapshot import NewsSnapshot, encode_snapshot  # noqa: E402
+
+
+def article(n, title=None, published="2026-10-01T08:00:00Z"):
+    return {
+        "title": title or f"Advisory {n}",
+        "url": f"https://example.com/advisory-{n}",
+        "publishedAt": published,
+        "source": {"name": "Example", "url": "https://example.com"},
+    }
+
+
+def build(articles, version, previous=None):
+    return NewsSnapshot(encode_snapshot(articles, version, id_func=article_id,
+                                        source_id_func=lambda a: "examplecom", previous=previous))
+
+
+def feed_titles(snapshot, articles):
+    return [json.loads(fragment)["title"] for fragment in snapshot.fragments(articles)]
+
+
+def test_changes_since_nets_out_every_version_in_between():
+    v1 = build([article(1), article(2), article(3)], 1.0)
+    v2 = build([article(1, "Advisory 1 (updated)"), article(2), article(4)], 2.0, previous=v1)
+    v3 = build([article(1, "Advisory 1 (updated)"), article(4), article(5)], 3.0, previous=v2)
+
+    assert v3.changes_since(3.0) == ([], [])
+
+    added, removed = v3.changes_since(2.0)
+    assert feed_titles(v3, added) == ["Advisory 5"]
+    assert removed == [article_id(article(2))]
+
+    added, removed = v3.changes_since(1.0)
+    assert sorted(feed_titles(v3, added)) == ["Advisory 1 (updated)", "Advisory 4", "Advisory 5"]
+    assert sorted(removed) == sorted([article_id(article(2)), article_id(article(3))])
+
+    # A version the log does not reach back to asks the client to reset
+    assert v3.changes_since(0.5) is None
+
+
+def test_removed_then_re_added_article_is_reported_as_added():
+    v1 = build([article(1), article(2)], 1.0)
+    v2 = build([article(1)], 2.0, previous=v1)
+    v3 = build([article(1), article(2)], 3.0, previous=v2)
+
+    added, removed = v3.changes_since(1.0)
+    assert [a["id"] for a in added] == [article_id(article(2))]
+    assert removed == []
+
+
+def test_duplicate_ids_keep_only_the_newest_copy():
+    older = article(1, "Advisory 1 (first summary)", published="2026-10-01T08:00:00Z")
+    newer = article(1, "Advisory 1 (re-summarized)", published="2026-10-02T08:00:00Z")
+    snapshot = build([older, article(2), newer], 1.0)
+
+    assert snapshot.total == 2
+    assert sorted(snapshot.article_ids()) == sorted([article_id(older), article_id(article(2))])
+    assert feed_titles(snapshot, snapshot.feed.articles) == ["Advisory 1 (re-summarized)", "Advisory 2"]
+    assert snapshot.lookup(older["url"])["title"] == "Advisory 1 (re-summarized)"
+
+    # A later copy of a duplicated article is diffed like any other update
+    updated = article(1, "Advisory 1 (third summary)", published="2026-10-03T08:00:00Z")
+    next_snapshot = build([older, article(2), newer, updated], 2.0, previous=snapshot)
+    added, removed = next_snapshot.changes_since(1.0)
+    assert feed_titles(next_snapshot, added) == ["Advisory 1 (third summary)"]
+    assert removed == []
@@ -0,0 +1,108 @@
+"""
+Cursor reads from the notification log (SSE Last-Event-ID replay and ?after= polls).
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from src.utils.notification_log import NotificationLog, parse_entry_id  # noqa: E402
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def append_all(log, count):
+    return [run(log.append({"title": f"n{i}"})) for i in range(count)]
+
+
+class FakeStream:
+    """XADD/XREAD/XREVRANGE over one stream, trimming like MAXLEN"""
+
+    def __init__(self, fail=False):
+        self.entries = []
+        self.fail = fail
+        self.next_ms = 1700000000000
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis is down")
+
+    async def xadd(self, key, fields, maxlen, approximate):
+        self._check()
+        self.next_ms += 1
+        entry_id = f"{self.next_ms}-0"
+        self.entries = (self.entries + [(entry_id, fields)])[-maxlen:]
+        return entry_id
+
+    async def xread(self, streams, count):
+        self._check()
+        (key, after), = streams.items()
+        newer = [e for e in self.entries if parse_entry_id(e[0]) > parse_entry_id(after)][:count]
+        return [(key, newer)] if newer else []
+
+    async def xrevrange(self, key, count):
+        self._check()
+        return self.entries[::-1][:count]
+
+
+def test_local_replay_after_id_returns_only_newer_entries_oldest_first():
+    log = NotificationLog(maxlen=10)
+    entries = append_all(log, 5)
+
+    ids = [parse_entry_id(entry["id"]) for entry in entries]
+    assert ids == sorted(ids) and len(set(ids)) == 5
+
+    replayed = run(log.read_after(entries[1]["id"], 10))
+    assert [e["title"] for e in replayed] == ["n2", "n3", "n4"]
+    # A limited read returns the oldest missed entries, so the client can continue from the last one
+    assert [e["title"] for e in run(log.read_after(entries[1]["id"], 2))] == ["n2", "n3"]
+    assert run(log.read_after(entries[-1]["id"], 10)) == []
+    assert [e["title"] for e in run(log.latest(2))] == ["n4", "n3"]
+
+
+def test_local_replay_after_expired_id_returns_everything_retained():
+    log = NotificationLog(maxlen=3)
+    entries = append_all(log, 6)
+
+    # entries[0] was trimmed out of the ring buffer; replay resumes at the oldest one still held
+    replayed = run(log.read_after(entries[0]["id"], 10))
+    assert [e["title"] for e in replayed] == ["n3", "n4", "n5"]
+    # An id from before anything was logged behaves the same
+    assert [e["title"] for e in run(log.read_after("0-0", 10))] == ["n3", "n4", "n5"]
+
+
+def test_malformed_cursor_is_rejected():
+    log = NotificationLog()
+    with pytest.raises(ValueError):
+        run(log.read_after("not-an-id", 10))
+    with pytest.raises(ValueError):
+        parse_entry_id("-1-0")
+
+
+def test_stream_replay_and_local_fallback_when_redis_fails():
+    stream = FakeStream()
+    errors = []
+
+    async def get_redis():
+        return stream
+
+    log = NotificationLog(get_redis=get_redis, on_error=lambda e, op: errors.append(op), maxlen=3)
+    entries = append_all(log, 4)
+    assert [e["title"] for e in run(log.read_after(entries[0]["id"], 10))] == ["n1", "n2", "n3"]
+    # Trimmed by MAXLEN: an expired id still replays what the stream retains
+    assert [e["title"] for e in run(log.read_after("0-0", 10))] == ["n1", "n2", "n3"]
+
+    # Redis goes away: appends and reads fall back to the in-process ring buffer
+    stream.fail = True
+    local = run(log.append({"title": "local"}))
+    assert "notification log append" in errors
+    assert [e["title"] for e in run(log.read_after("0-0", 10))] == ["local"]
+    assert "notification log read" in errors
+    assert parse_entry_id(local["id"]) > (0, 0)
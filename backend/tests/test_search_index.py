@@ -0,0 +1,157 @@
+"""
+SearchIndex query semantics: AND across terms, trailing-prefix expansion, the source
+filter, duplicate URLs across segments, result windows and segment replacement.
+"""
+
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from src.utils.search_index import MAX_PREFIX_EXPANSIONS, SearchIndex, SegmentDocument  # noqa: E402
+
+
+def doc(n, title, summary="", source="examplecom", url=None, published=None):
+    url = url if url is not None else f"https://example.com/{n}"
+    published = published or f"2026-10-{n % 28 + 1:02d}T08:00:00Z"
+    record = {"id": f"article-{n}", "title": title, "summary": summary, "url": url, "publishedAt": published}
+    return SegmentDocument(
+        f"article-{n}", url, published, source, (title, summary, "", ""), json.dumps(record).encode()
+    )
+
+
+def index_of(*segments):
+    """segments: (name, priority, documents)"""
+    index = SearchIndex()
+    for name, priority, documents in segments:
+        index.update_segment(name, (name, 1), documents, priority=priority)
+    return index
+
+
+def ids(hits):
+    return [hit.article_id for hit in hits]
+
+
+def test_every_query_term_must_match():
+    index = index_of(("a.json", 0, [
+        doc(1, "Ransomware hits hospital"),
+        doc(2, "Hospital network outage"),
+        doc(3, "Ransomware group arrested"),
+    ]))
+
+    total, hits = index.search("hospital ransomware", limit=10)
+    assert total == 1 and ids(hits) == ["article-1"]
+
+    # Terms may match in different fields of the same document
+    index.update_segment("b.json", ("b.json", 1), [doc(4, "Hospital breach", summary="ransomware suspected")])
+    assert sorted(ids(index.search("hospital ransomware", limit=10)[1])) == ["article-1", "article-4"]
+
+    assert index.search("hospital phishing", limit=10) == (0, [])
+    assert index.search("", limit=10) == (0, [])
+
+
+def test_title_matches_outrank_summary_matches():
+    index = index_of(("a.json", 0, [
+        doc(1, "Weekly roundup", summary="a patch for the exchange flaw"),
+        doc(2, "Exchange flaw exploited"),
+    ]))
+    assert ids(index.search("exchange", limit=10)[1]) == ["article-2", "article-1"]
+
+
+def test_only_the_last_term_is_expanded_as_a_prefix():
+    index = index_of(("a.json", 0, [
+        doc(1, "Ransomware gang leaks data"),
+        doc(2, "Ransom demand paid"),
+        doc(3, "Gangster movie review"),
+    ]))
+
+    assert sorted(ids(index.search("ransom", limit=10)[1])) == ["article-1", "article-2"]
+    # "gang" is not the trailing term, so it does not match "gangster"
+    assert ids(index.search("gang ransom", limit=10)[1]) == ["article-1"]
+    assert ids(index.search("ransomware gang", limit=10)[1]) == ["article-1"]
+    # ...and a non-trailing "ransom" only matches the whole word
+    assert index.search("ransom gang", limit=10) == (0, [])
+
+
+def test_prefix_expansion_is_capped():
+    documents = [doc(n, f"patch{n:03d}") for n in range(MAX_PREFIX_EXPANSIONS + 20)]
+    index = index_of(("a.json", 0, documents))
+
+    total, hits = index.search("patch", limit=None)
+    assert total == MAX_PREFIX_EXPANSIONS
+    # The lexicographically first terms are the ones kept
+    assert sorted(ids(hits)) == sorted(f"article-{n}" for n in range(MAX_PREFIX_EXPANSIONS))
+    # A longer prefix still reaches terms past the cap
+    assert sorted(ids(index.search("patch08", limit=None)[1])) == [f"article-{n}" for n in range(80, 84)]
+
+
+def test_source_filter_is_case_insensitive_and_exact():
+    index = index_of(
+        ("a.json", 0, [doc(1, "Zero-day patched", source="ExampleCom"), doc(2, "Zero-day exploited", source="othernet")]),
+        ("b.json", 1, [doc(3, "Zero-day roundup", source="examplecom")]),
+    )
+
+    assert sorted(ids(index.search("zero", limit=10, source="examplecom")[1])) == ["article-1", "article-3"]
+    assert ids(index.search("zero", limit=10, source="OTHERNET")[1]) == ["article-2"]
+    assert index.search("zero", limit=10, source="example") == (0, [])
+
+
+def test_duplicate_url_is_served_from_the_highest_priority_segment():
+    url = "https://example.com/advisory"
+    index = index_of(
+        ("archive.json", 2, [doc(1, "Advisory", url=url)]),
+        ("summarized.json", 0, [doc(2, "Weekly roundup", summary="advisory", url=url), doc(5, "Advisory")]),
+        ("live.json", 1, [doc(3, "Advisory advisory", url=url)]),
+    )
+
+    total, hits = index.search("advisory", limit=10)
+    assert total == 2
+    # The summarized copy is served, ranked with the best score any copy reached:
+    # its own summary-only match would rank below article-5's title match
+    assert ids(hits) == ["article-2", "article-5"]
+    assert json.loads(hits[0].fragment())["id"] == "article-2"
+    assert json.loads(hits[0].fragment(("title",))) == {"title": "Weekly roundup"}
+
+    # Documents without a URL are never merged
+    index.update_segment("extra.json", ("extra.json", 1), [doc(4, "Advisory", url=""), doc(6, "Advisory", url="")])
+    assert index.search("advisory", limit=10)[0] == 4
+
+
+def test_offset_and_limit_window_the_ranked_results():
+    # Equal scores rank newest first
+    index = index_of(("a.json", 0, [doc(n, "Breach notice") for n in range(1, 11)]))
+    ranked = ids(index.search("breach", limit=None)[1])
+    assert ranked == [f"article-{n}" for n in range(10, 0, -1)]
+
+    total, hits = index.search("breach", limit=3, offset=3)
+    assert total == 10
+    assert ids(hits) == ranked[3:6]
+    assert ids(index.search("breach", limit=3, offset=9)[1]) == ranked[9:]
+    assert index.search("breach", limit=3, offset=20) == (10, [])
+
+
+def test_replacing_and_removing_a_segment():
+    index = index_of(
+        ("a.json", 0, [doc(1, "Phishing kit sold")]),
+        ("b.json", 1, [doc(2, "Phishing wave")]),
+    )
+    generation = index.generation
+    assert index.doc_count == 2
+
+    index.update_segment("a.json", ("a.json", 2), [doc(3, "Botnet takedown"), doc(4, "Phishing lures")])
+    assert index.segment_version("a.json") == ("a.json", 2)
+    assert index.generation > generation
+    assert index.doc_count == 3
+    assert sorted(ids(index.search("phishing", limit=10)[1])) == ["article-2", "article-4"]
+    assert ids(index.search("botnet", limit=10)[1]) == ["article-3"]
+
+    index.remove_segment("b.json")
+    assert index.segment_names() == ["a.json"]
+    assert ids(index.search("phishing", limit=10)[1]) == ["article-4"]
+
+    # Removing an unknown segment is a no-op
+    generation = index.generation
+    index.remove_segment("missing.json")
+    assert index.generation == generation
@@ -0,0 +1,95 @@
+"""
+Source ids are stamped into the snapshot and search segments; a url_fetch.txt change must re-stamp them.
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from api import cybersecurity_fastapi as api  # noqa: E402
+from src.utils.atomic_io import atomic_write_json  # noqa: E402
+
+ARTICLE = {
+    "title": "Ransomware gang leaks hospital data",
+    "summary": "Patch now.",
+    "url": "https://blog.example.org/ransomware-leak/",
+    "publishedAt": "2026-10-10T08:00:00Z",
+    "source": {"name": "Example Blog"},
+}
+
+
+@pytest.fixture
+def config_file(data_dir, tmp_path, monkeypatch):
+    path = tmp_path / "url_fetch.txt"
+    path.write_text("https://www.bleepingcomputer.com/\n", encoding="utf-8")
+    monkeypatch.setattr(api.dynamic_api, "url_config_file", str(path))
+    api.dynamic_api.reload_sources()
+    yield path
+    api.dynamic_api.reload_sources()
+
+
+def test_config_reload_restamps_source_ids(config_file):
+    atomic_write_json(os.path.join(api.DATA_DIR, "summarized_news_hf.json"), [ARTICLE])
+    client = TestClient(api.app)
+
+    # Unconfigured: the id is derived from the article's own host
+    feed = client.get("/api/news")
+    assert feed.json()["articles"][0]["source"]["id"] == "blogexampleorg"
+    assert client.get("/api/news/source/exampleorg").status_code == 404
+    assert client.get("/api/news/search", params={"q": "ransomware", "source": "exampleorg"}).json()["totalResults"] == 0
+
+    # Adding the parent domain must re-stamp the article without any data write
+    config_file.write_text("https://www.bleepingcomputer.com/\nhttps://example.org\n", encoding="utf-8")
+    assert client.post("/api/config/reload").json()["status"] == "success"
+
+    response = client.get("/api/news")
+    assert response.json()["articles"][0]["source"]["id"] == "exampleorg"
+    assert response.headers["etag"] != feed.headers["etag"]
+    assert response.json()["version"] != feed.json()["version"]
+
+    by_source = client.get("/api/news/source/exampleorg")
+    assert by_source.status_code == 200
+    assert by_source.json()["source"]["url"] == "https://example.org"
+    assert [a["url"] for a in by_source.json()["articles"]] == [ARTICLE["url"]]
+
+    search = client.get("/api/news/search", params={"q": "ransomware", "source": "exampleorg"}).json()
+    assert search["totalResults"] == 1
+
+    # Clients holding the old version learn about the re-stamped article from the delta feed
+    changes = client.get("/api/news/changes", params={"since": feed.json()["version"]}).json()
+    assert changes["reset"] is False
+    assert [a["source"]["id"] for a in changes["articles"]] == ["exampleorg"]
+
+
+def test_sources_key_does_not_follow_request_state(config_file):
+    atomic_write_json(os.path.join(api.DATA_DIR, "summarized_news_hf.json"), [ARTICLE])
+    client = TestClient(api.app)
+    key = api.current_sources_key()
+    etag = client.get("/api/news").headers["etag"]
+
+    assert client.get("/api/news/sources").status_code == 200
+    # Views derived from the parsed config are rebuilt (as after a reload) once statistics were served
+    api.source_trie_state["generation"] = None
+
+    assert api.current_sources_key() == key
+    assert client.get("/api/news").headers["etag"] == etag
+
+
+def test_source_statistics_stay_out_of_the_cached_config(config_file):
+    atomic_write_json(os.path.join(api.DATA_DIR, "summarized_news_hf.json"), [ARTICLE])
+    client = TestClient(api.app)
+
+    listed = client.get("/api/news/sources").json()["sources"]
+    assert {"articles_count", "last_updated"} <= set(listed[0])
+
+    # The per-request counts belong to that response only
+    config = client.get("/api/config").json()["sources"]
+    assert all("articles_count" not in source for source in config.values())
+    assert all("articles_count" not in source for source in api.dynamic_api.get_url_sources().values())
@@ -2,11 +2,13 @@ import { useNotifications } from '../store/NotificationContext';
 import { api } from './api';
 import { NewsResponse, Article } from '../types/news';
 import { sendGroupedNewsNotification, sendSmartBatchNotification } from './notifications';
+import { notificationStream } from './notificationStream';
 
 let lastArticleCount = 0;
 let isMonitoring = false;
 let lastMonitorTime = 0;
 let lastAlertCheckTime = 0;
+let alertCursor: string | null = null; // id of the last backend notification seen
 const MONITOR_COOLDOWN = 60000; // 1 minute cooldown
 const ALERT_CHECK_INTERVAL = 30000; // Check for alerts every 30 seconds
 
@@ -47,8 +49,19 @@ export async function startNewsMonitoring() {
     }
   }, 120000); // Check every 2 minutes
   
-  // Check for alerts from the backend file watcher system
+  // Alerts from the backend file watcher are pushed over the notification stream
+  const unsubscribeAlerts = notificationStream.subscribe(async (notification) => {
+    if (notification.id) {
+      alertCursor = notification.id;
+    }
+    await sendSmartBatchNotification(notification);
+  });
+  
+  // Poll for them only while the stream is down
   const alertInterval = setInterval(async () => {
+    if (notificationStream.isConnected()) {
+      return;
+    }
     const now = Date.now();
     if (now - lastAlertCheckTime < ALERT_CHECK_INTERVAL) {
       return;
@@ -61,6 +74,7 @@ export async function startNewsMonitoring() {
   return () => {
     clearInterval(interval);
     clearInterval(alertInterval);
+    unsubscribeAlerts();
     isMonitoring = false;
   };
 }
@@ -68,7 +82,8 @@ export async function startNewsMonitoring() {
 async function checkForAlerts() {
   try {
     // Poll the backend for new notifications from the file watcher
-    const response = await fetch(`${process.env.EXPO_PUBLIC_API_URL || 'https://cyberx.icu'}/api/notifications`);
+    const query = alertCursor ? `?after=${encodeURIComponent(alertCursor)}` : '';
+    const response = await fetch(`${process.env.EXPO_PUBLIC_API_URL || 'https://cyberx.icu'}/api/notifications${query}`);
     
     if (!response.ok) {
       return; // Silently fail if backend is not available
@@ -76,15 +91,17 @@ async function checkForAlerts() {
     
     const data = await response.json();
     
-    if (data.notifications && data.notifications.length > 0) {
+    // First poll only establishes the cursor; afterwards only newer alerts arrive
+    const isFirstPoll = alertCursor === null;
+    alertCursor = data.cursor ?? alertCursor;
+    notificationStream.resumeFrom(alertCursor);
+    
+    if (!isFirstPoll && data.notifications && data.notifications.length > 0) {
       // Send each notification using the notification service
       for (const notification of data.notifications) {
         await sendSmartBatchNotification(notification);
       }
       
-      // Clear the notifications after processing
-      await fetch(`${process.env.EXPO_PUBLIC_API_URL || 'https://cyberx.icu'}/api/notifications?clear=true`);
-      
       console.log(`🔔 Processed ${data.notifications.length} alerts from file watcher`);
     }
     
@@ -0,0 +1,174 @@
+// Server-Sent Events client for /api/notifications/stream.
+// React Native has no EventSource, so the stream is read incrementally through
+// XMLHttpRequest. One connection is shared by every listener; while it is down,
+// callers fall back to polling /api/notifications.
+
+export type StreamNotification = {
+  id?: string;
+  title?: string;
+  body?: string;
+  count?: number;
+  priority?: string;
+  timestamp?: string;
+  grouped?: boolean;
+  [key: string]: any;
+};
+
+type Listener = (notification: StreamNotification) => void;
+
+const API_URL = process.env.EXPO_PUBLIC_API_URL || 'https://cyberx.icu';
+const MAX_RETRY_MS = 60000; // back off to at most one reconnect a minute
+
+class NotificationStream {
+  private xhr: XMLHttpRequest | null = null;
+  private listeners = new Set<Listener>();
+  private connected = false;
+  private lastEventId: string | null = null;
+  private retryMs = 5000; // replaced by the server's `retry:` field
+  private failures = 0;
+  private reconnectTimer: any = null;
+  private readOffset = 0;
+  private buffer = '';
+
+  // Subscribe to pushed notifications; the stream opens with the first listener and closes with the last
+  subscribe(listener: Listener): () => void {
+    this.listeners.add(listener);
+    if (this.listeners.size === 1) {
+      this.connect();
+    }
+    return () => {
+      this.listeners.delete(listener);
+      if (this.listeners.size === 0) {
+        this.close();
+      }
+    };
+  }
+
+  // True while notifications are being pushed - polling can be skipped
+  isConnected() {
+    return this.connected;
+  }
+
+  // Resume from a cursor obtained by polling, so a reconnect replays only what was missed
+  resumeFrom(id: string | null) {
+    if (id && !this.connected) {
+      this.lastEventId = id;
+    }
+  }
+
+  private connect() {
+    this.clearReconnect();
+    this.readOffset = 0;
+    this.buffer = '';
+
+    const xhr = new XMLHttpRequest();
+    this.xhr = xhr;
+    xhr.open('GET', `${API_URL}/api/notifications/stream`);
+    xhr.setRequestHeader('Accept', 'text/event-stream');
+    xhr.setRequestHeader('Cache-Control', 'no-cache');
+    if (this.lastEventId) {
+      xhr.setRequestHeader('Last-Event-ID', this.lastEventId);
+    }
+
+    xhr.onreadystatechange = () => {
+      if (xhr !== this.xhr) return;
+      if (xhr.readyState >= XMLHttpRequest.HEADERS_RECEIVED && xhr.status !== 200) {
+        this.disconnected();
+        return;
+      }
+      if (xhr.readyState === XMLHttpRequest.LOADING || xhr.readyState === XMLHttpRequest.DONE) {
+        if (!this.connected) {
+          this.connected = true;
+          this.failures = 0;
+          console.log('🔔 Notification stream connected');
+        }
+        this.read(xhr.responseText || '');
+      }
+      if (xhr.readyState === XMLHttpRequest.DONE) {
+        this.disconnected();
+      }
+    };
+    xhr.onerror = () => {
+      if (xhr === this.xhr) this.disconnected();
+    };
+    xhr.send();
+  }
+
+  private read(text: string) {
+    // responseText grows as the stream is read; only the unseen part is parsed
+    this.buffer += text.slice(this.readOffset);
+    this.readOffset = text.length;
+
+    const events = this.buffer.split(/\r?\n\r?\n/);
+    this.buffer = events.pop() || '';
+    for (const event of events) {
+      this.dispatch(event);
+    }
+  }
+
+  private dispatch(event: string) {
+    let id: string | null = null;
+    let type = 'message';
+    const data: string[] = [];
+
+    for (const line of event.split(/\r?\n/)) {
+      if (!line || line.startsWith(':')) continue; // keepalive comment
+      const colon = line.indexOf(':');
+      const field = colon === -1 ? line : line.slice(0, colon);
+      const value = colon === -1 ? '' : line.slice(colon + 1).replace(/^ /, '');
+      if (field === 'id') id = value;
+      else if (field === 'event') type = value;
+      else if (field === 'data') data.push(value);
+      else if (field === 'retry' && /^\d+$/.test(value)) this.retryMs = parseInt(value, 10);
+    }
+
+    if (id) this.lastEventId = id;
+    if (type !== 'notification' || data.length === 0) return;
+
+    try {
+      const notification = JSON.parse(data.join('\n'));
+      this.listeners.forEach((listener) => listener(notification));
+    } catch (error) {
+      console.log('📡 Ignoring malformed notification event');
+    }
+  }
+
+  private disconnected() {
+    const xhr = this.xhr;
+    this.xhr = null;
+    this.connected = false;
+    if (xhr) {
+      xhr.onreadystatechange = null;
+      xhr.onerror = null;
+      xhr.abort();
+    }
+    if (this.listeners.size === 0) return;
+
+    // Polling covers the gap; reconnect with exponential backoff
+    this.failures += 1;
+    const delay = Math.min(this.retryMs * 2 ** (this.failures - 1), MAX_RETRY_MS);
+    this.reconnectTimer = setTimeout(() => this.connect(), delay);
+  }
+
+  private clearReconnect() {
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+  }
+
+  private close() {
+    this.clearReconnect();
+    const xhr = this.xhr;
+    this.xhr = null;
+    this.connected = false;
+    if (xhr) {
+      xhr.onreadystatechange = null;
+      xhr.onerror = null;
+      xhr.abort();
+    }
+  }
+}
+
+// Export singleton instance
+export const notificationStream = new NotificationStream();
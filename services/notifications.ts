@@ -1,4 +1,5 @@
 import * as Notifications from 'expo-notifications';
+import { notificationStream, StreamNotification } from './notificationStream';
 
 // Configure notification handler
 Notifications.setNotificationHandler({
@@ -112,11 +113,13 @@ export async function sendDailyDigestNotification(articleCount: number) {
   });
 }
 
-// Smart notification polling service
+// Smart notification service: pushed over SSE, polled only while the stream is down
 class NotificationPollingService {
   private pollInterval: any = null;
+  private unsubscribe: (() => void) | null = null;
   private isPolling = false;
   private lastNotificationTime = 0;
+  private cursor: string | null = null; // id of the last notification seen on the server
   private readonly POLL_INTERVAL = 30000; // 30 seconds
   private readonly MIN_NOTIFICATION_GAP = 60000; // 1 minute minimum between notifications
 
@@ -126,8 +129,14 @@ class NotificationPollingService {
     this.isPolling = true;
     console.log('🔔 Starting notification polling service...');
     
+    this.unsubscribe = notificationStream.subscribe((notification) => {
+      this.handlePushedNotification(notification);
+    });
+
     this.pollInterval = setInterval(() => {
-      this.checkForNotifications();
+      if (!notificationStream.isConnected()) {
+        this.checkForNotifications();
+      }
     }, this.POLL_INTERVAL);
 
     // Check immediately
@@ -139,6 +148,10 @@ class NotificationPollingService {
       clearInterval(this.pollInterval);
       this.pollInterval = null;
     }
+    if (this.unsubscribe) {
+      this.unsubscribe();
+      this.unsubscribe = null;
+    }
     this.isPolling = false;
     console.log('🔕 Stopped notification polling service');
   }
@@ -147,14 +160,19 @@ class NotificationPollingService {
     try {
       // Simple fetch to avoid import issues
       const API_URL = process.env.EXPO_PUBLIC_API_URL || 'https://cyberx.icu';
-      const response = await fetch(`${API_URL}/api/notifications`);
+      const query = this.cursor ? `?after=${encodeURIComponent(this.cursor)}` : '';
+      const response = await fetch(`${API_URL}/api/notifications${query}`);
       const data = await response.json();
 
-      if (data.status === 'success' && data.notifications.length > 0) {
+      if (data.status !== 'success') return;
+
+      // First poll only establishes the cursor; afterwards only newer notifications arrive
+      const isFirstPoll = this.cursor === null;
+      this.cursor = data.cursor ?? this.cursor;
+      notificationStream.resumeFrom(this.cursor);
+
+      if (!isFirstPoll && data.notifications.length > 0) {
         await this.processNotifications(data.notifications);
-        
-        // Clear notifications on server after processing
-        await fetch(`${API_URL}/api/notifications?clear=true`);
       }
     } catch (error) {
       // Silently handle errors - API might not be available
@@ -162,6 +180,14 @@ class NotificationPollingService {
     }
   }
 
+  private async handlePushedNotification(notification: StreamNotification) {
+    // Keep the cursor current so a fallback poll continues where the stream stopped
+    if (notification.id) {
+      this.cursor = notification.id;
+    }
+    await this.processNotifications([notification]);
+  }
+
   private async processNotifications(notifications: any[]) {
     const now = Date.now();
     
@@ -204,7 +230,7 @@ export async function initializeNotificationService() {
     if (status === 'granted') {
       console.log('✅ Notification permissions granted');
       
-      // Start polling for notifications
+      // Subscribe to pushed notifications (polling while the stream is unavailable)
       await notificationService.startPolling();
       
       return true;